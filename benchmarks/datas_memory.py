@@ -0,0 +1,93 @@
+"""Memory footprint of the item value types and cost of their dict serialization.
+
+Usage:
+    python -m benchmarks.datas_memory [count] [options per item]
+
+Defaults to 10000 synthetic items with 5 options each.
+"""
+
+import sys
+import time
+import tracemalloc
+
+from custom_components.price_tracker.datas.category import ItemCategoryData
+from custom_components.price_tracker.datas.delivery import (
+    DeliveryData,
+    DeliveryPayType,
+    DeliveryType,
+)
+from custom_components.price_tracker.datas.inventory import InventoryStatus
+from custom_components.price_tracker.datas.item import ItemData, ItemOptionData
+from custom_components.price_tracker.datas.price import ItemPriceData
+from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
+
+
+def synthetic_item(i: int, options: int) -> ItemData:
+    return ItemData(
+        id="item-{}".format(i),
+        name="Synthetic product {}".format(i),
+        brand="Brand {}".format(i % 50),
+        description="Description of product {}".format(i),
+        category=ItemCategoryData("Food>Fruits>Apples"),
+        price=ItemPriceData(
+            price=9900 + i, original_price=12000 + i, payback_price=100
+        ),
+        delivery=DeliveryData(
+            price=3000,
+            threshold_price=40000,
+            pay_type=DeliveryPayType.FREE_OR_PAID,
+            delivery_type=DeliveryType.EXPRESS_NEXT_DAWN,
+        ),
+        unit=ItemUnitData(price=99, unit_type=ItemUnitType.G, unit=100),
+        url="https://example.com/products/{}".format(i),
+        image="https://example.com/images/{}.jpg".format(i),
+        inventory=InventoryStatus.IN_STOCK,
+        options=[
+            ItemOptionData(
+                id="{}-{}".format(i, x),
+                name="Option {}".format(x),
+                price=9900 + x * 100,
+                inventory=10,
+            )
+            for x in range(options)
+        ],
+    )
+
+
+def measure(items: list[ItemData]) -> float:
+    started_at = time.perf_counter()
+    for item in items:
+        item.dict
+
+    return time.perf_counter() - started_at
+
+
+def main(args: list[str]):
+    count = int(args[0]) if len(args) > 0 else 10_000
+    options = int(args[1]) if len(args) > 1 else 5
+
+    tracemalloc.start()
+    items = [synthetic_item(i, options) for i in range(count)]
+    items_size, _ = tracemalloc.get_traced_memory()
+    for item in items:
+        item.dict
+    total_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    items = [synthetic_item(i, options) for i in range(count)]
+    first = measure(items)
+    cached = measure(items)
+    for item in items:
+        item.price.price += 1
+    changed = measure(items)
+
+    print("{} items, {} options each".format(count, options))
+    print("  objects        {:>8.0f} B/item".format(items_size / count))
+    print("  with dicts     {:>8.0f} B/item".format(total_size / count))
+    print("  dict (first)   {:>8.2f} us/item".format(first / count * 1e6))
+    print("  dict (cached)  {:>8.2f} us/item".format(cached / count * 1e6))
+    print("  dict (changed) {:>8.2f} us/item".format(changed / count * 1e6))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
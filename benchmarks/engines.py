@@ -0,0 +1,169 @@
+"""Per-engine parse latency, allocations and load() throughput on recorded responses.
+
+Every engine runs against its corpus directory through the replay request engine, so
+nothing touches the network and the numbers only move when engine or parser code does.
+"parse" is the parser alone on the recorded body, "load" is ``load()`` end to end
+(SafeRequest, parser and ItemData) on a fresh engine, "unchanged" a repeated load that
+the engine answers from its last item, and "peak" the traced memory high-water mark of
+one fresh load.
+
+Usage:
+    python -m benchmarks.engines [rounds] [corpus]
+
+Defaults to 200 rounds over tests/fixtures/engines. A corpus captured from the live
+stores with SafeRequestEngineRecorder has the same layout and can be passed instead.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+from custom_components.price_tracker.services.coupang.parser import CoupangParser
+from custom_components.price_tracker.services.daiso_kr.parser import DaisoKrParser
+from custom_components.price_tracker.services.factory import create_service_engine
+from custom_components.price_tracker.services.homeplus.parser import HomeplusParser
+from custom_components.price_tracker.services.idus.parser import IdusParser
+from custom_components.price_tracker.services.kurly.parser import KurlyParser
+from custom_components.price_tracker.services.lotte_kr.parser import LotteOnParser
+from custom_components.price_tracker.services.ncnc.parser import NcncParser
+from custom_components.price_tracker.services.oasis.parser import OasisParser
+from custom_components.price_tracker.services.oliveyoung.parser import (
+    OliveyoungParser,
+)
+from custom_components.price_tracker.services.rankingdak.parser import (
+    RankingdakParser,
+)
+from custom_components.price_tracker.services.smartstore.parser import (
+    SmartstoreParser,
+)
+from custom_components.price_tracker.services.ssg.parser import SsgParser
+from custom_components.price_tracker.utilities.rate_limit import rate_limiters
+from custom_components.price_tracker.utilities.replay import (
+    SafeRequestEngineReplay,
+    load_recordings,
+)
+from custom_components.price_tracker.utilities.safe_request import (
+    set_default_chains,
+)
+
+_CORPUS = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "engines")
+_UNLIMITED = 1_000_000
+
+# Parser of each engine, fed with the recorded bodies it reads (by manifest body name)
+_PARSERS = {
+    "coupang": lambda read: CoupangParser(text=read("product.json")),
+    "daiso_kr": lambda read: DaisoKrParser(data=read("product.json")),
+    "homeplus": lambda read: HomeplusParser(html=read("item.html")),
+    "idus": lambda read: IdusParser(text=read("product.json")),
+    "kurly": lambda read: KurlyParser(text=read("product.json")),
+    "lotte_kr": lambda read: LotteOnParser(
+        data=read("product.json"), discount=read("discount.json")
+    ),
+    "ncnc": lambda read: NcncParser(text=read("item.json")),
+    "oasis": lambda read: OasisParser(text=read("detail.html")),
+    "oliveyoung": lambda read: OliveyoungParser(text=read("goods.html")),
+    "rankingdak": lambda read: RankingdakParser(html=read("view.html")),
+    "smartstore": lambda read: SmartstoreParser(data=read("product.html")),
+    "ssg": lambda read: SsgParser(read("item.json")),
+}
+
+
+def reader(directory: str):
+    bodies = {}
+
+    def _read(name: str) -> str:
+        if name not in bodies:
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                bodies[name] = f.read()
+
+        return bodies[name]
+
+    return _read
+
+
+def create_engine(code: str, item_url: str):
+    return create_service_engine(code)(
+        item_url=item_url,
+        proxies=None,
+        device=None,
+        selenium=None,
+        selenium_proxy=None,
+    )
+
+
+async def measure(code: str, directory: str, rounds: int) -> tuple:
+    manifest, recordings = load_recordings(directory)
+    set_default_chains(lambda: [SafeRequestEngineReplay(recordings)])
+    rate_limiters().configure(code, _UNLIMITED, _UNLIMITED)
+    size = sum(len(x.body) for x in recordings)
+
+    read = reader(directory)
+    parse = _PARSERS[code]
+    parse(read).extract()
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        parse(read).extract()
+    parse_time = (time.perf_counter() - started_at) / rounds
+
+    # Fresh engines, a reused one would skip parsing the byte-identical body
+    engines = [create_engine(code, manifest["item_url"]) for _ in range(rounds + 1)]
+    await engines[0].load()
+    started_at = time.perf_counter()
+    for engine in engines[1:]:
+        await engine.load()
+    load_time = (time.perf_counter() - started_at) / rounds
+
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        await engines[0].load()
+    unchanged_time = (time.perf_counter() - started_at) / rounds
+
+    tracemalloc.start()
+    await create_engine(code, manifest["item_url"]).load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size, parse_time, load_time, unchanged_time, peak
+
+
+async def run(rounds: int, corpus: str):
+    print(
+        "{:<12} {:>8} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+            "engine", "KiB", "parse", "load", "items/s", "unchanged", "peak KiB"
+        )
+    )
+
+    for code in sorted(os.listdir(corpus)):
+        directory = os.path.join(corpus, code)
+        if code not in _PARSERS or not os.path.isdir(directory):
+            continue
+
+        size, parse_time, load_time, unchanged_time, peak = await measure(
+            code, directory, rounds
+        )
+        print(
+            "{:<12} {:>8.1f} {:>8.3f}ms {:>8.3f}ms {:>10.0f} {:>8.3f}ms {:>10.1f}".format(
+                code,
+                size / 1024,
+                parse_time * 1000,
+                load_time * 1000,
+                1 / load_time,
+                unchanged_time * 1000,
+                peak / 1024,
+            )
+        )
+
+    set_default_chains(None)
+
+
+def main(args: list[str]):
+    rounds = int(args[0]) if len(args) > 0 else 200
+    corpus = args[1] if len(args) > 1 else _CORPUS
+
+    asyncio.run(run(rounds, corpus))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
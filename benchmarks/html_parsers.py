@@ -0,0 +1,200 @@
+"""Per-store HTML parse latency for every installed BeautifulSoup backend.
+
+The "full tree" column builds the whole page with html.parser and nothing else, the
+cost every parser paid before parsing was restricted to the subtrees it reads.
+
+Usage:
+    python -m benchmarks.html_parsers [store=page.html ...]
+
+Stores are oasis, rankingdak, homeplus, oliveyoung and smartstore. Without arguments
+synthetic product pages padded to a realistic size are used.
+"""
+
+import json
+import sys
+import time
+
+from bs4.builder import builder_registry
+
+from custom_components.price_tracker.services.homeplus.parser import HomeplusParser
+from custom_components.price_tracker.services.oasis.parser import OasisParser
+from custom_components.price_tracker.services.oliveyoung.parser import (
+    OliveyoungParser,
+)
+from custom_components.price_tracker.services.rankingdak.parser import (
+    RankingdakParser,
+)
+from custom_components.price_tracker.services.smartstore.parser import (
+    PRELOADED_STATE_MARKER,
+    SmartstoreParser,
+)
+from custom_components.price_tracker.utilities.parser import (
+    html_backend,
+    parse_html,
+    set_html_backend,
+)
+
+_ROUNDS = 10
+_BACKENDS = ("html.parser", "lxml", "html5lib")
+_PROPERTIES = (
+    "name",
+    "brand",
+    "description",
+    "category",
+    "price",
+    "image",
+    "delivery",
+    "unit",
+    "options",
+    "inventory",
+    "inventory_status",
+)
+
+
+def _filler(size: int = 300_000) -> str:
+    block = '<div class="row"><span class="a">cell</span><a href="/x">link</a></div>'
+
+    return "<div id='filler'>{}</div>".format(block * (size // len(block)))
+
+
+def oasis_page() -> str:
+    return """<html><body>{}
+<div class="o_currentPath"><a>홈</a><a>Fruits</a><a>Apples</a></div>
+<div class="oDetail_info_group_title"><h1>Apple</h1></div>
+<div class="oDetail_info_gr_shopName"><strong>Oasis</strong></div>
+<div class="oDetail_info_group_price"><div class="discountPrice">9,900원</div>
+<div class="cost">12,000원</div></div>
+<div class="oDetail_info_group2"><em>새벽배송</em><dl><dd>100g당 1,000원</dd>
+<dd class="deliverySave">3,000원 (40,000원 이상 무료)</dd><dd class="notice">-</dd></dl></div>
+<ul><li class="swiper-slide"><img src="https://example.com/a.jpg"/></li></ul>
+<a class="buyItNowFromDetail">구매하기</a>
+<div class="detailView_body">Fresh apples</div>
+</body></html>""".format(_filler())
+
+
+def rankingdak_page() -> str:
+    return """<html><body>{}
+<form name="productCounselForm"><input name="productnm" value="Chicken breast"/></form>
+<div class="price-info"><span class="orderTotalPoint">100</span></div>
+<div class="goods-price"><p class="origin">12,000</p><p class="price">9,900</p>
+<p class="price-detail">100g당 가격 : 1,000원</p></div>
+<div class="table-item"><em>브랜드관</em><a>Rankingdak</a></div>
+<div class="table-item"><em>배송방법</em><span class="title-list">일반배송, 특급배송</span></div>
+<div class="goods-img-area"><img src="https://example.com/a.jpg"/></div>
+<div class="ingredient_wrap">Chicken</div>
+<ul class="selected-options-ul1"><li data-id="1" data-name="A" data-amt="9900"></li></ul>
+</body></html>""".format(_filler())
+
+
+def homeplus_page() -> str:
+    item = {
+        "data": {
+            "item": {
+                "basic": {
+                    "storeKind": "HYPER",
+                    "itemNm": "Milk",
+                    "lcateNm": "a",
+                    "mcateNm": "b",
+                    "scateNm": "c",
+                    "dcateNm": "d",
+                },
+                "sale": {
+                    "dcPrice": 0,
+                    "salePrice": 2500,
+                    "purchaseMinQty": 1,
+                    "itemSoldOutYn": "N",
+                    "stockQty": 10,
+                },
+                "opt": None,
+                "ship": {"shipKind": "COND", "shipFee": 3000, "freeCondition": 40000},
+                "etc": {"unitPrice": 250, "unitMeasure": "ml", "unitQty": 100},
+                "img": {"mainList": [{"url": "/a.jpg"}]},
+            }
+        }
+    }
+
+    return """<html><body>{}<script id="/item/getItemDetail.json" type="application/json">{}</script>
+</body></html>""".format(_filler(), json.dumps(item))
+
+
+def oliveyoung_page() -> str:
+    return (
+        """<html><body>{}<textarea id="goodsData">{}</textarea></body></html>""".format(
+            _filler(), json.dumps({"brandName": "Oliveyoung", "goodsName": "Lotion"})
+        )
+    )
+
+
+def smartstore_page() -> str:
+    state = {"product": {"A": {"id": "1", "name": "Product"}}}
+
+    return "<html><body>{}<script>{}{}</script></body></html>".format(
+        _filler(), PRELOADED_STATE_MARKER, json.dumps(state)
+    )
+
+
+_STORES = {
+    "oasis": (OasisParser, oasis_page),
+    "rankingdak": (RankingdakParser, rankingdak_page),
+    "homeplus": (HomeplusParser, homeplus_page),
+    "oliveyoung": (OliveyoungParser, oliveyoung_page),
+    "smartstore": (SmartstoreParser.parse_state_with_soup, smartstore_page),
+}
+
+
+def run(parser, page: str):
+    result = parser(page)
+
+    for name in _PROPERTIES:
+        try:
+            getattr(result, name, None)
+        except Exception:
+            # Synthetic pages do not carry every field of every store
+            pass
+
+
+def main(args: list[str]):
+    recorded = dict(arg.split("=", 1) for arg in args)
+    backends = [x for x in _BACKENDS if builder_registry.lookup(x) is not None]
+    default = html_backend()
+
+    print("{:<12} {:>9}  full tree  {}".format("store", "KiB", "  ".join(backends)))
+
+    for store, (parser, page_builder) in _STORES.items():
+        if len(recorded) > 0 and store not in recorded:
+            continue
+
+        page = (
+            open(recorded[store], encoding="utf-8").read()
+            if store in recorded
+            else page_builder()
+        )
+        started_at = time.perf_counter()
+        for _ in range(_ROUNDS):
+            parse_html(page, backend="html.parser")
+        timings = [(time.perf_counter() - started_at) / _ROUNDS * 1000]
+
+        for backend in backends:
+            set_html_backend(backend)
+            started_at = time.perf_counter()
+            for _ in range(_ROUNDS):
+                run(parser, page)
+            timings.append((time.perf_counter() - started_at) / _ROUNDS * 1000)
+
+        print(
+            "{:<12} {:>9.1f}  {}".format(
+                store,
+                len(page) / 1024,
+                "  ".join(
+                    "{:>{}.1f}ms".format(t, len(b) - 2)
+                    for t, b in zip(timings, ["full tree"] + backends)
+                ),
+            )
+        )
+
+    set_html_backend(None)
+    print("default backend: {}".format(default))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,257 @@
+"""Load test of the whole fetch pipeline against the local stand-in stores.
+
+Starts benchmarks.mock_commerce in a child process, then adds N engines x M distinct
+items as sensors of one coordinator of a throwaway Home Assistant instance. Every
+request of every engine goes through SafeRequest (rate limits, retries, circuit
+breakers, session pool) to the stand-in, and every result through the sensor into the
+state machine, exactly as in a config entry.
+
+Reported are the latency of single HTTP exchanges, the latency until each item's
+state was written (queueing, retries and backoff included), items per second over the
+whole round and the peak RSS of the client process.
+
+Usage:
+    python -m benchmarks.load_test [--engines coupang,kurly,...] [--items 20]
+        [--concurrency 4] [--unlimited] [--latency ms] [--jitter ms]
+        [--error-rate 0..1] [--throttle-rate 0..1] [--not-found-rate 0..1]
+
+``--unlimited`` lifts the per-store rate limits to measure the pipeline itself.
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry, entity_registry, restore_state
+from homeassistant.helpers.entity_component import EntityComponent
+
+from benchmarks.mock_commerce import (
+    CORPUS,
+    MockCommerceFaults,
+    SafeRequestEngineMockCommerce,
+    item_url,
+    load_routes,
+    serve,
+)
+from custom_components.price_tracker.components.coordinator import (
+    PriceTrackerCoordinator,
+)
+from custom_components.price_tracker.components.history import PriceHistory
+from custom_components.price_tracker.components.sensor import PriceTrackerSensor
+from custom_components.price_tracker.services.factory import create_service_engine
+from custom_components.price_tracker.utilities.rate_limit import rate_limiters
+from custom_components.price_tracker.utilities.replay import load_recordings
+from custom_components.price_tracker.utilities.safe_request import (
+    set_default_chains,
+)
+from custom_components.price_tracker.utilities.session_pool import (
+    async_close_session_pool,
+)
+
+_LOGGER = logging.getLogger(__name__)
+_UNLIMITED = 1_000_000
+
+
+def _serve(port, faults: MockCommerceFaults):
+    asyncio.run(
+        serve("127.0.0.1", 0, load_routes(), faults, ready=lambda x: port.send(x))
+    )
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if len(values) == 0:
+        return None
+
+    ordered = sorted(values)
+
+    return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+
+def _ms(value: float | None) -> str:
+    return (
+        "{:>9.1f}ms".format(value * 1000) if value is not None else "{:>11}".format("-")
+    )
+
+
+async def run(args, base_url: str) -> dict:
+    samples = []
+    set_default_chains(lambda: [SafeRequestEngineMockCommerce(base_url, samples)])
+
+    config_dir = tempfile.mkdtemp(prefix="price_tracker_load_")
+    hass = HomeAssistant(config_dir)
+    await restore_state.async_load(hass)
+    await device_registry.async_load(hass)
+    await entity_registry.async_load(hass)
+
+    coordinator = PriceTrackerCoordinator(
+        hass,
+        "load_test",
+        concurrency=args.concurrency,
+        warmup_spread=0,
+        history=PriceHistory(os.path.join(config_dir, "history.db")),
+    )
+    sensors = []
+    for code in args.engines:
+        manifest, _ = load_recordings(os.path.join(CORPUS, code))
+        if args.unlimited:
+            rate_limiters().configure(code, _UNLIMITED, _UNLIMITED)
+
+        for i in range(args.items):
+            engine = create_service_engine(code)(
+                item_url=item_url(manifest, i),
+                proxies=None,
+                device=None,
+                selenium=None,
+                selenium_proxy=None,
+            )
+            sensors.append(PriceTrackerSensor(engine=engine, coordinator=coordinator))
+
+    written: dict[str, tuple[float, str]] = {}
+    done = asyncio.Event()
+    entity_ids = set()
+
+    def _state_changed(event):
+        entity_id = event.data["entity_id"]
+        if entity_id not in entity_ids or entity_id in written:
+            return
+
+        attributes = event.data["new_state"].attributes
+        written[entity_id] = (
+            time.perf_counter() - started_at,
+            "deleted"
+            if attributes.get("status") == "DELETED"
+            else "fetched"
+            if attributes.get("engine_status") == "FETCHED"
+            else "failed",
+        )
+        if len(written) == len(entity_ids):
+            done.set()
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    component = EntityComponent(_LOGGER, "sensor", hass)
+    started_at = time.perf_counter()
+    await component.async_add_entities(sensors)
+    # The first write is the entity being added, the next one is its fetched item
+    entity_ids.update(sensor.entity_id for sensor in sensors)
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+
+    try:
+        await asyncio.wait_for(done.wait(), timeout=args.timeout)
+    except asyncio.TimeoutError:
+        _LOGGER.warning("%s items never got a state", len(entity_ids) - len(written))
+    elapsed = time.perf_counter() - started_at
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    await coordinator.async_shutdown()
+    await async_close_session_pool()
+    await hass.async_stop(force=True)
+    set_default_chains(None)
+
+    return {
+        "items": len(sensors),
+        "written": written,
+        "samples": samples,
+        "elapsed": elapsed,
+        "rss": (rss_before, rss_after),
+    }
+
+
+def report(result: dict):
+    latencies = [x[0] for x in result["written"].values()]
+    requests = [x[0] for x in result["samples"]]
+    statuses = {}
+    for _, status in result["samples"]:
+        statuses[status] = statuses.get(status, 0) + 1
+
+    print("{:<22} {:>11} {:>11} {:>11}".format("", "p50", "p95", "p99"))
+    for name, values in (("request latency", requests), ("item latency", latencies)):
+        print(
+            "{:<22} {} {} {}".format(
+                name,
+                _ms(percentile(values, 50)),
+                _ms(percentile(values, 95)),
+                _ms(percentile(values, 99)),
+            )
+        )
+
+    outcomes = [x[1] for x in result["written"].values()]
+    print(
+        "items {} (fetched {}, deleted {}, failed {}, missing {}) in {:.2f}s, "
+        "{:.1f} items/s".format(
+            result["items"],
+            outcomes.count("fetched"),
+            outcomes.count("deleted"),
+            outcomes.count("failed"),
+            result["items"] - len(outcomes),
+            result["elapsed"],
+            len(result["written"]) / result["elapsed"],
+        )
+    )
+    print(
+        "requests {}: {}".format(
+            len(requests),
+            ", ".join(
+                "{} x{}".format(status if status is not None else "error", count)
+                for status, count in sorted(
+                    statuses.items(), key=lambda x: (x[0] is None, x[0] or 0)
+                )
+            ),
+        )
+    )
+    print(
+        "peak RSS {:.1f} MiB (+{:.1f} MiB during the round)".format(
+            result["rss"][1] / 1024, (result["rss"][1] - result["rss"][0]) / 1024
+        )
+    )
+
+
+def main():
+    engines = sorted(
+        x for x in os.listdir(CORPUS) if os.path.isdir(os.path.join(CORPUS, x))
+    )
+
+    parser = argparse.ArgumentParser(description="Load test of the fetch pipeline")
+    parser.add_argument("--engines", default=",".join(engines))
+    parser.add_argument("--items", type=int, default=20, help="per engine")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--unlimited", action="store_true")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds")
+    parser.add_argument("--latency", type=float, default=50, help="ms")
+    parser.add_argument("--jitter", type=float, default=20, help="ms")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--not-found-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    args.engines = [x for x in args.engines.split(",") if x != ""]
+
+    faults = MockCommerceFaults(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        not_found_rate=args.not_found_rate,
+        seed=args.seed,
+    )
+
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.Process(target=_serve, args=(sender, faults), daemon=True)
+    server.start()
+
+    try:
+        port = receiver.recv()
+        report(asyncio.run(run(args, "http://127.0.0.1:{}".format(port))))
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
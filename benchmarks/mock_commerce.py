@@ -0,0 +1,265 @@
+"""Local stand-in for the stores, serving the recorded corpus over real HTTP.
+
+Requests are expected as ``http://host:port/<store host>/<path>``, which is what
+SafeRequestEngineMockCommerce rewrites every store URL to, and are answered from the
+recordings of every engine in the corpus. The product id named by ``id`` in a manifest
+matches any id, so any number of distinct items of one engine can be served. Latency
+and failures (503, 429 with Retry-After, 404) are injected at the configured rates.
+
+Usage:
+    python -m benchmarks.mock_commerce [--port 8480] [--latency ms] [--jitter ms]
+        [--error-rate 0..1] [--throttle-rate 0..1] [--not-found-rate 0..1]
+        [--corpus directory]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import time
+from typing import Callable, Optional
+
+from aiohttp import web
+from curl_cffi import CurlHttpVersion, requests
+
+from custom_components.price_tracker.utilities.replay import (
+    SafeRequestRecording,
+    load_recordings,
+)
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequestEngine,
+    SafeRequestEngineCurlCffi,
+    SafeRequestMethod,
+    SafeRequestResponseData,
+)
+
+CORPUS = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "engines")
+_ID_PATTERN = r"[\w\-]+"
+
+
+class MockCommerceFaults:
+    """Latency and failure rates of the stand-in server, rates are 0..1 per request."""
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        jitter: float = 0.02,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        not_found_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency  # seconds
+        self.jitter = jitter  # seconds
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.not_found_rate = not_found_rate
+        self.retry_after = retry_after  # seconds
+        self._random = random.Random(seed)
+
+    def delay(self) -> float:
+        return max(self.latency + self._random.uniform(-self.jitter, self.jitter), 0)
+
+    def status(self) -> int | None:
+        """Status of an injected failure, None to answer from the recordings."""
+        draw = self._random.random()
+
+        for status, rate in (
+            (404, self.not_found_rate),
+            (429, self.throttle_rate),
+            (503, self.error_rate),
+        ):
+            if draw < rate:
+                return status
+            draw -= rate
+
+        return None
+
+
+def load_routes(corpus: str = CORPUS) -> list[SafeRequestRecording]:
+    """Recordings of every engine of ``corpus``, with the product id matching any id."""
+    routes = []
+
+    for code in sorted(os.listdir(corpus)):
+        directory = os.path.join(corpus, code)
+        if not os.path.isdir(directory):
+            continue
+
+        manifest, recordings = load_recordings(directory)
+        product_id = re.escape(manifest.get("id", ""))
+
+        for recording in recordings:
+            routes.append(
+                SafeRequestRecording(
+                    method=recording.method,
+                    url=recording.url.replace(product_id, _ID_PATTERN)
+                    if product_id != ""
+                    else recording.url,
+                    status_code=recording.status_code,
+                    body=recording.body,
+                    headers=recording.headers,
+                )
+            )
+
+    return routes
+
+
+def item_url(manifest: dict, index: int) -> str:
+    """Item URL of the ``index``-th distinct item of a corpus engine."""
+    return manifest["item_url"].replace(
+        manifest["id"], "{}{:04d}".format(manifest["id"], index)
+    )
+
+
+def create_app(
+    routes: list[SafeRequestRecording], faults: MockCommerceFaults
+) -> web.Application:
+    async def _handle(request: web.Request) -> web.Response:
+        await asyncio.sleep(faults.delay())
+
+        status = faults.status()
+        if status is not None:
+            return web.Response(
+                status=status,
+                headers={"Retry-After": str(faults.retry_after)}
+                if status == 429
+                else None,
+            )
+
+        url = "https://" + request.raw_path[1:]
+        method = SafeRequestMethod[request.method]
+        route = next((x for x in routes if x.matches(method, url)), None)
+
+        if route is None:
+            return web.Response(status=501, text="No recording for " + url)
+
+        headers = dict(route.headers)
+        headers.setdefault(
+            "Content-Type",
+            "text/html; charset=utf-8"
+            if route.body.lstrip().startswith("<")
+            else "application/json; charset=utf-8",
+        )
+
+        return web.Response(
+            status=route.status_code, body=route.body.encode(), headers=headers
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/{path:.*}", _handle)
+
+    return app
+
+
+async def serve(
+    host: str,
+    port: int,
+    routes: list[SafeRequestRecording],
+    faults: MockCommerceFaults,
+    ready: Optional[Callable[[int], None]] = None,
+):
+    """Serve until cancelled, ``ready`` gets the bound port (useful with port 0)."""
+    runner = web.AppRunner(create_app(routes, faults), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+
+    if ready is not None:
+        ready(runner.addresses[0][1])
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+class SafeRequestEngineMockCommerce(SafeRequestEngine):
+    """Sends every request to the stand-in server instead of the store.
+
+    Requests go over plain HTTP/1.1 through curl-cffi and the shared session pool, so
+    everything but TLS and the store itself is exercised. Each exchange is appended to
+    ``samples`` as (seconds, status code), failures with the status of their error.
+    """
+
+    def __init__(
+        self, base_url: str, samples: Optional[list[tuple[float, int | None]]] = None
+    ):
+        self._base_url = base_url.rstrip("/")
+        self._engine = SafeRequestEngineCurlCffi(version=CurlHttpVersion.V1_1)
+        self._samples = samples
+
+    async def request(
+        self,
+        method: SafeRequestMethod,
+        url: str,
+        data: dict,
+        proxy: str,
+        timeout: int,
+        session: requests.AsyncSession,
+        headers: Optional[dict] = None,
+        cookies: Optional[dict] = None,
+        read_until: Optional[Callable[[str], bool]] = None,
+    ) -> SafeRequestResponseData:
+        started_at = time.perf_counter()
+        status = None
+
+        try:
+            response = await self._engine.request(
+                method=method,
+                url="{}/{}".format(self._base_url, url.split("://", 1)[-1]),
+                data=data,
+                proxy=None,
+                timeout=timeout,
+                session=session,
+                headers=headers,
+                cookies=cookies,
+                read_until=read_until,
+            )
+            status = response.status_code
+
+            return response
+        except Exception as e:
+            status = getattr(e, "status_code", None)
+            raise
+        finally:
+            if self._samples is not None:
+                self._samples.append((time.perf_counter() - started_at, status))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the stores")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8480)
+    parser.add_argument("--latency", type=float, default=50, help="ms")
+    parser.add_argument("--jitter", type=float, default=20, help="ms")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--not-found-rate", type=float, default=0.0)
+    parser.add_argument("--corpus", default=CORPUS)
+    args = parser.parse_args()
+
+    faults = MockCommerceFaults(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        not_found_rate=args.not_found_rate,
+    )
+
+    asyncio.run(
+        serve(
+            args.host,
+            args.port,
+            load_routes(args.corpus),
+            faults,
+            ready=lambda port: print(
+                "Serving {} on http://{}:{}".format(args.corpus, args.host, port)
+            ),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compare Smartstore state extraction: BeautifulSoup DOM scan vs raw text scanner.
+
+Usage:
+    python -m benchmarks.smartstore_preloaded_state [page.html ...]
+
+Without arguments a synthetic product page of realistic size is used.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+from custom_components.price_tracker.services.smartstore.parser import (
+    PRELOADED_STATE_MARKER,
+    SmartstoreParser,
+)
+from custom_components.price_tracker.utilities.parser import ScriptJsonExtractor
+
+_ROUNDS = 20
+
+
+def synthetic_page() -> str:
+    state = {
+        "product": {
+            "A": {
+                "id": "1",
+                "name": "Synthetic product",
+                "detailContents": {"detailContentText": "description " * 2000},
+                "optionCombinations": [
+                    {"id": i, "optionName1": "option {}".format(i), "price": i * 100}
+                    for i in range(500)
+                ],
+            }
+        }
+    }
+    scripts = "".join(
+        "<script>var chunk{} = {};</script>".format(i, json.dumps(["x"] * 200))
+        for i in range(50)
+    )
+    body = "".join(
+        '<div class="item"><span>{}</span><a href="/p/{}">link</a></div>'.format(i, i)
+        for i in range(5000)
+    )
+
+    return "<html><head>{}</head><body><script>{}{}</script>{}</body></html>".format(
+        scripts, PRELOADED_STATE_MARKER, json.dumps(state), body
+    )
+
+
+def measure(name: str, fn, page: str):
+    started_at = time.perf_counter()
+    for _ in range(_ROUNDS):
+        fn(page)
+    elapsed = (time.perf_counter() - started_at) / _ROUNDS
+
+    tracemalloc.start()
+    fn(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        "  {:<10} {:>9.2f} ms {:>10.1f} KiB peak".format(
+            name, elapsed * 1000, peak / 1024
+        )
+    )
+
+
+def main(paths: list[str]):
+    pages = (
+        [(path, open(path, encoding="utf-8").read()) for path in paths]
+        if len(paths) > 0
+        else [("synthetic", synthetic_page())]
+    )
+
+    for name, page in pages:
+        print("{} ({:.1f} KiB)".format(name, len(page) / 1024))
+        measure("soup", SmartstoreParser.parse_state_with_soup, page)
+        measure(
+            "scanner",
+            lambda x: ScriptJsonExtractor.extract(x, PRELOADED_STATE_MARKER),
+            page,
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -10,19 +10,34 @@ from homeassistant.helpers import (
     entity_registry as er,
 )
 
+from custom_components.price_tracker.components.history import (
+    history_path,
+    remove_history,
+)
 from custom_components.price_tracker.components.id import IdGenerator
 from custom_components.price_tracker.consts.confs import (
     CONF_ITEM_DEVICE_ID,
     CONF_ITEM_UNIQUE_ID,
+    CONF_TELEMETRY,
+)
+from custom_components.price_tracker.consts.defaults import (
+    DATA_ITEM_REGISTRY,
+    DOMAIN,
+    PLATFORMS,
+    TELEMETRY,
 )
-from custom_components.price_tracker.consts.defaults import DOMAIN, PLATFORMS
 from custom_components.price_tracker.services.factory import (
     create_service_item_url_parser,
     create_service_item_target_parser,
     create_service_device_parser_and_parse,
     has_service_item_target_parser,
 )
+from custom_components.price_tracker.utilities.cookie_jar import cookie_jars
 from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.session_pool import (
+    async_close_session_pool,
+)
+from custom_components.price_tracker.utilities.telemetry import telemetry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,10 +46,22 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the price tracker component."""
     _LOGGER.debug("Setting up price tracker component {}".format(config))
     hass.data.setdefault(DOMAIN, {})
+    cookie_jars().setup(hass)
 
     return True
 
 
+def _configure_telemetry(hass: HomeAssistant):
+    """Telemetry is process-wide, it stays on only while a loaded entry asks for it."""
+    telemetry().configure(
+        enabled=any(
+            Lu.get_or_default(data, CONF_TELEMETRY, TELEMETRY)
+            for key, data in hass.data[DOMAIN].items()
+            if key != DATA_ITEM_REGISTRY
+        )
+    )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Setting up entry and data {} > {}".format(entry, entry.data))
     _LOGGER.debug("Setting up entry and options {} > {}".format(entry, entry.options))
@@ -111,6 +138,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     data = dict(data)
     listeners = entry.add_update_listener(options_update_listener)
     hass.data[DOMAIN][entry.entry_id] = data
+    _configure_telemetry(hass)
 
     entry.async_on_unload(listeners)
 
@@ -142,9 +170,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        _configure_telemetry(hass)
+
+        # Shared HTTP sessions outlive a single entry; close them with the last one
+        if all(key == DATA_ITEM_REGISTRY for key in hass.data[DOMAIN]):
+            await async_close_session_pool()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    await hass.async_add_executor_job(
+        remove_history, history_path(hass, entry.entry_id)
+    )
+
+
 async def options_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -0,0 +1,204 @@
+import math
+import statistics
+import time
+import warnings
+
+from custom_components.price_tracker.components.history import (
+    PriceHistory,
+    PriceHistoryTier,
+)
+
+try:
+    import numpy
+except ImportError:  # optional, the pure Python path gives the same results
+    numpy = None
+
+_WINDOWS = (7, 30, 90)  # days
+_LOWEST_WINDOWS = (30, 90)  # days
+_PERCENTILES = (10, 50, 90)
+_PERCENTILE_WINDOW = 90  # days
+_ZSCORE_WINDOW = 30  # days
+_DROP_ZSCORE = -2.0
+
+ANALYTICS_ATTRIBUTES = (
+    *("price_min_{}d".format(days) for days in _WINDOWS),
+    *("price_max_{}d".format(days) for days in _WINDOWS),
+    *("price_p{}_{}d".format(q, _PERCENTILE_WINDOW) for q in _PERCENTILES),
+    *("lowest_{}d".format(days) for days in _LOWEST_WINDOWS),
+    "price_zscore_{}d".format(_ZSCORE_WINDOW),
+    "price_drop",
+)
+SUMMARY_ATTRIBUTES = ("min_price", "max_price", "avg_price")
+
+
+def price_analytics(
+    history: PriceHistory, prices: dict[str, float], now: float | None = None
+) -> dict[str, dict]:
+    """Price statistics of many items at once, keyed like ``prices``.
+
+    ``prices`` maps history keys to their current price. Per-day rollups of the last
+    90 days are read in one query and reduced as an item x day matrix when NumPy is
+    installed. Blocks on the history database, run it in the executor.
+    """
+    if len(prices) == 0:
+        return {}
+
+    now = now if now is not None else time.time()
+    days = max(_WINDOWS + _LOWEST_WINDOWS + (_PERCENTILE_WINDOW, _ZSCORE_WINDOW))
+    start = PriceHistoryTier.DAILY.bucket(int(now)) - (days - 1) * 86400
+    keys = list(prices.keys())
+    rows = history.daily_series(keys, start)
+
+    if numpy is not None:
+        return _analytics_numpy(keys, prices, rows, start, days)
+
+    return _analytics_python(keys, prices, rows, start, days)
+
+
+def price_summaries(history: PriceHistory, keys: list[str]) -> dict[str, dict]:
+    """All-time min, max and average price of many items, keyed like ``keys``.
+
+    Items without any sample get None for each of them. Blocks on the history
+    database, run it in the executor.
+    """
+    summaries = {}
+    for key in keys:
+        summary = history.summary(key)
+        summaries[key] = (
+            summary.dict
+            if summary is not None
+            else {name: None for name in SUMMARY_ATTRIBUTES}
+        )
+
+    return summaries
+
+
+def _attributes(columns: dict[str, list], keys: list[str]) -> dict[str, dict]:
+    names = list(columns.keys())
+
+    return {
+        key: dict(zip(names, values))
+        for key, values in zip(keys, zip(*columns.values()))
+    }
+
+
+def _analytics_numpy(
+    keys: list[str], prices: dict[str, float], rows: list[tuple], start: int, days: int
+) -> dict[str, dict]:
+    order = numpy.array(sorted(keys))
+    keys = order.tolist()
+    current = numpy.array([prices[key] for key in keys], dtype=float)
+    mins = numpy.full((len(keys), days), numpy.nan)
+    maxs = numpy.full((len(keys), days), numpy.nan)
+    avgs = numpy.full((len(keys), days), numpy.nan)
+
+    if len(rows) > 0:
+        items, buckets, lo, hi, avg = zip(*rows)
+        row = numpy.searchsorted(order, numpy.array(items))
+        col = (numpy.array(buckets, dtype=numpy.int64) - start) // 86400
+        mins[row, col] = lo
+        maxs[row, col] = hi
+        avgs[row, col] = avg
+
+    def _list(values):
+        return [None if math.isnan(x) else x for x in values.tolist()]
+
+    columns = {}
+    with warnings.catch_warnings(), numpy.errstate(invalid="ignore", divide="ignore"):
+        # Items without history leave all-NaN rows behind
+        warnings.simplefilter("ignore", RuntimeWarning)
+
+        for window in _WINDOWS:
+            columns["price_min_{}d".format(window)] = _list(
+                numpy.nanmin(mins[:, -window:], axis=1)
+            )
+            columns["price_max_{}d".format(window)] = _list(
+                numpy.nanmax(maxs[:, -window:], axis=1)
+            )
+
+        # nanpercentile loops over rows in Python, sort once and interpolate instead
+        ordered = numpy.sort(avgs[:, -_PERCENTILE_WINDOW:], axis=1)  # NaN sort last
+        counts = numpy.count_nonzero(~numpy.isnan(ordered), axis=1)
+        for q in _PERCENTILES:
+            position = numpy.maximum(counts - 1, 0) * q / 100
+            lower = numpy.floor(position).astype(numpy.int64)
+            upper = numpy.minimum(lower + 1, numpy.maximum(counts - 1, 0))
+            low = numpy.take_along_axis(ordered, lower[:, None], axis=1)[:, 0]
+            high = numpy.take_along_axis(ordered, upper[:, None], axis=1)[:, 0]
+            columns["price_p{}_{}d".format(q, _PERCENTILE_WINDOW)] = _list(
+                low + (high - low) * (position - lower)
+            )
+
+        for window in _LOWEST_WINDOWS:
+            lowest = numpy.nanmin(mins[:, -window:], axis=1)
+            columns["lowest_{}d".format(window)] = (current <= lowest).tolist()
+
+        mean = numpy.nanmean(avgs[:, -_ZSCORE_WINDOW:], axis=1)
+        std = numpy.nanstd(avgs[:, -_ZSCORE_WINDOW:], axis=1)
+        zscore = numpy.where(std > 0, (current - mean) / std, 0.0)
+        zscore = numpy.where(numpy.isnan(mean), numpy.nan, zscore)
+        columns["price_zscore_{}d".format(_ZSCORE_WINDOW)] = _list(
+            numpy.round(zscore, 2)
+        )
+        columns["price_drop"] = (zscore <= _DROP_ZSCORE).tolist()
+
+    return _attributes(columns, keys)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Linear interpolation between closest ranks, same as NumPy's default."""
+    position = (len(values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def _analytics_python(
+    keys: list[str], prices: dict[str, float], rows: list[tuple], start: int, days: int
+) -> dict[str, dict]:
+    series: dict[str, list[tuple]] = {key: [] for key in keys}
+    for item, bucket, lo, hi, avg in rows:
+        series[item].append(((bucket - start) // 86400, lo, hi, avg))
+
+    columns = {name: [] for name in ANALYTICS_ATTRIBUTES}
+    for key in keys:
+        current = prices[key]
+
+        def _window(window: int) -> list[tuple]:
+            return [x for x in series[key] if x[0] >= days - window]
+
+        for window in _WINDOWS:
+            values = _window(window)
+            columns["price_min_{}d".format(window)].append(
+                min((x[1] for x in values), default=None)
+            )
+            columns["price_max_{}d".format(window)].append(
+                max((x[2] for x in values), default=None)
+            )
+
+        averages = sorted(x[3] for x in _window(_PERCENTILE_WINDOW))
+        for q in _PERCENTILES:
+            columns["price_p{}_{}d".format(q, _PERCENTILE_WINDOW)].append(
+                _percentile(averages, q) if len(averages) > 0 else None
+            )
+
+        for window in _LOWEST_WINDOWS:
+            lowest = min((x[1] for x in _window(window)), default=None)
+            columns["lowest_{}d".format(window)].append(
+                lowest is not None and current <= lowest
+            )
+
+        averages = [x[3] for x in _window(_ZSCORE_WINDOW)]
+        zscore = None
+        if len(averages) > 0:
+            std = statistics.pstdev(averages)
+            zscore = (
+                round((current - statistics.fmean(averages)) / std, 2)
+                if std > 0
+                else 0.0
+            )
+        columns["price_zscore_{}d".format(_ZSCORE_WINDOW)].append(zscore)
+        columns["price_drop"].append(zscore is not None and zscore <= _DROP_ZSCORE)
+
+    return _attributes(columns, keys)
@@ -0,0 +1,73 @@
+from typing import Iterable, Mapping
+
+
+class AttributeStore:
+    """Entity attributes that remember which keys changed since the last write.
+
+    Writing a value equal to the current one is a no-op, so an update that repeats the
+    previous item leaves nothing dirty. ``volatile`` keys (timestamps and such) are
+    tracked as well but do not count as a meaningful change on their own.
+    """
+
+    def __init__(self, values: Mapping | None = None, volatile: Iterable[str] = ()):
+        self._values = dict(values) if values is not None else {}
+        self._volatile = frozenset(volatile)
+        self._dirty: set[str] = set()
+        self._snapshot: dict | None = None
+
+    def get(self, key: str, default=None):
+        return self._values.get(key, default)
+
+    def set(self, key: str, value) -> bool:
+        """Set one attribute, returns whether it changed."""
+        if key in self._values and self._values[key] == value:
+            return False
+
+        self._values[key] = value
+        self._dirty.add(key)
+        self._snapshot = None
+
+        return True
+
+    def update(self, values: Mapping) -> bool:
+        """Set every attribute of ``values``, returns whether any of them changed."""
+        changed = False
+
+        for key, value in values.items():
+            changed = self.set(key, value) or changed
+
+        return changed
+
+    def replace(self, values: Mapping, keep: Iterable[str] = ()) -> bool:
+        """Like ``update``, but also drop the attributes missing from ``values``.
+
+        Attributes listed in ``keep`` survive the replacement.
+        """
+        keep = set(keep)
+        removed = [key for key in self._values if key not in values and key not in keep]
+
+        for key in removed:
+            del self._values[key]
+            self._dirty.add(key)
+            self._snapshot = None
+
+        return self.update(values) or len(removed) > 0
+
+    @property
+    def dirty(self) -> frozenset[str]:
+        return frozenset(self._dirty)
+
+    @property
+    def changed(self) -> bool:
+        """Whether a non-volatile attribute changed since the last ``clean``."""
+        return any(key not in self._volatile for key in self._dirty)
+
+    def clean(self):
+        self._dirty.clear()
+
+    def snapshot(self) -> dict:
+        """The attributes as a dict, the same object until something changes."""
+        if self._snapshot is None:
+            self._snapshot = dict(self._values)
+
+        return self._snapshot
@@ -0,0 +1,94 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, TYPE_CHECKING
+
+from custom_components.price_tracker.datas.item import ItemData
+
+if TYPE_CHECKING:
+    from custom_components.price_tracker.components.engine import PriceEngine
+
+_DEFAULT_TTL = 30  # seconds a loaded item is handed to identical loads that follow
+
+
+class ItemLoadCoalescer:
+    """Shares one load between every engine of the same item.
+
+    Engines are the same item when engine code, ``id_str()`` and device match, which
+    happens when one product is tracked by several config entries. A load arriving while
+    an identical one is in flight awaits that one, and a loaded item is handed out again
+    for ``ttl`` seconds. Errors and empty results are shared with the loads that were
+    waiting, but never cached.
+
+    The load runs as its own task, so a caller that is cancelled does not cancel it for
+    the others.
+    """
+
+    def __init__(self, ttl: float = _DEFAULT_TTL):
+        self._ttl = ttl
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+        self._results: dict[tuple, tuple[float, ItemData]] = {}
+
+        # Metrics
+        self._loads = 0
+        self._coalesced = 0
+        self._cached = 0
+
+    @staticmethod
+    def key(engine: "PriceEngine") -> tuple:
+        return engine.engine_code(), engine.id_str(), engine.device_id
+
+    async def load(
+        self,
+        engine: "PriceEngine",
+        job: Callable[[], Awaitable[ItemData | None]],
+    ) -> ItemData | None:
+        """Run ``job`` for the engine's item, unless an identical load can be reused."""
+        key = self.key(engine)
+
+        cached = self._results.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._cached += 1
+                return cached[1]
+            del self._results[key]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            self._loads += 1
+            task = asyncio.ensure_future(job())
+            task.add_done_callback(lambda x: self._done(key, x))
+            self._in_flight[key] = task
+
+        return await asyncio.shield(task)
+
+    def _done(self, key: tuple, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+        # Also marks the exception retrieved when every caller was cancelled
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        if task.result() is not None and self._ttl > 0:
+            self._results[key] = (time.monotonic() + self._ttl, task.result())
+
+    def invalidate(self, engine: "PriceEngine"):
+        self._results.pop(self.key(engine), None)
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "loads": self._loads,
+            "coalesced": self._coalesced,
+            "cached": self._cached,
+            "in_flight": len(self._in_flight),
+        }
+
+
+_LOAD_COALESCER = ItemLoadCoalescer()
+
+
+def load_coalescer() -> ItemLoadCoalescer:
+    return _LOAD_COALESCER
@@ -0,0 +1,364 @@
+import asyncio
+import heapq
+import logging
+import random
+import time
+from datetime import datetime
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
+from homeassistant.helpers.event import async_call_later
+
+from custom_components.price_tracker.components.analytics import (
+    price_analytics,
+    price_summaries,
+)
+from custom_components.price_tracker.components.engine import PriceEngine
+from custom_components.price_tracker.components.history import PriceHistory
+from custom_components.price_tracker.components.item_registry import PriceItemRegistry
+from custom_components.price_tracker.consts.defaults import WARMUP_SPREAD
+from custom_components.price_tracker.datas.item import ItemData
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_CONCURRENCY = 4
+_HISTORY_PRUNE_INTERVAL = 3600  # seconds
+_SHARED_RESULT_MAX_AGE = 0.5  # of the refresh period, for items another entry loaded
+
+
+class _Subscription:
+    def __init__(
+        self,
+        key: str,
+        engine: PriceEngine,
+        refresh_period: int,
+        listener: Callable[[ItemData | Exception | None], None],
+        analytics_listener: Callable[[dict], None] | None = None,
+    ):
+        self.key = key
+        self.engine = engine
+        self.refresh_period = refresh_period  # minutes
+        self.listener = listener
+        self.analytics_listener = analytics_listener
+        self.due_at = 0.0
+        self.unsubscribe_shared: CALLBACK_TYPE | None = None
+
+
+class PriceTrackerCoordinator:
+    """Owns the polling schedule of one config entry.
+
+    Items sit in a min-heap ordered by their next due time. A single timer is armed for
+    the earliest item, and when it fires every due item is fetched through its engine
+    type's ``load_many`` and handed to its subscriber as soon as it is loaded. At most
+    ``concurrency`` items of the entry load at once, whatever their store, so one slow
+    item holds up only its own slot and items falling due meanwhile are not kept
+    waiting.
+
+    Items without a usable due time (nothing restored, or restored state that is too
+    old) get a warm-up slot instead of being fetched right away. Slots are handed out
+    ``warmup_spread`` seconds apart on average (jittered), so the warm-up window grows
+    with the item count rather than firing every store at once on startup.
+
+    With a ``history`` every fetched price is appended to it as it is delivered, and
+    once all due items are fetched the price analytics and all-time price summary of
+    all of them are computed in a single executor job and handed to their
+    ``analytics_listener``.
+
+    With a ``registry`` every loaded item is published to the other entries tracking it,
+    and a due item another entry loaded within half its refresh period is taken from
+    there instead of being loaded again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        warmup_spread: float = WARMUP_SPREAD,
+        history: PriceHistory | None = None,
+        registry: PriceItemRegistry | None = None,
+    ):
+        self._hass = hass
+        self._entry_id = entry_id
+        self._concurrency = max(concurrency, 1)
+        self._warmup_spread = max(warmup_spread, 0)
+        self._warmup_at = 0.0
+        self._history = history
+        self._history_pruned_at = 0.0
+        self._registry = registry
+        self._subscriptions: dict[str, _Subscription] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._sequence = 0
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._timer_at: float | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return len(self._subscriptions)
+
+    @property
+    def history(self) -> PriceHistory | None:
+        return self._history
+
+    @callback
+    def async_subscribe(
+        self,
+        key: str,
+        engine: PriceEngine,
+        refresh_period: int,
+        listener: Callable[[ItemData | Exception | None], None],
+        due_at: datetime | None = None,
+        analytics_listener: Callable[[dict], None] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Schedule an item, returns the unsubscribe callback.
+
+        ``due_at`` is when the item should be fetched first; when it is missing or
+        already passed the item is queued into the next warm-up slot.
+        """
+        subscription = _Subscription(
+            key, engine, refresh_period, listener, analytics_listener
+        )
+        self._subscriptions[key] = subscription
+
+        if self._registry is not None:
+            subscription.unsubscribe_shared = self._registry.async_subscribe(
+                engine, self, listener
+            )
+
+        now = time.time()
+        if due_at is not None and due_at.timestamp() > now:
+            self._push(subscription, due_at.timestamp())
+        else:
+            self._push(subscription, self._next_warmup_slot(now))
+
+        self._async_schedule()
+
+        @callback
+        def _unsubscribe():
+            if self._subscriptions.get(key) is subscription:
+                self._subscriptions.pop(key)
+
+            if subscription.unsubscribe_shared is not None:
+                subscription.unsubscribe_shared()
+                subscription.unsubscribe_shared = None
+
+        return _unsubscribe
+
+    def _next_warmup_slot(self, now: float) -> float:
+        self._warmup_at = max(
+            self._warmup_at, now
+        ) + self._warmup_spread * random.uniform(0.5, 1.5)
+
+        return self._warmup_at
+
+    def _push(self, subscription: _Subscription, due_at: float):
+        # Old heap entries of the same key become stale and are skipped when popped
+        self._sequence += 1
+        subscription.due_at = due_at
+        heapq.heappush(self._heap, (due_at, self._sequence, subscription.key))
+
+    def _pop_due(self, now: float) -> list[_Subscription]:
+        due = []
+
+        while len(self._heap) > 0 and self._heap[0][0] <= now:
+            due_at, _, key = heapq.heappop(self._heap)
+            subscription = self._subscriptions.get(key)
+
+            if subscription is None or subscription.due_at != due_at:
+                continue
+
+            due.append(subscription)
+
+        return due
+
+    def _next_due(self) -> float | None:
+        while len(self._heap) > 0:
+            due_at, _, key = self._heap[0]
+            subscription = self._subscriptions.get(key)
+
+            if subscription is not None and subscription.due_at == due_at:
+                return due_at
+
+            heapq.heappop(self._heap)
+
+        return None
+
+    @callback
+    def _async_schedule(self):
+        if self._closed:
+            return
+
+        due_at = self._next_due()
+
+        if due_at is None:
+            return
+
+        if self._unsub_timer is not None:
+            if self._timer_at is not None and self._timer_at <= due_at:
+                return
+
+            self._unsub_timer()
+
+        self._timer_at = due_at
+        self._unsub_timer = async_call_later(
+            self._hass, max(due_at - time.time(), 0), self._handle_timer
+        )
+
+    @callback
+    def _handle_timer(self, _now):
+        self._unsub_timer = None
+        self._timer_at = None
+        self._hass.async_create_background_task(
+            self._async_refresh(), "price_tracker_{}_refresh".format(self._entry_id)
+        )
+
+    async def _async_refresh(self):
+        if self._closed:
+            return
+
+        now = time.time()
+        due = self._pop_due(now)
+        # Loading items are off the heap, the next due ones must not wait for them
+        self._async_schedule()
+
+        try:
+            pending: list[_Subscription] = []
+            shared: list[tuple[_Subscription, ItemData]] = []
+            for subscription in due:
+                result = (
+                    self._registry.recent(
+                        subscription.engine,
+                        subscription.refresh_period * 60 * _SHARED_RESULT_MAX_AGE,
+                    )
+                    if self._registry is not None
+                    else None
+                )
+
+                if result is not None:
+                    shared.append((subscription, result))
+                else:
+                    pending.append(subscription)
+
+            prices = {}
+            if len(shared) > 0:
+                prices.update(
+                    await self._async_deliver(
+                        [x[0] for x in shared], [x[1] for x in shared]
+                    )
+                )
+
+            for fetched in await asyncio.gather(
+                *[self._async_dispatch(subscription) for subscription in pending]
+            ):
+                prices.update(fetched)
+
+            if self._history is not None and len(prices) > 0:
+                await self._async_analytics(prices)
+
+            if (
+                self._history is not None
+                and now - self._history_pruned_at > _HISTORY_PRUNE_INTERVAL
+            ):
+                self._history_pruned_at = now
+                await self._async_history_job(self._history.prune)
+        finally:
+            self._async_schedule()
+
+    async def _async_dispatch(self, subscription: _Subscription) -> dict[str, float]:
+        """Fetch an item and notify its subscriber, returns the fetched price."""
+        engine_type = type(subscription.engine)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+
+        async with self._semaphore:
+            try:
+                results = await engine_type.load_many([subscription.engine])
+            except Exception as e:
+                _LOGGER.exception("Load failed for %s", engine_type.engine_code())
+                results = [e]
+
+        if self._registry is not None:
+            self._registry.async_publish(subscription.engine, results[0], self)
+
+        return await self._async_deliver([subscription], results)
+
+    async def _async_deliver(
+        self,
+        subscriptions: list[_Subscription],
+        results: list[ItemData | Exception | None],
+    ) -> dict[str, float]:
+        """Hand results to their subscribers, returns the fetched prices."""
+        now = time.time()
+        rows = []
+        for subscription, result in zip(subscriptions, results):
+            if self._subscriptions.get(subscription.key) is not subscription:
+                continue
+
+            self._push(subscription, now + subscription.refresh_period * 60)
+
+            try:
+                subscription.listener(result)
+            except Exception as e:
+                _LOGGER.exception("Subscriber %s failed: %s", subscription.key, e)
+
+            if self._history is not None and isinstance(result, ItemData):
+                row = PriceHistory.row(subscription.key, result, now)
+                if row is not None:
+                    rows.append(row)
+
+        if len(rows) > 0:
+            await self._async_history_job(self._history.append, rows)
+
+        return {row[0]: row[2] for row in rows}
+
+    async def _async_analytics(self, prices: dict[str, float]):
+        try:
+            analytics = await self._hass.async_add_executor_job(self._analytics, prices)
+        except Exception as e:
+            _LOGGER.warning("Price analytics of %s failed: %s", self._entry_id, e)
+            return
+
+        for key, attributes in analytics.items():
+            subscription = self._subscriptions.get(key)
+
+            if subscription is None or subscription.analytics_listener is None:
+                continue
+
+            try:
+                subscription.analytics_listener(attributes)
+            except Exception as e:
+                _LOGGER.exception("Subscriber %s failed: %s", key, e)
+
+    def _analytics(self, prices: dict[str, float]) -> dict[str, dict]:
+        analytics = price_analytics(self._history, prices)
+
+        for key, summary in price_summaries(self._history, list(prices)).items():
+            analytics[key].update(summary)
+
+        return analytics
+
+    async def _async_history_job(self, job, *args):
+        try:
+            await self._hass.async_add_executor_job(job, *args)
+        except Exception as e:
+            _LOGGER.warning("Price history of %s failed: %s", self._entry_id, e)
+
+    async def async_shutdown(self):
+        self._closed = True
+
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        for subscription in self._subscriptions.values():
+            if subscription.unsubscribe_shared is not None:
+                subscription.unsubscribe_shared()
+
+        self._subscriptions = {}
+        self._heap = []
+
+        if self._history is not None:
+            await self._async_history_job(self._history.close)
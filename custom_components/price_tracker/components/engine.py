@@ -1,21 +1,101 @@
+import asyncio
 import logging
 from abc import abstractmethod
 
+from custom_components.price_tracker.components.scheduler import fetch_scheduler
 from custom_components.price_tracker.datas.item import ItemData
+from custom_components.price_tracker.utilities.hash import fingerprint
 from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequest,
+    SafeRequestResponseData,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _content_hash(response: SafeRequestResponseData, content: str | None) -> str | None:
+    if content is None:
+        return response.content_hash
+
+    return fingerprint(content) if content != "" else None
+
+
 class PriceEngine:
     item_url: str
     id: any
 
+    # Last product response, to skip parsing when the store says nothing changed
+    _last_item: ItemData | None = None
+    _last_hash: str | None = None
+    _last_etag: str | None = None
+    _last_modified: str | None = None
+
     @abstractmethod
     async def load(self) -> ItemData | None:
         """Load"""
         pass
 
+    @classmethod
+    async def load_many(
+        cls, engines: list["PriceEngine"]
+    ) -> list[ItemData | Exception | None]:
+        """Load several items of this engine type at once.
+
+        Results are returned in the same order as ``engines``; a failed item yields the
+        raised exception instead of failing the whole batch. Engines with a bulk
+        endpoint override this, the default runs the single loads concurrently through
+        the fetch scheduler.
+        """
+        return await asyncio.gather(
+            *[fetch_scheduler().fetch(engine) for engine in engines],
+            return_exceptions=True,
+        )
+
+    def conditional(self, request: SafeRequest) -> SafeRequest:
+        """Send the validators of the last product response, if any."""
+        if self._last_item is not None:
+            request.conditional(etag=self._last_etag, last_modified=self._last_modified)
+
+        return request
+
+    def unchanged_item(
+        self, response: SafeRequestResponseData, content: str | None = None
+    ) -> ItemData | None:
+        """The previous item when the response is a 304 or a byte-identical body.
+
+        ``content`` is the part of the body the item is parsed from, compared instead
+        of the whole body when given.
+        """
+        if self._last_item is None:
+            return None
+
+        content_hash = _content_hash(response, content)
+
+        if response.is_not_modified or (
+            content_hash is not None and content_hash == self._last_hash
+        ):
+            return self._last_item
+
+        return None
+
+    def remember_item(
+        self,
+        response: SafeRequestResponseData,
+        item: ItemData,
+        content: str | None = None,
+    ) -> ItemData:
+        """Keep the item with the response it was parsed from, returns the item.
+
+        The item is frozen since it is handed out again for unchanged responses.
+        """
+        self._last_item = item.freeze()
+        self._last_hash = _content_hash(response, content)
+        self._last_etag = response.etag
+        self._last_modified = response.last_modified
+
+        return item
+
     @abstractmethod
     def id_str(self) -> str:
         pass
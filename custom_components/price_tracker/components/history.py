@@ -0,0 +1,297 @@
+import os
+import sqlite3
+import threading
+import time
+from enum import Enum
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from custom_components.price_tracker.consts.defaults import (
+    DOMAIN,
+    HISTORY_DAILY_RETENTION,
+    HISTORY_HOURLY_RETENTION,
+    HISTORY_RAW_RETENTION,
+)
+from custom_components.price_tracker.datas.item import ItemData, ItemStatus
+from custom_components.price_tracker.datas.price import ItemPriceSummaryData
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS price_raw (
+        item TEXT NOT NULL,
+        ts INTEGER NOT NULL,
+        price REAL NOT NULL,
+        original_price REAL,
+        inventory_rank INTEGER,
+        PRIMARY KEY (item, ts)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS price_rollup (
+        tier INTEGER NOT NULL,
+        item TEXT NOT NULL,
+        bucket INTEGER NOT NULL,
+        samples INTEGER NOT NULL,
+        price_min REAL NOT NULL,
+        price_max REAL NOT NULL,
+        price_sum REAL NOT NULL,
+        price_last REAL NOT NULL,
+        original_price_last REAL,
+        inventory_rank_last INTEGER,
+        PRIMARY KEY (tier, item, bucket)
+    ) WITHOUT ROWID""",
+)
+_INSERT_RAW = "INSERT OR IGNORE INTO price_raw VALUES (?, ?, ?, ?, ?)"
+_UPSERT_ROLLUP = """INSERT INTO price_rollup VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (tier, item, bucket) DO UPDATE SET
+        samples = samples + 1,
+        price_min = min(price_min, excluded.price_min),
+        price_max = max(price_max, excluded.price_max),
+        price_sum = price_sum + excluded.price_sum,
+        price_last = excluded.price_last,
+        original_price_last = excluded.original_price_last,
+        inventory_rank_last = excluded.inventory_rank_last"""
+_SUMMARY = """SELECT min(lo), max(hi), sum(total), sum(n) FROM (
+        SELECT min(price) lo, max(price) hi, sum(price) total, count(*) n
+        FROM price_raw WHERE item = ? AND ts >= ? AND ts < ?
+        UNION ALL
+        SELECT min(price_min), max(price_max), sum(price_sum), sum(samples)
+        FROM price_rollup WHERE tier = ? AND item = ? AND bucket >= ? AND bucket < ?
+        UNION ALL
+        SELECT min(price_min), max(price_max), sum(price_sum), sum(samples)
+        FROM price_rollup WHERE tier = ? AND item = ? AND bucket >= ? AND bucket < ?
+    )"""
+
+_DAILY_SERIES = """SELECT item, bucket, price_min, price_max, price_sum / samples
+    FROM price_rollup WHERE tier = ? AND bucket >= ? AND item IN ({})"""
+_QUERY_CHUNK = 500
+
+
+class PriceHistoryTier(Enum):
+    HOURLY = 1, 3600
+    DAILY = 2, 86400
+
+    def __new__(cls, *values):
+        obj = object.__new__(cls)
+        obj._value_ = values[0]
+        obj._seconds = values[1]
+        return obj
+
+    @property
+    def seconds(self) -> int:
+        return self._seconds
+
+    def bucket(self, ts: int) -> int:
+        return ts - ts % self._seconds
+
+
+class PriceHistory:
+    """Append-only price history of one config entry, kept in SQLite.
+
+    Every sample is stored raw and folded into hourly and daily rollups as it is
+    written, so downsampling needs no batch job. Pruning drops raw samples and hourly
+    rollups past their retention; queries read each period from the finest tier that
+    is still kept for it and aggregate inside SQLite.
+
+    The methods block on disk IO, run them in the executor.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        raw_retention: int = HISTORY_RAW_RETENTION,
+        hourly_retention: int = HISTORY_HOURLY_RETENTION,
+        daily_retention: int = HISTORY_DAILY_RETENTION,
+    ):
+        self._path = path
+        # days
+        self._raw_retention = raw_retention * 86400
+        self._hourly_retention = max(hourly_retention, raw_retention) * 86400
+        self._daily_retention = max(daily_retention, hourly_retention) * 86400
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+
+        return self._connection
+
+    @staticmethod
+    def row(key: str, item: ItemData, ts: float | None = None) -> tuple | None:
+        """History row of a loaded item, None when it is not on sale or has no price.
+
+        Deleted items and failed parses come back with a price of 0, which would stay in
+        the daily rollups for years and drag every minimum and average down.
+        """
+        if (
+            item.status != ItemStatus.ACTIVE
+            or item.price is None
+            or item.price.price is None
+            or item.price.price <= 0
+        ):
+            return None
+
+        return (
+            key,
+            int(ts if ts is not None else time.time()),
+            item.price.price,
+            item.price.original_price,
+            item.inventory.rank if item.inventory is not None else None,
+        )
+
+    def append(self, rows: list[tuple]):
+        """Write (key, ts, price, original_price, inventory_rank) rows at once."""
+        with self._lock:
+            connection = self._connect()
+
+            with connection:
+                for key, ts, price, original_price, inventory_rank in rows:
+                    inserted = connection.execute(
+                        _INSERT_RAW, (key, ts, price, original_price, inventory_rank)
+                    ).rowcount
+                    if inserted == 0:
+                        continue
+
+                    for tier in PriceHistoryTier:
+                        connection.execute(
+                            _UPSERT_ROLLUP,
+                            (
+                                tier.value,
+                                key,
+                                tier.bucket(ts),
+                                price,
+                                price,
+                                price,
+                                price,
+                                original_price,
+                                inventory_rank,
+                            ),
+                        )
+
+    def _boundaries(self, now: int) -> tuple[int, int]:
+        """Oldest timestamp served from raw samples, then from hourly rollups."""
+        raw_from = PriceHistoryTier.HOURLY.bucket(
+            now - self._raw_retention + PriceHistoryTier.HOURLY.seconds - 1
+        )
+        hourly_from = PriceHistoryTier.DAILY.bucket(
+            now - self._hourly_retention + PriceHistoryTier.DAILY.seconds - 1
+        )
+
+        return raw_from, min(hourly_from, raw_from)
+
+    def prune(self, now: float | None = None):
+        now = int(now if now is not None else time.time())
+        raw_from, hourly_from = self._boundaries(now)
+
+        with self._lock:
+            connection = self._connect()
+
+            with connection:
+                connection.execute("DELETE FROM price_raw WHERE ts < ?", (raw_from,))
+                connection.execute(
+                    "DELETE FROM price_rollup WHERE tier = ? AND bucket < ?",
+                    (PriceHistoryTier.HOURLY.value, hourly_from),
+                )
+                connection.execute(
+                    "DELETE FROM price_rollup WHERE tier = ? AND bucket < ?",
+                    (PriceHistoryTier.DAILY.value, now - self._daily_retention),
+                )
+
+    def remove(self, key: str):
+        with self._lock:
+            connection = self._connect()
+
+            with connection:
+                connection.execute("DELETE FROM price_raw WHERE item = ?", (key,))
+                connection.execute("DELETE FROM price_rollup WHERE item = ?", (key,))
+
+    def summary(
+        self,
+        key: str,
+        since: float | None = None,
+        until: float | None = None,
+        now: float | None = None,
+    ) -> ItemPriceSummaryData | None:
+        """Min, max and average price of an item, None without any sample.
+
+        Periods older than the raw retention are answered at hourly, then daily
+        resolution, so ``since`` is rounded down to the bucket of its tier.
+        """
+        now = int(now if now is not None else time.time())
+        since = int(since) if since is not None else 0
+        until = int(until) + 1 if until is not None else now + 1
+        raw_from, hourly_from = self._boundaries(now)
+
+        with self._lock:
+            lo, hi, total, samples = (
+                self._connect()
+                .execute(
+                    _SUMMARY,
+                    (
+                        key,
+                        max(since, raw_from),
+                        until,
+                        PriceHistoryTier.HOURLY.value,
+                        key,
+                        max(PriceHistoryTier.HOURLY.bucket(since), hourly_from),
+                        min(until, raw_from),
+                        PriceHistoryTier.DAILY.value,
+                        key,
+                        PriceHistoryTier.DAILY.bucket(since),
+                        min(until, hourly_from),
+                    ),
+                )
+                .fetchone()
+            )
+
+        if not samples:
+            return None
+
+        return ItemPriceSummaryData(
+            min_price=lo, max_price=hi, avg_price=total / samples
+        )
+
+    def daily_series(self, keys: list[str], since: float) -> list[tuple]:
+        """(key, day, min, max, average) of every day since ``since`` for ``keys``."""
+        since = PriceHistoryTier.DAILY.bucket(int(since))
+        rows = []
+
+        with self._lock:
+            connection = self._connect()
+
+            for i in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[i : i + _QUERY_CHUNK]
+                rows.extend(
+                    connection.execute(
+                        _DAILY_SERIES.format(", ".join("?" * len(chunk))),
+                        (PriceHistoryTier.DAILY.value, since, *chunk),
+                    ).fetchall()
+                )
+
+        return rows
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def history_path(hass: HomeAssistant, entry_id: str) -> str:
+    return hass.config.path(STORAGE_DIR, "{}.{}.history.db".format(DOMAIN, entry_id))
+
+
+def remove_history(path: str):
+    """Delete a history database together with its WAL files."""
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
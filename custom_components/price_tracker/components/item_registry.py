@@ -0,0 +1,129 @@
+import logging
+import time
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from custom_components.price_tracker.components.engine import PriceEngine
+from custom_components.price_tracker.consts.defaults import DATA_ITEM_REGISTRY, DOMAIN
+from custom_components.price_tracker.datas.item import ItemData
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _SharedItem:
+    def __init__(self, key: tuple, engine: PriceEngine):
+        self.key = key
+        self.engine = engine
+        self.holders = 0
+        self.listeners: dict[int, tuple[object, Callable[[ItemData], None]]] = {}
+        self.result: ItemData | None = None
+        self.loaded_at = 0.0
+
+
+class PriceItemRegistry:
+    """One engine per distinct item across every config entry.
+
+    Items are keyed by store type, canonical target id and device. The first holder of
+    an item creates its engine, every later one gets the same engine back, and the
+    engine is dropped once the last holder released it.
+
+    Items loaded by one coordinator are published here and handed to the listeners the
+    other coordinators subscribed for the same item, which also reuse a recent result
+    instead of loading the item again.
+    """
+
+    def __init__(self):
+        self._items: dict[tuple, _SharedItem] = {}
+        # id() of every held engine to its item
+        self._engines: dict[int, _SharedItem] = {}
+        self._sequence = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._items)
+
+    def acquire(self, key: tuple, factory: Callable[[], PriceEngine]) -> PriceEngine:
+        """The engine of ``key``, created with ``factory`` when nobody holds it yet."""
+        item = self._items.get(key)
+
+        if item is None:
+            item = _SharedItem(key, factory())
+            self._items[key] = item
+            self._engines[id(item.engine)] = item
+
+        item.holders += 1
+
+        return item.engine
+
+    def release(self, engine: PriceEngine):
+        item = self._engines.get(id(engine))
+        if item is None:
+            return
+
+        item.holders -= 1
+
+        if item.holders <= 0:
+            self._items.pop(item.key, None)
+            self._engines.pop(id(engine), None)
+
+    @callback
+    def async_subscribe(
+        self,
+        engine: PriceEngine,
+        owner: object,
+        listener: Callable[[ItemData], None],
+    ) -> CALLBACK_TYPE:
+        """Hand items of ``engine`` published by anyone but ``owner`` to ``listener``."""
+        item = self._engines.get(id(engine))
+        if item is None:
+            return lambda: None
+
+        self._sequence += 1
+        token = self._sequence
+        item.listeners[token] = (owner, listener)
+
+        @callback
+        def _unsubscribe():
+            item.listeners.pop(token, None)
+
+        return _unsubscribe
+
+    @callback
+    def async_publish(
+        self, engine: PriceEngine, result: ItemData | Exception | None, owner: object
+    ):
+        """Keep a loaded item and hand it to the listeners of every other owner."""
+        item = self._engines.get(id(engine))
+        if item is None or not isinstance(result, ItemData):
+            return
+
+        item.result = result
+        item.loaded_at = time.time()
+
+        for listener_owner, listener in list(item.listeners.values()):
+            if listener_owner is owner:
+                continue
+
+            try:
+                listener(result)
+            except Exception as e:
+                _LOGGER.exception("Shared item listener failed: %s", e)
+
+    def recent(self, engine: PriceEngine, max_age: float) -> ItemData | None:
+        """The last published item of ``engine`` if it is at most ``max_age`` seconds old."""
+        item = self._engines.get(id(engine))
+
+        if item is None or item.result is None:
+            return None
+
+        return item.result if time.time() - item.loaded_at <= max_age else None
+
+
+def item_registry(hass: HomeAssistant) -> PriceItemRegistry:
+    domain = hass.data.setdefault(DOMAIN, {})
+
+    if DATA_ITEM_REGISTRY not in domain:
+        domain[DATA_ITEM_REGISTRY] = PriceItemRegistry()
+
+    return domain[DATA_ITEM_REGISTRY]
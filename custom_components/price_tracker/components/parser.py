@@ -0,0 +1,68 @@
+from functools import cached_property
+from types import MappingProxyType
+
+
+class ItemParseResult:
+    """Immutable snapshot of every field a parser extracted.
+
+    A field that raised during extraction raises the same error when it is read, so
+    callers see failures exactly where they did when reading the parser directly.
+    """
+
+    __slots__ = ("_values", "_errors")
+
+    def __init__(self, values: dict, errors: dict[str, Exception]):
+        object.__setattr__(self, "_values", MappingProxyType(values))
+        object.__setattr__(self, "_errors", MappingProxyType(errors))
+
+    def __getattr__(self, name: str):
+        if name in self._errors:
+            raise self._errors[name]
+
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError("ItemParseResult is immutable")
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(self._values.keys()) + tuple(self._errors.keys())
+
+
+class ItemParser:
+    """Base of the store parsers.
+
+    Item fields are ``cached_property`` so a field computed from another one (unit from
+    price, etc.) is only computed once. ``extract`` runs every field in a single pass
+    and then drops the raw payload (response text, JSON tree, DOM) the parser held.
+    """
+
+    @classmethod
+    def field_names(cls) -> tuple[str, ...]:
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, cached_property) and name not in names:
+                    names.append(name)
+
+        return tuple(names)
+
+    def extract(self) -> ItemParseResult:
+        values = {}
+        errors = {}
+
+        for name in self.field_names():
+            try:
+                values[name] = getattr(self, name)
+            except Exception as e:
+                errors[name] = e
+
+        # Only the computed fields survive, the raw payload can be collected now
+        for name in list(vars(self).keys()):
+            if name not in values:
+                delattr(self, name)
+
+        return ItemParseResult(values, errors)
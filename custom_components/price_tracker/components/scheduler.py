@@ -0,0 +1,170 @@
+import asyncio
+import heapq
+import logging
+from enum import Enum
+from typing import Awaitable, Callable, TypeVar, TYPE_CHECKING
+
+from custom_components.price_tracker.components.coalescer import load_coalescer
+from custom_components.price_tracker.datas.item import ItemData
+from custom_components.price_tracker.utilities.telemetry import telemetry
+
+if TYPE_CHECKING:
+    from custom_components.price_tracker.components.engine import PriceEngine
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DEFAULT_MAX_IN_FLIGHT = 8
+_DEFAULT_MAX_PER_STORE = 2
+_STORE_MAX_IN_FLIGHT = {
+    "smartstore": 1,
+    "coupang": 1,
+}
+
+
+class FetchSchedulerOrdering(Enum):
+    FIFO = "fifo"
+    PRIORITY = "priority"
+
+
+class _Ticket:
+    def __init__(self, priority: int, sequence: int, key: str, future: asyncio.Future):
+        self.priority = priority
+        self.sequence = sequence
+        self.key = key
+        self.future = future
+
+    def __lt__(self, other: "_Ticket"):
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+class FetchScheduler:
+    """Caps in-flight fetches globally and per store.
+
+    Waiting jobs are released in FIFO order, or by ``priority`` (lower first, FIFO among
+    equals) when ordering is PRIORITY. A job whose store is saturated does not block
+    jobs of other stores queued behind it.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = _DEFAULT_MAX_IN_FLIGHT,
+        max_per_store: int = _DEFAULT_MAX_PER_STORE,
+        store_limits: dict[str, int] = None,
+        ordering: FetchSchedulerOrdering = FetchSchedulerOrdering.PRIORITY,
+    ):
+        self._max_in_flight = max(max_in_flight, 1)
+        self._max_per_store = max(max_per_store, 1)
+        self._store_limits = dict(
+            store_limits if store_limits is not None else _STORE_MAX_IN_FLIGHT
+        )
+        self._ordering = ordering
+        self._queue: list[_Ticket] = []
+        self._sequence = 0
+        self._in_flight = 0
+        self._store_in_flight: dict[str, int] = {}
+        self._queued = 0
+        self._completed = 0
+        self._failed = 0
+
+    def configure(self, key: str, max_in_flight: int):
+        self._store_limits[key] = max(max_in_flight, 1)
+        self._pump()
+
+    async def run(
+        self, key: str, job: Callable[[], Awaitable[T]], priority: int = 0
+    ) -> T:
+        """Wait for a global and a store slot, then run ``job``."""
+        await self._acquire(key, priority)
+
+        try:
+            result = await telemetry().load(key, job)
+            self._completed += 1
+            return result
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._release(key)
+
+    async def fetch(self, engine: "PriceEngine", priority: int = 0) -> ItemData | None:
+        """Load the engine's item, sharing the load with identical engines."""
+        return await load_coalescer().load(
+            engine, lambda: self.run(engine.engine_code(), engine.load, priority)
+        )
+
+    async def _acquire(self, key: str, priority: int):
+        self._sequence += 1
+        ticket = _Ticket(
+            priority=priority
+            if self._ordering == FetchSchedulerOrdering.PRIORITY
+            else 0,
+            sequence=self._sequence,
+            key=key,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._queue, ticket)
+        self._queued += 1
+        self._pump()
+
+        try:
+            await ticket.future
+        except asyncio.CancelledError:
+            if ticket.future.done() and not ticket.future.cancelled():
+                # Slot was granted right before cancellation, hand it back
+                self._release(key)
+            raise
+        finally:
+            self._queued -= 1
+
+    def _release(self, key: str):
+        self._in_flight -= 1
+        self._store_in_flight[key] -= 1
+        self._pump()
+
+    def _store_limit(self, key: str) -> int:
+        return self._store_limits.get(key, self._max_per_store)
+
+    def _pump(self):
+        skipped = []
+
+        while len(self._queue) > 0 and self._in_flight < self._max_in_flight:
+            ticket = heapq.heappop(self._queue)
+
+            if ticket.future.done():
+                continue
+
+            if self._store_in_flight.get(ticket.key, 0) >= self._store_limit(
+                ticket.key
+            ):
+                skipped.append(ticket)
+                continue
+
+            self._in_flight += 1
+            self._store_in_flight[ticket.key] = (
+                self._store_in_flight.get(ticket.key, 0) + 1
+            )
+            ticket.future.set_result(None)
+
+        for ticket in skipped:
+            heapq.heappush(self._queue, ticket)
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "completed": self._completed,
+            "failed": self._failed,
+            "stores": {
+                key: value for key, value in self._store_in_flight.items() if value > 0
+            },
+        }
+
+
+_FETCH_SCHEDULER = FetchScheduler()
+
+
+def fetch_scheduler() -> FetchScheduler:
+    return _FETCH_SCHEDULER
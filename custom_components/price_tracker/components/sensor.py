@@ -4,12 +4,25 @@ from datetime import datetime, timedelta
 from homeassistant.const import STATE_UNKNOWN
 from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.restore_state import RestoreEntity, RestoredExtraData
 
+from custom_components.price_tracker.components.analytics import (
+    ANALYTICS_ATTRIBUTES,
+    SUMMARY_ATTRIBUTES,
+)
+from custom_components.price_tracker.components.attributes import AttributeStore
+from custom_components.price_tracker.components.coordinator import (
+    PriceTrackerCoordinator,
+)
 from custom_components.price_tracker.components.device import PriceTrackerDevice
 from custom_components.price_tracker.components.engine import PriceEngine
 from custom_components.price_tracker.components.id import IdGenerator
-from custom_components.price_tracker.consts.defaults import DATA_UPDATED
+from custom_components.price_tracker.components.scheduler import fetch_scheduler
+from custom_components.price_tracker.consts.defaults import (
+    DATA_UPDATED,
+    RESTORE_MAX_AGE,
+    UPDATED_AT_HEARTBEAT,
+)
 from custom_components.price_tracker.datas.item import ItemData, ItemStatus
 from custom_components.price_tracker.datas.price import (
     ItemPriceChangeData,
@@ -40,9 +53,12 @@ class PriceTrackerSensor(RestoreEntity):
         period_hour=30,
     )
     _refresh_period: int = 30  # minutes
+    _restore_max_age: int = RESTORE_MAX_AGE  # minutes
     _unit_type: ItemUnitType = ItemUnitType.PIECE
     _unit_value: int = 1
     _updated_at: datetime | None = None
+    _updated_at_heartbeat: bool = UPDATED_AT_HEARTBEAT
+    _unsubscribe_coordinator = None
 
     def __init__(
         self,
@@ -54,9 +70,15 @@ class PriceTrackerSensor(RestoreEntity):
         management_category: str = None,
         management_categories: str = None,
         debug: bool = False,
+        coordinator: PriceTrackerCoordinator | None = None,
+        restore_max_age: int = RESTORE_MAX_AGE,
+        updated_at_heartbeat: bool = UPDATED_AT_HEARTBEAT,
     ):
         """Initialize the sensor."""
         self._engine = engine
+        self._coordinator = coordinator
+        # The coordinator owns the schedule; only poll when running standalone
+        self._attr_should_poll = coordinator is None
         self._attr_unique_id = IdGenerator.generate_entity_id(
             self._engine.engine_code(),
             self._engine.entity_id,
@@ -69,9 +91,9 @@ class PriceTrackerSensor(RestoreEntity):
         self._attr_state = STATE_UNKNOWN
         self._attr_available = True
         self._attr_device_info = device.device_info if device is not None else None
-        self._attr_extra_state_attributes = {
-            "provider": self._engine.engine_code(),
-        }
+        self._attributes = AttributeStore(
+            {"provider": self._engine.engine_code()}, volatile=("updated_at",)
+        )
 
         # Custom
         if management_categories is not None:
@@ -84,18 +106,39 @@ class PriceTrackerSensor(RestoreEntity):
         self._unit_type = unit_type
         self._unit_value = unit_value
         self._refresh_period = refresh_period if refresh_period is not None else 30
+        self._restore_max_age = (
+            restore_max_age if restore_max_age is not None else RESTORE_MAX_AGE
+        )
         self._updated_at = datetime.now()
+        # Without the heartbeat updated_at only moves when the item itself changed
+        self._updated_at_heartbeat = updated_at_heartbeat
         self._management_category = management_category
         self._management_categories = management_categories
         self._debug = debug
         self._engine_status = True
 
+    @property
+    def extra_state_attributes(self) -> dict:
+        return self._attributes.snapshot()
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData | None:
+        # Without the heartbeat updated_at is the last change, not the last fetch
+        if self._updated_at is None:
+            return None
+
+        return RestoredExtraData({"fetched_at": self._updated_at.isoformat()})
+
+    @property
+    def engine(self) -> PriceEngine:
+        return self._engine
+
     @property
     def engine_id_str(self):
         return self._engine.id_str()
 
-    async def async_update(self):
-        # Check last updated at
+    def _is_fresh(self) -> bool:
+        """Whether the last update is still inside the refresh period."""
         if (
             self._engine_status
             and self._updated_at is not None
@@ -113,6 +156,13 @@ class PriceTrackerSensor(RestoreEntity):
                 )
                 return True
 
+        return False
+
+    async def async_update(self):
+        # Check last updated at
+        if self._is_fresh():
+            return True
+
         _LOGGER.debug(
             "Update sensor: %s (%s) - %s",
             self._attr_unique_id,
@@ -121,13 +171,28 @@ class PriceTrackerSensor(RestoreEntity):
         )
 
         # Ignore deleted item
-        if self._item_data is not None and self._item_data.status == ItemStatus.DELETED:
+        if self._is_deleted:
             self._attr_available = True
             self._update_updated_at()
             return True
 
         try:
-            data = await self._engine.load()
+            # Items without any data yet go first
+            data = await fetch_scheduler().fetch(
+                self._engine, priority=0 if self._item_data is None else 1
+            )
+        except Exception as e:
+            data = e
+
+        return self.update_from_result(data)
+
+    def update_from_result(self, data: ItemData | Exception | None):
+        """Apply a loaded item (or the error raised while loading it)."""
+        self._attributes.clean()
+
+        try:
+            if isinstance(data, Exception):
+                raise data
 
             if data is None:
                 if (
@@ -162,17 +227,25 @@ class PriceTrackerSensor(RestoreEntity):
                 if self._item_data.unit.is_basic
                 else self._item_data.unit
             )
-            self._attr_extra_state_attributes = {
-                **self._item_data.dict,
-                **unit.dict,
-                "price_change_status": self._price_change.status.name,
-                "price_change_before_price": self._price_change.before_price,
-                "price_change_after_price": self._price_change.after_price,
-                "management_category": self._management_category,
-                "management_categories": self._management_categories,
-                "updated_at": self._updated_at,
-                "refresh_period": self._refresh_period,
-            }
+            self._attributes.replace(
+                {
+                    **self._item_data.dict,
+                    **unit.dict,
+                    "price_change_status": self._price_change.status.name,
+                    "price_change_before_price": self._price_change.before_price,
+                    "price_change_after_price": self._price_change.after_price,
+                    "management_category": self._management_category,
+                    "management_categories": self._management_categories,
+                    "refresh_period": self._refresh_period,
+                },
+                keep=(
+                    "provider",
+                    "engine_status",
+                    "updated_at",
+                    *ANALYTICS_ATTRIBUTES,
+                    *SUMMARY_ATTRIBUTES,
+                ),
+            )
             self._attr_name = self._item_data.name
             self._attr_state = self._item_data.price.price
             self._attr_entity_picture = self._item_data.image
@@ -194,9 +267,76 @@ class PriceTrackerSensor(RestoreEntity):
             self._update_updated_at()
 
     async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        await super().async_added_to_hass()
+        await self._async_restore()
+
+        if self._coordinator is not None and not self._is_deleted:
+            self._unsubscribe_coordinator = self._coordinator.async_subscribe(
+                key=self._attr_unique_id,
+                engine=self._engine,
+                refresh_period=self._refresh_period,
+                listener=self._handle_coordinator_result,
+                due_at=self._restored_due_at(),
+                analytics_listener=self._handle_coordinator_analytics,
+            )
+            self.async_on_remove(self._unsubscribe_coordinator)
+
+    def _restored_due_at(self) -> datetime | None:
+        """When the restored item has to be fetched again, None when it is unusable.
+
+        A restored item past its refresh period is still trusted until it reaches the
+        restore max age, the coordinator then refetches it inside the warm-up window.
+        """
+        if self._item_data is None or self._updated_at is None:
+            return None
+
+        due_at = self._updated_at + timedelta(minutes=self._refresh_period)
+        if due_at <= datetime.now():
+            due_at = self._updated_at + timedelta(
+                minutes=max(self._restore_max_age, self._refresh_period)
+            )
+
+        return due_at if due_at > datetime.now() else None
+
+    def _entity_state(self) -> tuple:
+        return (
+            self._attr_name,
+            self._attr_state,
+            self._attr_entity_picture,
+            self._attr_available,
+            self._attr_unit_of_measurement,
+        )
+
+    @property
+    def _is_deleted(self) -> bool:
+        return (
+            self._item_data is not None and self._item_data.status == ItemStatus.DELETED
+        )
+
+    @callback
+    def _handle_coordinator_result(self, data: ItemData | Exception | None):
+        before = self._entity_state()
+        self.update_from_result(data)
+
+        # Nothing but the polling itself happened, skip the state write
+        if len(self._attributes.dirty) > 0 or self._entity_state() != before:
+            self.async_write_ha_state()
+
+        # Deleted items are never fetched again
+        if self._is_deleted and self._unsubscribe_coordinator is not None:
+            self._unsubscribe_coordinator()
+            self._unsubscribe_coordinator = None
+
+    @callback
+    def _handle_coordinator_analytics(self, analytics: dict):
+        self._attributes.clean()
+
+        if self._attributes.update(analytics):
+            self.async_write_ha_state()
+
+    async def _async_restore(self):
         try:
-            """Handle entity which will be added."""
-            await super().async_added_to_hass()
             state = await self.async_get_last_state()
 
             if self._item_data is not None:
@@ -204,13 +344,22 @@ class PriceTrackerSensor(RestoreEntity):
 
             if not state:
                 self._attr_available = False
-                await self.async_update()
+
+                # The coordinator fetches it within the warm-up window
+                if self._coordinator is None:
+                    await self.async_update()
                 return
 
-            if "updated_at" in state.attributes:
-                self._updated_at = datetime.fromisoformat(
-                    state.attributes["updated_at"]
-                )
+            extra = await self.async_get_last_extra_data()
+            fetched_at = (
+                Lu.get(extra.as_dict(), "fetched_at") if extra is not None else None
+            )
+            if fetched_at is None:
+                # Stored before the fetch time was kept apart
+                fetched_at = Lu.get(state.attributes, "updated_at")
+
+            if fetched_at is not None:
+                self._updated_at = datetime.fromisoformat(fetched_at)
                 self._attr_available = True
             else:
                 self._update_engine_status(False)
@@ -221,12 +370,13 @@ class PriceTrackerSensor(RestoreEntity):
             self._attr_unit_of_measurement = Lu.get(
                 state.attributes, "unit_of_measurement"
             )
-            self._attr_extra_state_attributes = {
-                **self._attr_extra_state_attributes,
-                **state.attributes,
-                "management_category": self._management_category,
-                "management_categories": self._management_categories,
-            }
+            self._attributes.update(
+                {
+                    **state.attributes,
+                    "management_category": self._management_category,
+                    "management_categories": self._management_categories,
+                }
+            )
 
             if "product_id" in state.attributes:
                 self._item_data = ItemData(
@@ -267,14 +417,16 @@ class PriceTrackerSensor(RestoreEntity):
                     after_price=Lu.get(state.attributes, "price_change_after_price"),
                     updated_at=self._updated_at,
                 )
-                self._attr_extra_state_attributes = {
-                    **self._attr_extra_state_attributes,
-                    "price_change_status": self._price_change.status.name,
-                    "price_change_before_price": self._price_change.before_price,
-                    "price_change_after_price": self._price_change.after_price,
-                }
+                self._attributes.update(
+                    {
+                        "price_change_status": self._price_change.status.name,
+                        "price_change_before_price": self._price_change.before_price,
+                        "price_change_after_price": self._price_change.after_price,
+                    }
+                )
 
-            await self.async_update()
+            if self._coordinator is None:
+                await self.async_update()
 
             async_dispatcher_connect(
                 self.hass, DATA_UPDATED, self._schedule_immediate_update
@@ -288,17 +440,14 @@ class PriceTrackerSensor(RestoreEntity):
 
     def _update_updated_at(self):
         self._updated_at = datetime.now()
-        self._attr_extra_state_attributes = {
-            **self._attr_extra_state_attributes,
-            "updated_at": self._updated_at,
-        }
 
-    def _update_engine_status(self, status: bool):
-        if self._attr_extra_state_attributes is None:
-            self._attr_extra_state_attributes = {}
+        if (
+            self._updated_at_heartbeat
+            or self._attributes.changed
+            or self._attributes.get("updated_at") is None
+        ):
+            self._attributes.set("updated_at", self._updated_at)
 
-        self._attr_extra_state_attributes = {
-            **self._attr_extra_state_attributes,
-            "engine_status": "FETCHED" if status else "ERROR",
-        }
+    def _update_engine_status(self, status: bool):
+        self._attributes.set("engine_status", "FETCHED" if status else "ERROR")
         self._engine_status = status
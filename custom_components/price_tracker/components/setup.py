@@ -20,6 +20,16 @@ from custom_components.price_tracker.consts.confs import (
     CONF_TYPE,
     CONF_TARGET,
     CONF_ITEM_MANAGEMENT_CATEGORIES,
+    CONF_RESTORE_MAX_AGE,
+    CONF_WARMUP_SPREAD,
+    CONF_UPDATED_AT_HEARTBEAT,
+    CONF_TELEMETRY,
+)
+from custom_components.price_tracker.consts.defaults import (
+    RESTORE_MAX_AGE,
+    WARMUP_SPREAD,
+    UPDATED_AT_HEARTBEAT,
+    TELEMETRY,
 )
 from custom_components.price_tracker.datas.unit import ItemUnitType
 from custom_components.price_tracker.services.factory import (
@@ -38,6 +48,7 @@ class PriceTrackerSetup:
     const_option_setup_select: str = "option_setup_select"
     const_option_proxy_select: str = "option_proxy_select"
     const_option_selenium_select: str = "option_selenium_select"
+    const_option_advanced_select: str = "option_advanced_select"
     const_option_personal_select: str = "option_personal_select"
     const_option_modify_select: str = "option_modify_select"
     const_option_add_select: str = "option_add_select"
@@ -123,6 +134,7 @@ class PriceTrackerSetup:
                                 self.const_option_personal_select,
                                 self.const_option_proxy_select,
                                 self.const_option_selenium_select,
+                                self.const_option_advanced_select,
                                 self.const_option_modify_select,
                                 self.const_option_add_select,
                             ],
@@ -310,6 +322,92 @@ class PriceTrackerSetup:
             reason="selenium_updated" if flag else "selenium_not_updated"
         )
 
+    async def option_advanced(self, user_input: dict = None):
+        advanced = {
+            CONF_RESTORE_MAX_AGE: RESTORE_MAX_AGE,
+            CONF_WARMUP_SPREAD: WARMUP_SPREAD,
+            CONF_UPDATED_AT_HEARTBEAT: UPDATED_AT_HEARTBEAT,
+            CONF_TELEMETRY: TELEMETRY,
+        }
+
+        # Get items if the user_input is None
+        if user_input is None or not any(x in user_input for x in advanced):
+            data = dict(self._config_entry.data)
+
+            return self._option_flow.async_show_form(
+                step_id=self._step_setup,
+                description_placeholders={
+                    **Lang(self._option_flow.hass).f(
+                        key="title",
+                        items={
+                            "en": "Advanced configuration",
+                            "ja": "詳細設定",
+                            "ko": "고급 설정",
+                        },
+                    ),
+                    **Lang(self._option_flow.hass).f(
+                        key="description",
+                        items={
+                            "en": "Set how items are refreshed and their sensors updated.",
+                            "ja": "商品の更新方法とセンサーの更新方法を設定します。",
+                            "ko": "상품을 업데이트하고 센서에 반영하는 방법을 설정합니다.",
+                        },
+                    ),
+                },
+                data_schema=vol.Schema(
+                    {
+                        vol.Optional(
+                            self.const_option_setup_select,
+                            default=self.const_option_advanced_select,
+                        ): vol.In(
+                            {
+                                self.const_option_advanced_select: self.const_option_advanced_select
+                            }
+                        ),
+                        vol.Optional(
+                            CONF_RESTORE_MAX_AGE,
+                            default=data.get(CONF_RESTORE_MAX_AGE, RESTORE_MAX_AGE),
+                        ): cv.positive_int,
+                        vol.Optional(
+                            CONF_WARMUP_SPREAD,
+                            default=data.get(CONF_WARMUP_SPREAD, WARMUP_SPREAD),
+                        ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                        vol.Optional(
+                            CONF_UPDATED_AT_HEARTBEAT,
+                            default=data.get(
+                                CONF_UPDATED_AT_HEARTBEAT, UPDATED_AT_HEARTBEAT
+                            ),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_TELEMETRY,
+                            default=data.get(CONF_TELEMETRY, TELEMETRY),
+                        ): cv.boolean,
+                    }
+                ),
+            )
+
+        config = dict(self._config_entry.data)
+        options = dict(self._config_entry.options)
+
+        for key, default in advanced.items():
+            config[key] = user_input.get(key, config.get(key, default))
+
+        _LOGGER.debug(
+            "Advanced configuration with %s (original: %s)", config, user_input
+        )
+
+        flag = self._option_flow.hass.config_entries.async_update_entry(
+            entry=self._config_entry,
+            data={
+                **config,
+            },
+            options=options if options is not None else {},
+        )
+
+        return self._option_flow.async_abort(
+            reason="advanced_updated" if flag else "advanced_not_updated"
+        )
+
     async def option_modify(self, device, entity, user_input: dict = None):
         """Modify an existing entry."""
         _LOGGER.debug("Setup Modify(option): %s", user_input)
@@ -14,3 +14,7 @@ CONF_ITEM_REFRESH_INTERVAL = "item_refresh_interval"
 CONF_ITEM_MANAGEMENT_CATEGORY = "item_management_category"
 CONF_ITEM_MANAGEMENT_CATEGORIES = "item_management_categories"
 CONF_DEBUG = "item_debug"
+CONF_RESTORE_MAX_AGE = "restore_max_age"
+CONF_WARMUP_SPREAD = "warmup_spread"
+CONF_UPDATED_AT_HEARTBEAT = "updated_at_heartbeat"
+CONF_TELEMETRY = "telemetry"
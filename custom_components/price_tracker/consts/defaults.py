@@ -4,3 +4,11 @@ DESCRIPTION = "Track the price of products on e-commerce websites"
 VERSION = "1.4.5"
 PLATFORMS = ["sensor"]
 DATA_UPDATED = f"{DOMAIN}_data_updated"
+DATA_ITEM_REGISTRY = f"{DOMAIN}_item_registry"
+RESTORE_MAX_AGE = 180  # minutes a restored item is trusted before it is fetched again
+WARMUP_SPREAD = 1.0  # seconds between first fetches on startup, per item
+HISTORY_RAW_RETENTION = 2  # days every sample is kept
+HISTORY_HOURLY_RETENTION = 90  # days hourly rollups are kept
+HISTORY_DAILY_RETENTION = 1095  # days daily rollups are kept
+UPDATED_AT_HEARTBEAT = True  # refresh updated_at on every poll, even without changes
+TELEMETRY = False  # OpenTelemetry spans and histograms of requests and engine loads
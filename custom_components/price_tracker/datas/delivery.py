@@ -2,6 +2,8 @@ import dataclasses
 import datetime
 from enum import Enum
 
+from custom_components.price_tracker.datas.slotted import SlottedData
+
 
 class DeliveryPayType(Enum):
     FREE = "free"
@@ -27,7 +29,16 @@ class DeliveryType(Enum):
 
 
 @dataclasses.dataclass
-class DeliveryData:
+class DeliveryData(SlottedData):
+    __slots__ = (
+        "price",
+        "threshold_price",
+        "minimum_price",
+        "pay_type",
+        "delivery_type",
+        "arrive_date",
+    )
+
     def __init__(
         self,
         price: float = None,
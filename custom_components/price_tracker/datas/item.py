@@ -5,11 +5,14 @@ from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import DeliveryData
 from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.price import ItemPriceData
+from custom_components.price_tracker.datas.slotted import SlottedData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 
 
 @dataclasses.dataclass
-class ItemOptionData:
+class ItemOptionData(SlottedData):
+    __slots__ = ("id", "name", "price", "inventory")
+
     def __init__(self, id: any, name: str, price: float, inventory: int = None):
         self.id = id
         self.name = name
@@ -18,12 +21,14 @@ class ItemOptionData:
 
     @property
     def dict(self):
-        return {
-            "option_id": self.id,
-            "name": self.name,
-            "price": self.price,
-            "inventory_status": self.inventory.name,
-        }
+        return self._cached(
+            lambda: {
+                "option_id": self.id,
+                "name": self.name,
+                "price": self.price,
+                "inventory_status": self.inventory.name,
+            }
+        )
 
 
 class ItemStatus(Enum):
@@ -33,16 +38,33 @@ class ItemStatus(Enum):
 
 
 @dataclasses.dataclass
-class ItemData:
+class ItemData(SlottedData):
+    __slots__ = (
+        "id",
+        "unit",
+        "price",
+        "brand",
+        "delivery",
+        "category",
+        "url",
+        "image",
+        "name",
+        "description",
+        "inventory",
+        "options",
+        "status",
+        "http_status",
+    )
+
     def __init__(
         self,
         id: any,
         name: str = "UNKNOWN",
-        price: ItemPriceData = ItemPriceData(),
+        price: ItemPriceData = None,
         brand: str = None,
         description: str = None,
         category: ItemCategoryData = None,
-        delivery: DeliveryData = DeliveryData(),
+        delivery: DeliveryData = None,
         url: str = None,
         image: str = None,
         unit: ItemUnitData = None,
@@ -52,6 +74,11 @@ class ItemData:
         http_status: int = 200,
     ) -> None:
         self.id = id
+        # Built per item, a shared default would be frozen along with the first item
+        if price is None:
+            price = ItemPriceData()
+        if delivery is None:
+            delivery = DeliveryData()
         if unit is None:
             self.unit = ItemUnitData(
                 unit=1, price=price.price, unit_type=ItemUnitType.PIECE
@@ -75,8 +102,25 @@ class ItemData:
     def total_price(self):
         return self.price
 
+    def freeze(self):
+        """Freeze the item together with its price, delivery, unit and options."""
+        for part in self._parts():
+            part.freeze()
+
+        return super().freeze()
+
+    def _parts(self) -> tuple:
+        if self.options is None:
+            return self.price, self.delivery, self.unit
+
+        return self.price, self.delivery, self.unit, *self.options
+
     @property
     def dict(self):
+        """Sensor attributes of the item, cached until the item changes."""
+        return self._cached(self._build_dict, self._parts())
+
+    def _build_dict(self) -> dict:
         data = {
             "product_id": self.id,
             "brand": self.brand,
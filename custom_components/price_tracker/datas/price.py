@@ -2,11 +2,21 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
+from custom_components.price_tracker.datas.slotted import SlottedData
 from custom_components.price_tracker.utilities.parser import parse_float
 
 
 @dataclass
-class ItemPriceData:
+class ItemPriceData(SlottedData):
+    __slots__ = (
+        "price",
+        "currency",
+        "original_price",
+        "discount_amount",
+        "discount_rate",
+        "payback_price",
+    )
+
     def __init__(
         self,
         price: float = 0.0,
@@ -27,14 +37,16 @@ class ItemPriceData:
 
     @property
     def dict(self):
-        return {
-            "price": self.price,
-            "currency": self.currency,
-            "original_price": self.original_price,
-            "discount_amount": self.discount_amount,
-            "discount_rate": self.discount_rate,
-            "payback_price": self.payback_price,
-        }
+        return self._cached(
+            lambda: {
+                "price": self.price,
+                "currency": self.currency,
+                "original_price": self.original_price,
+                "discount_amount": self.discount_amount,
+                "discount_rate": self.discount_rate,
+                "payback_price": self.payback_price,
+            }
+        )
 
 
 class ItemPriceChangeStatus(Enum):
@@ -56,13 +68,20 @@ class ItemPriceChangeStatus(Enum):
 
 @dataclass
 class ItemPriceSummaryData:
-    def __init__(self, min_price: float = 0, max_price: float = 0):
+    def __init__(
+        self, min_price: float = 0, max_price: float = 0, avg_price: float = None
+    ):
         self.min_price = min_price
         self.max_price = max_price
+        self.avg_price = avg_price
 
     @property
     def dict(self):
-        return {"min_price": self.min_price, "max_price": self.max_price}
+        return {
+            "min_price": self.min_price,
+            "max_price": self.max_price,
+            "avg_price": self.avg_price,
+        }
 
 
 @dataclass
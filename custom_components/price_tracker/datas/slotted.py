@@ -0,0 +1,61 @@
+import dataclasses
+from typing import Callable
+
+
+class SlottedData:
+    """Base of the item value types.
+
+    Instances have no ``__dict__``, subclasses list their fields in ``__slots__``. Every
+    field assignment bumps a revision counter so serialized dicts can be cached until
+    the object, or one of the ``SlottedData`` it is built from, changes. ``freeze``
+    turns further assignments into ``FrozenInstanceError``.
+    """
+
+    __slots__ = ("_revision", "_frozen", "_cache")
+
+    def __new__(cls, *args, **kwargs):
+        obj = super().__new__(cls)
+        object.__setattr__(obj, "_revision", 0)
+        object.__setattr__(obj, "_frozen", False)
+        object.__setattr__(obj, "_cache", None)
+
+        return obj
+
+    def __setattr__(self, name: str, value):
+        if self._frozen:
+            raise dataclasses.FrozenInstanceError(
+                "cannot assign to field '{}'".format(name)
+            )
+
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_revision", self._revision + 1)
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self):
+        """Reject any further assignment, returns self."""
+        object.__setattr__(self, "_frozen", True)
+
+        return self
+
+    def _cached(self, build: Callable[[], dict], parts: tuple = ()) -> dict:
+        """Return the dict made by ``build``, rebuilt only after a change.
+
+        ``parts`` are the ``SlottedData`` the dict is read from, a change to any of them
+        invalidates the cache as well. The returned dict is shared between calls and
+        must be treated as read-only.
+        """
+        key = (self._revision, *[(id(part), part._revision) for part in parts])
+        cache = self._cache
+
+        if cache is None or cache[0] != key:
+            cache = (key, build())
+            object.__setattr__(self, "_cache", cache)
+
+        return cache[1]
@@ -1,6 +1,7 @@
 import dataclasses
 from enum import Enum
 
+from custom_components.price_tracker.datas.slotted import SlottedData
 from custom_components.price_tracker.utilities.parser import parse_float
 
 
@@ -50,7 +51,9 @@ class ItemUnitType(Enum):
 
 
 @dataclasses.dataclass
-class ItemUnitData:
+class ItemUnitData(SlottedData):
+    __slots__ = ("unit_type", "unit", "price", "total")
+
     def __init__(
         self,
         price: float,
@@ -88,9 +91,11 @@ class ItemUnitData:
 
     @property
     def dict(self):
-        return {
-            "unit_type": self.unit_type.name,
-            "unit_value": self.unit,
-            "unit_price": self.price,
-            "unit_total": self.total,
-        }
+        return self._cached(
+            lambda: {
+                "unit_type": self.unit_type.name,
+                "unit_value": self.unit,
+                "unit_price": self.price,
+                "unit_total": self.total,
+            }
+        )
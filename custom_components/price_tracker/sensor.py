@@ -2,6 +2,9 @@ import logging
 
 from homeassistant import config_entries, core
 
+from .components.coordinator import PriceTrackerCoordinator
+from .components.history import PriceHistory, history_path
+from .components.item_registry import item_registry
 from .components.sensor import PriceTrackerSensor
 from .consts.confs import (
     CONF_ITEM_DEVICE_ID,
@@ -19,10 +22,23 @@ from .consts.confs import (
     CONF_SELENIUM_PROXY,
     CONF_DEBUG,
     CONF_ITEM_MANAGEMENT_CATEGORIES,
+    CONF_RESTORE_MAX_AGE,
+    CONF_WARMUP_SPREAD,
+    CONF_UPDATED_AT_HEARTBEAT,
+)
+from .consts.defaults import (
+    DOMAIN,
+    RESTORE_MAX_AGE,
+    UPDATED_AT_HEARTBEAT,
+    WARMUP_SPREAD,
 )
-from .consts.defaults import DOMAIN
 from .datas.unit import ItemUnitType
-from .services.factory import create_service_device_generator, create_service_engine
+from .services.factory import (
+    create_service_device_generator,
+    create_service_engine,
+    create_service_item_target_parser,
+    create_service_item_url_parser,
+)
 from .utilities.list import Lu
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,6 +57,15 @@ async def async_setup_entry(
 
     devices = {}
     sensors = []
+    registry = item_registry(hass)
+    coordinator = PriceTrackerCoordinator(
+        hass=hass,
+        entry_id=config_entry.entry_id,
+        warmup_spread=Lu.get_or_default(config, CONF_WARMUP_SPREAD, WARMUP_SPREAD),
+        history=PriceHistory(history_path(hass, config_entry.entry_id)),
+        registry=registry,
+    )
+    config_entry.async_on_unload(coordinator.async_shutdown)
     proxy = Lu.get_or_default(config, CONF_PROXY, None)
     proxy_opensource = Lu.get_or_default(config, CONF_PROXY_OPENSOURCE, False)
     selenium = Lu.get_or_default(config, CONF_SELENIUM, None)
@@ -75,13 +100,24 @@ async def async_setup_entry(
                 proxy_opensource,
             )
 
-            engine = create_service_engine(type)(
-                item_url=target[CONF_ITEM_URL],
-                proxies=proxy,
-                device=device,
-                selenium=selenium,
-                selenium_proxy=selenium_proxy,
+            # Entries tracking the same item share its engine
+            engine = registry.acquire(
+                (
+                    type,
+                    create_service_item_target_parser(type)(
+                        create_service_item_url_parser(type)(target[CONF_ITEM_URL])
+                    ),
+                    device.device_id if device is not None else None,
+                ),
+                lambda: create_service_engine(type)(
+                    item_url=target[CONF_ITEM_URL],
+                    proxies=proxy,
+                    device=device,
+                    selenium=selenium,
+                    selenium_proxy=selenium_proxy,
+                ),
             )
+            config_entry.async_on_unload(lambda engine=engine: registry.release(engine))
             sensor = PriceTrackerSensor(
                 engine=engine,
                 device=device,
@@ -99,6 +135,13 @@ async def async_setup_entry(
                     target, CONF_ITEM_MANAGEMENT_CATEGORIES, None
                 ),
                 debug=Lu.get_or_default(config, CONF_DEBUG, False),
+                coordinator=coordinator,
+                restore_max_age=Lu.get_or_default(
+                    config, CONF_RESTORE_MAX_AGE, RESTORE_MAX_AGE
+                ),
+                updated_at_heartbeat=Lu.get_or_default(
+                    config, CONF_UPDATED_AT_HEARTBEAT, UPDATED_AT_HEARTBEAT
+                ),
             )
 
             if (
@@ -118,7 +161,9 @@ async def async_setup_entry(
         except Exception as e:
             _LOGGER.exception("Device(sensor) configuration error {}".format(e), e)
 
-    async_add_entities(sensors, update_before_add=True)
+    # Sensors restore their last state and are fetched by the coordinator afterwards,
+    # spread over the warm-up window
+    async_add_entities(sensors)
 
 
 async def update_listener(
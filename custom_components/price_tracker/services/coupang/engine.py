@@ -48,6 +48,7 @@ class CoupangEngine(PriceEngine):
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
             impersonate="chrome99_android",
+            rate_limit_key=self.engine_code(),
         )
 
         request.keep_alive()
@@ -73,13 +74,17 @@ class CoupangEngine(PriceEngine):
                 status=ItemStatus.DELETED,
             )
 
+        unchanged = self.unchanged_item(response)
+        if unchanged is not None:
+            return unchanged
+
         if not response.has:
             return None
 
         logging_for_response(data, __name__, "coupang")
-        coupang_parser = CoupangParser(text=data)
+        coupang_parser = CoupangParser(text=data).extract()
 
-        return ItemData(
+        item = ItemData(
             id=self.id_str(),
             name=coupang_parser.name,
             description=coupang_parser.description,
@@ -98,6 +103,8 @@ class CoupangEngine(PriceEngine):
             delivery=coupang_parser.delivery,
         )
 
+        return self.remember_item(response, item)
+
     def id_str(self) -> str:
         if self.item_id is None and self.vendor_item_id is None:
             return "{}".format(self.product_id)
@@ -2,8 +2,10 @@ import datetime
 import json
 import logging
 import re
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.delivery import (
     DeliveryPayType,
     DeliveryType,
@@ -12,13 +14,34 @@ from custom_components.price_tracker.datas.delivery import (
 from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
-from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.list import JsonPath, Lu
 from custom_components.price_tracker.utilities.parser import parse_number
 
 _LOGGER = logging.getLogger(__name__)
 
+_PAGE_LIST = JsonPath("rData.pageList")
+_PAGE = JsonPath("page")
+_WIDGET_LIST = JsonPath("widgetList")
+_VIEW_TYPE = JsonPath("entity.viewType")
+_MEDIA_DETAIL = JsonPath("entity.medias.0.detail")
+_DELIVERY_DATE = JsonPath("entity.deliveryDate")
+_SHIPPING_FEE = JsonPath("entity.deliveryInfo.shippingFee")
+_FINAL_PRICE = JsonPath("priceInfo.finalPrice.0")
+_ORIGINAL_PRICE = JsonPath("priceInfo.originalPrice.0")
+_TITLE = JsonPath("entity.title.0.text")
+# Merged in this order, later schemas win
+_MANDATORY_SCHEMAS = (
+    JsonPath("rData.properties.pageSession.logging.exposureSchema.mandatory"),
+    JsonPath("rData.properties.pageSession.logging.bypass.exposureSchema.mandatory"),
+    JsonPath("rData.properties.itemDetail.logging.exposureSchema.mandatory"),
+    JsonPath("rData.properties.itemDetail.logging.bypass.exposureSchema.mandatory"),
+    JsonPath(
+        "rData.properties.itemDetail.handleBarLogging.bypass.exposureSchema.mandatory"
+    ),
+)
+
 
-class CoupangParser:
+class CoupangParser(ItemParser):
     _data: dict
     _base: dict
     _page_atf: dict
@@ -32,64 +55,34 @@ class CoupangParser:
                 raise DataParseError(
                     "Coupang Parse Error (rCode) - {}".format(data["rCode"])
                 )
-            self._page_atf = Lu.get(
-                Lu.find(Lu.get(data, "rData.pageList"), "page", "PAGE_ATF"),
-                "widgetList",
-                [],
-            )
-            self._base = Lu.get(
-                Lu.find(
-                    Lu.get(data, "rData.pageList"),
-                    "page",
-                    "PAGE_HANDLEBAR",
-                    Lu.find(
-                        Lu.get(data, "rData.pageList"),
-                        "page",
-                        "PAGE_FASHION_HANDLEBAR",
-                        {},
-                    ),
-                ),
-                "widgetList",
+
+            # One pass over pages and widgets, every lookup below is a dict hit
+            pages = Lu.index(_PAGE_LIST.get(data, []), _PAGE)
+            self._page_atf = _WIDGET_LIST.get(pages.get("PAGE_ATF"), [])
+            self._base = _WIDGET_LIST.get(
+                pages.get("PAGE_HANDLEBAR", pages.get("PAGE_FASHION_HANDLEBAR", {})),
                 [],
             )
-            self._media = Lu.get(
-                Lu.find(
-                    self._page_atf,
-                    "entity.viewType",
-                    "PRODUCT_DETAIL_ITEM_THUMBNAILS",
-                    {},
-                ),
-                "entity.medias.0.detail",
-                [],
+            self._atf_widgets = Lu.index(self._page_atf, _VIEW_TYPE)
+            base_widgets = Lu.index(self._base, _VIEW_TYPE)
+            base_info = base_widgets.get("PRODUCT_DETAIL_BASE_INFO", {})
+
+            self._media = _MEDIA_DETAIL.get(
+                self._atf_widgets.get("PRODUCT_DETAIL_ITEM_THUMBNAILS", {}), []
             )
             self._data = {}
 
             delivery = "".join(
                 Lu.map(
-                    Lu.get(
-                        Lu.find(
-                            self._base,
-                            "entity.viewType",
-                            "PRODUCT_DETAIL_HANDLEBAR_QUANTITY",
-                        ),
-                        "entity.deliveryDate",
-                        [],
+                    _DELIVERY_DATE.get(
+                        base_widgets.get("PRODUCT_DETAIL_HANDLEBAR_QUANTITY"), []
                     ),
                     lambda x: x["text"],
                 )
             )
             delivery_price = "".join(
                 Lu.map(
-                    Lu.get(
-                        Lu.find(
-                            self._base,
-                            "entity.viewType",
-                            "PRODUCT_DETAIL_BASE_INFO",
-                            {},
-                        ),
-                        "entity.deliveryInfo.shippingFee",
-                        [],
-                    ),
+                    _SHIPPING_FEE.get(base_info, []),
                     lambda x: x["text"] if x is not None else "",
                 )
             )
@@ -105,89 +98,47 @@ class CoupangParser:
             self._data = {
                 **self._data,
                 **{
-                    "finalPrice": Lu.get(
-                        Lu.find(
-                            self._base,
-                            "entity.viewType",
-                            "PRODUCT_DETAIL_BASE_INFO",
-                            {},
-                        ),
-                        "priceInfo.finalPrice.0",
-                        Lu.get(self._data, "finalPrice"),
+                    "finalPrice": _FINAL_PRICE.get(
+                        base_info, Lu.get(self._data, "finalPrice")
                     )
                 },
                 **{
-                    "originalPrice": Lu.get(
-                        Lu.find(
-                            self._base,
-                            "entity.viewType",
-                            "PRODUCT_DETAIL_BASE_INFO",
-                            {},
-                        ),
-                        "priceInfo.originalPrice.0",
-                        Lu.get(self._data, "originalPrice"),
+                    "originalPrice": _ORIGINAL_PRICE.get(
+                        base_info, Lu.get(self._data, "originalPrice")
                     )
                 },
             }
-            self._data = {
-                **self._data,
-                **Lu.get(
-                    data,
-                    "rData.properties.pageSession.logging.exposureSchema.mandatory",
-                    {},
-                ),
-                **Lu.get(
-                    data,
-                    "rData.properties.pageSession.logging.bypass.exposureSchema.mandatory",
-                    {},
-                ),
-                **Lu.get(
-                    data,
-                    "rData.properties.itemDetail.logging.exposureSchema.mandatory",
-                    {},
-                ),
-                **Lu.get(
-                    data,
-                    "rData.properties.itemDetail.logging.bypass.exposureSchema.mandatory",
-                    {},
-                ),
-                **Lu.get(
-                    data,
-                    "rData.properties.itemDetail.handleBarLogging.bypass.exposureSchema.mandatory",
-                    {},
-                ),
-            }
+            for path in _MANDATORY_SCHEMAS:
+                self._data = {**self._data, **path.get(data, {})}
 
         except DataParseError as e:
             raise e
         except Exception as e:
             raise DataParseError("Coupang Parser Error") from e
 
-    @property
+    @cached_property
     def name(self):
-        return Lu.get(
-            Lu.find(self._page_atf, "entity.viewType", "PRODUCT_DETAIL_PRODUCT_INFO"),
-            "entity.title.0.text",
-            "Unknown (Coupang)",
+        return _TITLE.get(
+            self._atf_widgets.get("PRODUCT_DETAIL_PRODUCT_INFO"), "Unknown (Coupang)"
         )
 
-    @property
+    @cached_property
     def description(self):
         return ""
 
-    @property
+    @cached_property
     def brand(self):
         return Lu.get(self._data, "brandName")
 
-    @property
+    @cached_property
     def category(self):
         return None
 
-    @property
+    @cached_property
     def options(self):
         return None
 
-    @property
+    @cached_property
     def price(self):
         return ItemPriceData(
             original_price=Lu.get(self._data, "originalPrice"),
@@ -196,7 +147,7 @@ class CoupangParser:
             payback_price=0,
         )
 
-    @property
+    @cached_property
     def unit(self):
         price_info = Lu.get(self._data, "unitPrice")
         if price_info is None:
@@ -218,11 +169,11 @@ class CoupangParser:
 
         return unit_price
 
-    @property
+    @cached_property
     def image(self):
         return Lu.get(self._data, "image", None)
 
-    @property
+    @cached_property
     def delivery(self):
         rocket_type = Lu.get(self._data, "rocketType", "STANDARD")
         delivery_message = Lu.get(
@@ -296,7 +247,7 @@ class CoupangParser:
             arrive_date=arrival_date,
         )
 
-    @property
+    @cached_property
     def inventory(self):
         almost_oos = Lu.get(self._data, "isAlmostOSS", False)
         is_out_of_stock = Lu.get(self._data, "isOutOfStock", False)
@@ -36,6 +36,7 @@ class DaisoKrEngine(PriceEngine):
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
         )
         request.accept_text_html()
         request.accept_encoding("gzip, deflate, br")
@@ -53,10 +54,14 @@ class DaisoKrEngine(PriceEngine):
                 status=ItemStatus.DELETED,
             )
 
+        unchanged = self.unchanged_item(response)
+        if unchanged is not None:
+            return unchanged
+
         logging_for_response(response, __name__, "daiso_kr")
-        parser = DaisoKrParser(data=response.data)
+        parser = DaisoKrParser(data=response.data).extract()
 
-        return ItemData(
+        item = ItemData(
             id=self.id_str(),
             brand=parser.brand,
             name=parser.name,
@@ -73,6 +78,8 @@ class DaisoKrEngine(PriceEngine):
             inventory=parser.inventory_status,
         )
 
+        return self.remember_item(response, item)
+
     def id_str(self) -> str:
         return "{}".format(self.id)
 
@@ -1,6 +1,8 @@
 import json
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
     DeliveryData,
@@ -13,7 +15,7 @@ from custom_components.price_tracker.datas.unit import ItemUnitData
 from custom_components.price_tracker.utilities.parser import parse_bool
 
 
-class DaisoKrParser:
+class DaisoKrParser(ItemParser):
     def __init__(self, data: str | None):
         """Initialize the parser."""
         if data is None:
@@ -25,27 +27,27 @@ class DaisoKrParser:
         except json.JSONDecodeError as e:
             raise DataParseError("Failed to parse data for daiso kr") from e
 
-    @property
+    @cached_property
     def brand(self):
         return "다이소"
 
-    @property
+    @cached_property
     def name(self):
         return self._data.get("pdNm")
 
-    @property
+    @cached_property
     def image(self):
         return "https://cdn.daisomall.co.kr{}".format(self._data.get("imgUrl"))
 
-    @property
+    @cached_property
     def description(self):
         return ""
 
-    @property
+    @cached_property
     def inventory_status(self):
         return InventoryStatus.of(is_sold_out=False, stock=self._data.get("stckQy"))
 
-    @property
+    @cached_property
     def category(self):
         cate = self._data.get("exhCtgr")
         if cate is not None and len(cate) > 0:
@@ -59,21 +61,21 @@ class DaisoKrParser:
 
         return None
 
-    @property
+    @cached_property
     def options(self):
         return []
 
-    @property
+    @cached_property
     def price(self):
         sale_price = self._data.get("pdPrc")
 
         return ItemPriceData(price=sale_price)
 
-    @property
+    @cached_property
     def unit(self):
         return ItemUnitData(price=self.price.price)
 
-    @property
+    @cached_property
     def delivery(self):
         if parse_bool(self._data.get("dlvcExpectExhYn")):
             return DeliveryData(delivery_type=DeliveryType.PICKUP)
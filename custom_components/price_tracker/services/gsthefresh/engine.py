@@ -52,7 +52,10 @@ class GsTheFreshEngine(PriceEngine):
 
     async def load(self) -> ItemData:
         request = SafeRequest(
-            selenium=self._selenium, selenium_proxy=self._selenium_proxy
+            selenium=self._selenium,
+            selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
+            cookie_scope=self.device.device_id,
         )
         request.headers({**_REQUEST_HEADERS, **self.device.headers})
         request.auth(self.device.access_token)
@@ -71,7 +74,7 @@ class GsTheFreshEngine(PriceEngine):
             )
 
         logging_for_response(result, __name__, "gsthefresh")
-        gs_parser = GsthefreshParser(text=result)
+        gs_parser = GsthefreshParser(text=result).extract()
 
         return ItemData(
             id=self.id_str(),
@@ -91,6 +94,10 @@ class GsTheFreshEngine(PriceEngine):
     def id_str(self) -> str:
         return "{}_{}".format(self.device.store, self.id)
 
+    @property
+    def device_id(self) -> str | None:
+        return self.device.device_id
+
     @staticmethod
     def parse_id(item_url: str):
         u = re.search(r"itemCode=(?P<product_id>\d+)", unquote(item_url))
@@ -1,6 +1,8 @@
 import json
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.delivery import (
     DeliveryData,
     DeliveryType,
@@ -13,7 +15,7 @@ from custom_components.price_tracker.utilities.list import Lu
 from custom_components.price_tracker.utilities.parser import parse_bool, parse_number
 
 
-class GsthefreshParser:
+class GsthefreshParser(ItemParser):
     _data: dict
     _item: dict
 
@@ -35,15 +37,15 @@ class GsthefreshParser:
         except Exception as e:
             raise DataParseError("GS THE FRESH Parser Error") from e
 
-    @property
+    @cached_property
     def name(self):
         return self._item["indicateItemName"]
 
-    @property
+    @cached_property
     def description(self):
         return self._item["itemNotification"]
 
-    @property
+    @cached_property
     def inventory_status(self):
         return InventoryStatus.of(
             is_sold_out=parse_bool(self._item["soldOutYn"]),
@@ -52,15 +54,15 @@ class GsthefreshParser:
             else None,
         )
 
-    @property
+    @cached_property
     def category(self):
         return None
 
-    @property
+    @cached_property
     def brand(self):
         return None
 
-    @property
+    @cached_property
     def delivery(self):
         delivery_data = self._data["processingDeliveryAmountResultList"]
         if delivery_data is not None and len(delivery_data) > 0:
@@ -99,11 +101,11 @@ class GsthefreshParser:
             pay_type=pay_type,
         )
 
-    @property
+    @cached_property
     def unit(self):
         return ItemUnitData(price=self.price.price)
 
-    @property
+    @cached_property
     def price(self):
         sale_price = (
             self._item["normalSalePrice"] - self._item["totalDiscountRateAmount"]
@@ -113,6 +115,6 @@ class GsthefreshParser:
             price=sale_price, original_price=self._item["normalSalePrice"]
         )
 
-    @property
+    @cached_property
     def image(self):
         return self._item["weDeliveryItemImageUrl"]
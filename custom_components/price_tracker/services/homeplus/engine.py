@@ -43,11 +43,13 @@ class HomeplusEngine(PriceEngine):
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
         )
         request.accept_text_html()
         request.accept_encoding("gzip, deflate, br")
         request.cookie(key="domainType", value="mobile")
         request.user_agent(user_agent=_UA)
+        self.conditional(request)
         response = await request.request(
             method=SafeRequestMethod.GET, url=_URL.format(self.id)
         )
@@ -59,10 +61,14 @@ class HomeplusEngine(PriceEngine):
                 status=ItemStatus.DELETED,
             )
 
+        unchanged = self.unchanged_item(response)
+        if unchanged is not None:
+            return unchanged
+
         logging_for_response(response, __name__, "homeplus")
-        parser = HomeplusParser(html=response.data)
+        parser = HomeplusParser(html=response.data).extract()
 
-        return ItemData(
+        item = ItemData(
             id=self.id_str(),
             brand=parser.brand,
             name=parser.name,
@@ -79,6 +85,8 @@ class HomeplusEngine(PriceEngine):
             inventory=parser.inventory_status,
         )
 
+        return self.remember_item(response, item)
+
     def id_str(self) -> str:
         return "{}".format(self.id)
 
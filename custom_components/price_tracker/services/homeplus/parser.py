@@ -1,9 +1,9 @@
 import json
 import logging
-
-from bs4 import BeautifulSoup
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
     DeliveryPayType,
@@ -15,19 +15,28 @@ from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_bool, parse_number
+from custom_components.price_tracker.utilities.parser import (
+    compile_selector,
+    html_strainer,
+    parse_bool,
+    parse_html,
+    parse_number,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
 
+_KEEP = html_strainer(attrs={"id": "/item/getItemDetail.json"})
+_ITEM_DETAIL = compile_selector('script[id="/item/getItemDetail.json"]')
+
 
-class HomeplusParser:
+class HomeplusParser(ItemParser):
     """Parser class for Homeplus"""
 
     def __init__(self, html: str):
         self._html = html
-        self._soup = BeautifulSoup(html, "html.parser")
-        self._json_raw = self._soup.find("script", {"id": "/item/getItemDetail.json"})
+        self._soup = parse_html(html, parse_only=_KEEP)
+        self._json_raw = _ITEM_DETAIL.select_one(self._soup)
         if self._json_raw:
             try:
                 self._json = json.loads(self._json_raw.get_text())
@@ -43,15 +52,15 @@ class HomeplusParser:
         else:
             raise DataParseError("Failed to find JSON data Homeplus")
 
-    @property
+    @cached_property
     def brand(self) -> str:
         return self._basic["storeKind"]
 
-    @property
+    @cached_property
     def name(self):
         return self._basic["itemNm"]
 
-    @property
+    @cached_property
     def price(self):
         if self._sale["dcPrice"] == 0:
             return ItemPriceData(
@@ -64,11 +73,11 @@ class HomeplusParser:
             price=self._sale["dcPrice"] * self._sale["purchaseMinQty"],
         )
 
-    @property
+    @cached_property
     def description(self):
         return ""
 
-    @property
+    @cached_property
     def category(self):
         return ItemCategoryData(
             [
@@ -79,7 +88,7 @@ class HomeplusParser:
             ]
         )
 
-    @property
+    @cached_property
     def delivery(self):
         delivery_type = DeliveryType.EXPRESS
         if self._delivery["shipKind"] == "COND":
@@ -96,7 +105,7 @@ class HomeplusParser:
 
         return DeliveryData(delivery_type=DeliveryType.STANDARD)
 
-    @property
+    @cached_property
     def unit(self):
         unit_price = self._etc["unitPrice"]
         unit = ItemUnitType.of(self._etc["unitMeasure"])
@@ -106,18 +115,18 @@ class HomeplusParser:
             price=unit_price, unit_type=unit, unit=per, total_price=self.price.price
         )
 
-    @property
+    @cached_property
     def inventory_status(self):
         return InventoryStatus.of(
             is_sold_out=parse_bool(self._sale["itemSoldOutYn"]),
             stock=self._sale["stockQty"],
         )
 
-    @property
+    @cached_property
     def image(self):
         return "https://image.homeplus.kr{}".format(self._images["mainList"][0]["url"])
 
-    @property
+    @cached_property
     def options(self):
         if self._options is None or len(self._options["optSelList"]) == 0:
             return []
@@ -39,13 +39,14 @@ class IdusEngine(PriceEngine):
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
         )
         request.user_agent(mobile_random=True, pc_random=True)
         response = await request.request(
             method=SafeRequestMethod.GET, url=_URL.format(self.product_id)
         )
         data = response.data
-        idus_parser = IdusParser(text=data)
+        idus_parser = IdusParser(text=data).extract()
         logging_for_response(data, __name__)
 
         return ItemData(
@@ -1,6 +1,8 @@
 import json
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import DeliveryData, DeliveryPayType
 from custom_components.price_tracker.datas.inventory import InventoryStatus
@@ -9,7 +11,7 @@ from custom_components.price_tracker.datas.unit import ItemUnitData
 from custom_components.price_tracker.utilities.parser import parse_float
 
 
-class IdusParser:
+class IdusParser(ItemParser):
     _data: dict
 
     def __init__(self, text: str):
@@ -19,45 +21,45 @@ class IdusParser:
         except Exception as e:
             raise DataParseError("Idus Parser Error") from e
 
-    @property
+    @cached_property
     def name(self):
         return self._data["p_info"]["pi_name"]
 
-    @property
+    @cached_property
     def brand(self):
         return self._data["artistname"]
 
-    @property
+    @cached_property
     def description(self):
         return ""
 
-    @property
+    @cached_property
     def unit(self):
         return ItemUnitData(price=self.price.price)
 
-    @property
+    @cached_property
     def image(self):
         return self._data["p_images"]["pp_mainimage"]["ppi_origin"]["picPath"]
 
-    @property
+    @cached_property
     def category(self):
         return ItemCategoryData(self._data["category_name"])
 
-    @property
+    @cached_property
     def delivery(self):
         return DeliveryData(
             pay_type=DeliveryPayType.FREE, price=0.0, threshold_price=10000
         )
 
-    @property
+    @cached_property
     def options(self):
         return []
 
-    @property
+    @cached_property
     def url(self):
         return f"https://www.idus.com/v2/product/{self._data['uuid']}"
 
-    @property
+    @cached_property
     def inventory_status(self):
         if self._data["p_info"]["pi_itemcount"] == -1:
             inventory = InventoryStatus.IN_STOCK
@@ -68,7 +70,7 @@ class IdusParser:
 
         return inventory
 
-    @property
+    @cached_property
     def price(self):
         original_price = parse_float(self._data["p_info"]["pi_price"])
         sale_price = parse_float(self._data["p_info"]["pi_saleprice"])
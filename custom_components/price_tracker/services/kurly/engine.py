@@ -4,6 +4,7 @@ from typing import Optional
 
 from custom_components.price_tracker.components.engine import PriceEngine
 from custom_components.price_tracker.components.error import (
+    ApiAuthError,
     InvalidItemUrlError,
 )
 from custom_components.price_tracker.datas.item import ItemData, ItemStatus
@@ -13,6 +14,12 @@ from custom_components.price_tracker.utilities.logs import logging_for_response
 from custom_components.price_tracker.utilities.safe_request import (
     SafeRequest,
     SafeRequestMethod,
+    SafeRequestResponseData,
+    SafeRequestStatusError,
+)
+from custom_components.price_tracker.utilities.token_cache import (
+    AccessTokenCache,
+    jwt_expires_in,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,6 +27,9 @@ _AUTH_URL = "https://api.kurly.com/v3/auth/guest"
 _URL = "https://api.kurly.com/showroom/v2/products/{}"
 _ITEM_LINK = "https://www.kurly.com/goods/{}"
 
+# Guest token shared by every Kurly item of the process
+_GUEST_TOKENS = AccessTokenCache()
+
 
 class KurlyEngine(PriceEngine):
     def __init__(
@@ -37,21 +47,72 @@ class KurlyEngine(PriceEngine):
         self._selenium = selenium
         self._selenium_proxy = selenium_proxy
 
-    async def load(self) -> ItemData | None:
-        request = SafeRequest(
+    def _request(self) -> SafeRequest:
+        return SafeRequest(
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
         )
+
+    @staticmethod
+    async def _guest_token(request: SafeRequest) -> tuple[str, Optional[float]]:
         auth_response = await request.request(
-            method=SafeRequestMethod.POST, url=_AUTH_URL
+            method=SafeRequestMethod.POST, url=_AUTH_URL, raise_errors=True
         )
         auth_data = auth_response.json
-        request.auth(auth_data["data"]["access_token"])
-        response = await request.request(
-            method=SafeRequestMethod.GET, url=_URL.format(self.id)
+
+        if (
+            not isinstance(auth_data, dict)
+            or not isinstance(auth_data.get("data"), dict)
+            or "access_token" not in auth_data["data"]
+        ):
+            raise ApiAuthError(
+                "Kurly guest token response error - {}".format(auth_data)
+            )
+
+        token = auth_data["data"]["access_token"]
+        expires_in = auth_data["data"].get("expires_in")
+
+        if expires_in is None:
+            return token, jwt_expires_in(token)
+
+        return token, float(expires_in)
+
+    @classmethod
+    async def _authorize(cls, request: SafeRequest) -> str:
+        token = await _GUEST_TOKENS.get(lambda: cls._guest_token(request))
+        request.auth(token)
+
+        return token
+
+    async def load(self) -> ItemData | None:
+        return await self._load(self._request())
+
+    async def _product(self, request: SafeRequest) -> SafeRequestResponseData:
+        token = await self._authorize(request)
+
+        try:
+            return await request.request(
+                method=SafeRequestMethod.GET,
+                url=_URL.format(self.id),
+                raise_errors=True,
+            )
+        except SafeRequestStatusError as e:
+            if e.status_code != 401:
+                raise
+
+        # Expired or revoked before its time, fetch a new one and try once more
+        _GUEST_TOKENS.invalidate(token)
+        await self._authorize(request)
+
+        return await request.request(
+            method=SafeRequestMethod.GET, url=_URL.format(self.id), raise_errors=True
         )
 
+    async def _load(self, request: SafeRequest) -> ItemData | None:
+        response = await self._product(request)
+
         if response.is_not_found:
             return ItemData(
                 id=self.id_str(),
@@ -59,13 +120,17 @@ class KurlyEngine(PriceEngine):
                 status=ItemStatus.DELETED,
             )
 
+        unchanged = self.unchanged_item(response)
+        if unchanged is not None:
+            return unchanged
+
         data = response.data
 
         logging_for_response(data, __name__, "kurly")
 
-        kurly_parser = KurlyParser(text=data)
+        kurly_parser = KurlyParser(text=data).extract()
 
-        return ItemData(
+        item = ItemData(
             id=self.id_str(),
             name=kurly_parser.name,
             brand=kurly_parser.brand,
@@ -79,6 +144,8 @@ class KurlyEngine(PriceEngine):
             options=kurly_parser.options,
         )
 
+        return self.remember_item(response, item)
+
     def id_str(self) -> str:
         return self.id
 
@@ -1,8 +1,10 @@
 import datetime
 import json
 import re
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
     DeliveryPayType,
@@ -17,7 +19,7 @@ from custom_components.price_tracker.utilities.list import Lu
 from custom_components.price_tracker.utilities.parser import parse_float
 
 
-class KurlyParser:
+class KurlyParser(ItemParser):
     _data: dict
 
     def __init__(self, text: str):
@@ -27,11 +29,11 @@ class KurlyParser:
         except Exception as e:
             raise DataParseError("Failed to parse data") from e
 
-    @property
+    @cached_property
     def id(self):
         return self._data["no"]
 
-    @property
+    @cached_property
     def brand(self):
         brand_data = Lu.find(self._data["seller_profile"], "title", "판매자")
         if brand_data is None:
@@ -39,23 +41,23 @@ class KurlyParser:
 
         return brand_data["description"]
 
-    @property
+    @cached_property
     def name(self):
         return self._data["name"]
 
-    @property
+    @cached_property
     def image(self):
         return self._data["main_image_url"]
 
-    @property
+    @cached_property
     def description(self):
         return self._data["short_description"]
 
-    @property
+    @cached_property
     def category(self):
         return ItemCategoryData(self._data["category_ids"])
 
-    @property
+    @cached_property
     def delivery(self):
         types = Lu.map(
             self._data["delivery_type_infos"], lambda x: x["type"]
@@ -89,11 +91,11 @@ class KurlyParser:
             arrive_date=arrival,
         )
 
-    @property
+    @cached_property
     def url(self):
         return f"https://www.kurly.com/goods/{self.id}"
 
-    @property
+    @cached_property
     def unit(self):
         data = self._data["volume"]
         if data is None or data == "":
@@ -117,7 +119,7 @@ class KurlyParser:
             total_price=self.price.price,
         )
 
-    @property
+    @cached_property
     def options(self):
         data = self._data["deal_products"]
         if data is not None and len(data) > 0:
@@ -133,13 +135,13 @@ class KurlyParser:
         else:
             return []
 
-    @property
+    @cached_property
     def inventory(self):
         sold_out = self._data["is_sold_out"]
 
         return InventoryStatus.of(sold_out)
 
-    @property
+    @cached_property
     def price(self):
         sale_price = (
             parse_float(self._data["base_price"])
@@ -39,6 +39,7 @@ class LotteOnEngine(PriceEngine):
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
         )
         request.accept_text_html()
         request.accept_encoding("gzip, deflate, br")
@@ -66,7 +67,9 @@ class LotteOnEngine(PriceEngine):
 
         logging_for_response(response, __name__, "lotte_on")
 
-        parser = LotteOnParser(data=response.data, discount=discount_response.data)
+        parser = LotteOnParser(
+            data=response.data, discount=discount_response.data
+        ).extract()
 
         return ItemData(
             id=self.id_str(),
@@ -1,7 +1,9 @@
 import datetime
 import json
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
     DeliveryType,
@@ -12,10 +14,12 @@ from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
-from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.list import JsonPath, Lu
 
+_CART_DIVISION = JsonPath("dlvInfo.cartDvsCd")
 
-class LotteOnParser:
+
+class LotteOnParser(ItemParser):
     def __init__(self, data: str, discount: str | None = None):
         try:
             parse = json.loads(data)
@@ -33,7 +37,7 @@ class LotteOnParser:
         except Exception as e:
             raise DataParseError("Lotte ON Parser Error") from e
 
-    @property
+    @cached_property
     def discount_params(self):
         return {
             "spdNo": self._basic.get("spdNo"),
@@ -62,7 +66,7 @@ class LotteOnParser:
             "chNo": "0",
             "chDtlNo": "0",
             "aplyStdDttm": datetime.datetime.now().strftime("%Y%m%d%H%M%S"),
-            "cartDvsCd": Lu.get(self._data, "dlvInfo.cartDvsCd", "02"),
+            "cartDvsCd": _CART_DIVISION.get(self._data, "02"),
             "thdyPdYn": "N",
             "dvCst": self._basic.get("dvCst"),
             "fprdDvPdYn": "N",
@@ -77,19 +81,19 @@ class LotteOnParser:
             "cpnBoxVersion": "V2",
         }
 
-    @property
+    @cached_property
     def brand(self):
         return self._basic.get("brdNm")
 
-    @property
+    @cached_property
     def name(self):
         return self._basic.get("pdNm")
 
-    @property
+    @cached_property
     def url(self):
         return "https://www.lotteon.com/p/product/{}".format(self._basic.get("pdNo"))
 
-    @property
+    @cached_property
     def price(self):
         if self._discount is None:
             return ItemPriceData(
@@ -106,13 +110,13 @@ class LotteOnParser:
             price=self._price.get("slPrc"),
         )
 
-    @property
+    @cached_property
     def image(self):
         img = self._images.get("imageList")
         if img and len(img) > 0:
             return img[0].get("origImgFileNm")
 
-    @property
+    @cached_property
     def category(self):
         return ItemCategoryData(
             [
@@ -122,11 +126,11 @@ class LotteOnParser:
             ]
         )
 
-    @property
+    @cached_property
     def description(self):
         return ""
 
-    @property
+    @cached_property
     def inventory_status(self):
         info = self._data.get("stckInfo")
 
@@ -135,7 +139,7 @@ class LotteOnParser:
 
         return InventoryStatus.of(is_sold_out=False, stock=info.get("stkQty"))
 
-    @property
+    @cached_property
     def options(self):
         if self._options:
             return Lu.map(
@@ -151,7 +155,7 @@ class LotteOnParser:
             )
         return []
 
-    @property
+    @cached_property
     def delivery(self):
         list = self._delivery.get("dvList")
 
@@ -178,7 +182,7 @@ class LotteOnParser:
 
         return DeliveryData()
 
-    @property
+    @cached_property
     def unit(self):
         measure = self._price.get("pdCapa")
         unit = self._price.get("stdUtCd")
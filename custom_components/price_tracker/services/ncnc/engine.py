@@ -39,6 +39,7 @@ class NcncEngine(PriceEngine):
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
         )
         request.header(key="x-api-key", value=_X_API)
         response = await request.request(
@@ -59,7 +60,7 @@ class NcncEngine(PriceEngine):
         if not response.has or "error" in response.json:
             return None
 
-        ncnc_parser = NcncParser(text=data)
+        ncnc_parser = NcncParser(text=data).extract()
 
         return ItemData(
             id=self.id_str(),
@@ -1,6 +1,8 @@
 import json
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import DeliveryData, DeliveryType
 from custom_components.price_tracker.datas.inventory import InventoryStatus
@@ -8,7 +10,7 @@ from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData
 
 
-class NcncParser:
+class NcncParser(ItemParser):
     _data: dict = {}
     _item: dict = {}
 
@@ -20,15 +22,15 @@ class NcncParser:
         except Exception as e:
             raise DataParseError("NcncParser Error") from e
 
-    @property
+    @cached_property
     def id(self):
         return self._item["id"]
 
-    @property
+    @cached_property
     def brand(self):
         return self._item["conCategory2"]["name"]
 
-    @property
+    @cached_property
     def description(self):
         for item in self._item["conItems"]:
             if item["isSoldOut"]:
@@ -36,15 +38,15 @@ class NcncParser:
 
             return item["info"]
 
-    @property
+    @cached_property
     def name(self):
         return self._item["name"]
 
-    @property
+    @cached_property
     def image(self):
         return self._item["imageUrl"]
 
-    @property
+    @cached_property
     def category(self):
         return ItemCategoryData(
             "{}>{}".format(
@@ -53,7 +55,7 @@ class NcncParser:
             )
         )
 
-    @property
+    @cached_property
     def price(self):
         for item in self._item["conItems"]:
             if item["isSoldOut"]:
@@ -66,15 +68,15 @@ class NcncParser:
 
         return ItemPriceData(price=self._item["originalPrice"])
 
-    @property
+    @cached_property
     def unit(self):
         return ItemUnitData(price=self.price.price)
 
-    @property
+    @cached_property
     def delivery(self):
         return DeliveryData(delivery_type=DeliveryType.NO_DELIVERY)
 
-    @property
+    @cached_property
     def inventory_status(self):
         if len(self._item["conItems"]) > 0 and self._item["conItems"][0]["isSoldOut"]:
             if len(self._item["conItems"]) == 1:
@@ -39,11 +39,12 @@ class OasisEngine(PriceEngine):
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
         )
         response = await request.request(
             method=SafeRequestMethod.GET, url=_URL.format(self.product_id)
         )
-        oasis_parser = OasisParser(text=response.data)
+        oasis_parser = OasisParser(text=response.data).extract()
         logging_for_response(response, __name__)
 
         return ItemData(
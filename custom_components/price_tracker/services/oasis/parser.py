@@ -1,8 +1,8 @@
 import re
-
-from bs4 import BeautifulSoup
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
     DeliveryType,
@@ -13,50 +13,91 @@ from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_number
-
+from custom_components.price_tracker.utilities.parser import (
+    compile_selector,
+    html_strainer,
+    parse_html,
+    parse_number,
+)
 
-class OasisParser:
-    _data: BeautifulSoup
+_KEEP = html_strainer(
+    classes=(
+        "oDetail_info_group_title",
+        "oDetail_info_gr_shopName",
+        "detailView_body",
+        "o_currentPath",
+        "oDetail_info_group2",
+        "notice",
+        "swiper-slide",
+        "buyItNowFromDetail",
+        "discountPrice",
+        "oDetail_info_group_price",
+    )
+)
 
+_TITLE = compile_selector("div.oDetail_info_group_title h1")
+_SHOP_NAME = compile_selector("div.oDetail_info_gr_shopName")
+_STRONG = compile_selector("strong")
+_DESCRIPTION = compile_selector("div.detailView_body")
+_CURRENT_PATH = compile_selector("div.o_currentPath")
+_LINKS = compile_selector("a")
+_INFO_GROUPS = compile_selector("div.oDetail_info_group2")
+_EM = compile_selector("em")
+_DD = compile_selector("dd")
+_NOTICES = compile_selector("dd.notice")
+_DELIVERY_SAVE = compile_selector("dd.deliverySave")
+_SLIDE_IMAGE = compile_selector("li.swiper-slide img")
+_BUY_NOW = compile_selector("a.buyItNowFromDetail")
+_DISCOUNT_PRICE = compile_selector("div.discountPrice")
+_COST = compile_selector("div.oDetail_info_group_price div.cost")
+
+
+class OasisParser(ItemParser):
     def __init__(self, text: str):
         try:
-            self._data = BeautifulSoup(text, "html.parser")
+            soup = parse_html(text, parse_only=_KEEP)
         except Exception as e:
             raise DataParseError("OASIS Failed to parse data") from e
 
-    @property
+        # Every selector runs once here, properties only read the matched nodes
+        self._title = _TITLE.select_one(soup)
+        self._shop_name = _SHOP_NAME.select_one(soup)
+        self._description = _DESCRIPTION.select_one(soup)
+        self._current_path = _CURRENT_PATH.select_one(soup)
+        self._info_groups = _INFO_GROUPS.select(soup)
+        self._notices = _NOTICES.select(soup)
+        self._image = _SLIDE_IMAGE.select_one(soup)
+        self._buy_now = _BUY_NOW.select(soup)
+        self._discount_price = _DISCOUNT_PRICE.select_one(soup)
+        self._cost = _COST.select_one(soup)
+
+    @cached_property
     def name(self):
-        return (
-            self._data.find("div", class_="oDetail_info_group_title")
-            .find("h1")
-            .get_text()
-            .strip()
-        )
+        return self._title.get_text().strip()
 
-    @property
+    @cached_property
     def brand(self):
-        target = self._data.find("div", class_="oDetail_info_gr_shopName")
+        target = self._shop_name
         if target is None:
             return None
 
-        return target.find("strong").get_text().strip()
+        return _STRONG.select_one(target).get_text().strip()
 
-    @property
+    @cached_property
     def description(self):
-        data = self._data.find("div", "detailView_body")
+        data = self._description
         if data is None:
             return None
 
         return data.get_text().strip()
 
-    @property
+    @cached_property
     def category(self):
-        data = self._data.find("div", "o_currentPath")
+        data = self._current_path
         if data is None:
             return None
 
-        items = data.find_all("a")
+        items = _LINKS.select(data)
         if items is None:
             return None
 
@@ -66,13 +107,13 @@ class OasisParser:
 
         return ItemCategoryData(categories)
 
-    @property
+    @cached_property
     def delivery(self):
-        info = self._data.find("div", "oDetail_info_group2")
+        info = self._info_groups[0] if len(self._info_groups) > 0 else None
         if info is None:
             return None
 
-        delivery_types = info.find_all("em")
+        delivery_types = _EM.select(info)
         if "새벽배송" in delivery_types:
             delivery_type = DeliveryType.EXPRESS_NEXT_DAWN
         elif "당일배송" in delivery_types:
@@ -83,11 +124,11 @@ class OasisParser:
             delivery_type = DeliveryType.STANDARD
 
         # 산지출고여부
-        for s in self._data.find_all("dd", "notice"):
+        for s in self._notices:
             if s.get_text().strip().startswith("산지출고일: ") is True:
                 delivery_type = DeliveryType.EXPRESS
 
-        delivery_save = info.find("dd", "deliverySave")
+        delivery_save = _DELIVERY_SAVE.select_one(info)
         delivery_price = None
         threshold_price = None
         if delivery_save is not None:
@@ -114,10 +155,10 @@ class OasisParser:
             delivery_type=delivery_type,
         )
 
-    @property
+    @cached_property
     def unit(self):
-        for detail_data in self._data.find_all("div", class_="oDetail_info_group2"):
-            for dd in detail_data.find_all("dd"):
+        for detail_data in self._info_groups:
+            for dd in _DD.select(detail_data):
                 target_for_unit = dd.get_text().replace("\n", "").replace("\t", "")
                 target_unit_regex = re.search(
                     r"(?P<unit>[\d,]+)(?P<type>g|ml|mL|l|L|kg|Kg)당(?: |)(?P<price>[\d,]+)원",
@@ -133,39 +174,29 @@ class OasisParser:
 
         return None
 
-    @property
+    @cached_property
     def image(self):
-        return self._data.find("li", class_="swiper-slide").find("img")["src"]
+        return self._image["src"]
 
-    @property
+    @cached_property
     def inventory(self):
-        for data in self._data.find_all("a", "buyItNowFromDetail"):
+        for data in self._buy_now:
             if data.get_text().strip() == "품절":
                 return InventoryStatus.OUT_OF_STOCK
 
         return InventoryStatus.IN_STOCK
 
-    @property
+    @cached_property
     def price(self):
-        sale_price = parse_number(
-            self._data.find("div", class_="discountPrice").get_text().replace("원", "")
-        )
+        sale_price = parse_number(self._discount_price.get_text().replace("원", ""))
         original_price = (
-            parse_number(
-                self._data.find("div", "oDetail_info_group_price")
-                .find("div", class_="cost")
-                .get_text()
-                .replace("원", "")
-            )
-            if self._data.find("div", "oDetail_info_group_price").find(
-                "div", class_="cost"
-            )
-            is not None
+            parse_number(self._cost.get_text().replace("원", ""))
+            if self._cost is not None
             else None
         )
 
         return ItemPriceData(price=sale_price, original_price=original_price)
 
-    @property
+    @cached_property
     def options(self):
         return None
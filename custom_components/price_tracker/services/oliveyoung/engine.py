@@ -43,8 +43,10 @@ class OliveyoungEngine(PriceEngine):
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
         )
         request.user_agent(user_agent=OLIVEYOUNG_USER_AGENT)
+        self.conditional(request)
 
         response = await request.request(
             method=SafeRequestMethod.GET, url=_URL.format(self.goods_number)
@@ -57,10 +59,14 @@ class OliveyoungEngine(PriceEngine):
                 status=ItemStatus.DELETED,
             )
 
+        unchanged = self.unchanged_item(response)
+        if unchanged is not None:
+            return unchanged
+
         logging_for_response(response, __name__, "oliveyoung")
-        oliveyoung_parser = OliveyoungParser(text=response.data)
+        oliveyoung_parser = OliveyoungParser(text=response.data).extract()
 
-        return ItemData(
+        item = ItemData(
             id=self.id_str(),
             brand=oliveyoung_parser.brand,
             name=oliveyoung_parser.name,
@@ -77,6 +83,8 @@ class OliveyoungEngine(PriceEngine):
             ),
         )
 
+        return self.remember_item(response, item)
+
     def id_str(self) -> str:
         return self.goods_number
 
@@ -1,8 +1,8 @@
 import json
-
-from bs4 import BeautifulSoup
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
     DeliveryType,
@@ -14,16 +14,25 @@ from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_number, parse_bool
+from custom_components.price_tracker.utilities.parser import (
+    compile_selector,
+    html_strainer,
+    parse_bool,
+    parse_html,
+    parse_number,
+)
+
+_KEEP = html_strainer(attrs={"id": "goodsData"})
+_GOODS_DATA = compile_selector("textarea#goodsData")
 
 
-class OliveyoungParser:
+class OliveyoungParser(ItemParser):
     _data: dict = {}
 
     def __init__(self, text: str):
         try:
-            soup = BeautifulSoup(text, "html.parser")
-            data = soup.find("textarea", {"id": "goodsData"}).get_text()
+            soup = parse_html(text, parse_only=_KEEP)
+            data = _GOODS_DATA.select_one(soup).get_text()
             if data is not None:
                 self._data = json.loads(data)
             else:
@@ -33,25 +42,25 @@ class OliveyoungParser:
         except Exception as e:
             raise DataParseError(str(e)) from e
 
-    @property
+    @cached_property
     def brand(self):
         return self._data["brandName"]
 
-    @property
+    @cached_property
     def name(self):
         return self._data["goodsBaseInfo"]["goodsName"]
 
-    @property
+    @cached_property
     def category(self):
         return ItemCategoryData(
             self._data["displayCategoryInfo"]["displayCategoryFullPath"]
         )
 
-    @property
+    @cached_property
     def description(self):
         return ""
 
-    @property
+    @cached_property
     def image(self):
         return (
             f"https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/{self._data['images'][0]}"
@@ -59,7 +68,7 @@ class OliveyoungParser:
             else None
         )
 
-    @property
+    @cached_property
     def unit(self):
         unit_price_info = self._data["goodsUnitPriceInfo"]
         if unit_price_info["unitPrice"] == 0:
@@ -67,14 +76,14 @@ class OliveyoungParser:
         else:
             return ItemUnitData(price=self.price.price, unit_type=ItemUnitType.PIECE)
 
-    @property
+    @cached_property
     def price(self):
         sale_price = parse_number(self._data["finalPrice"])
         supply_price = parse_number(self._data["supplyPrice"])
 
         return ItemPriceData(price=sale_price, original_price=supply_price)
 
-    @property
+    @cached_property
     def delivery(self):
         # todayDeliveryFlag
         if self._data["todayDeliveryFlag"]:
@@ -95,7 +104,7 @@ class OliveyoungParser:
             delivery_type=delivery_type,
         )
 
-    @property
+    @cached_property
     def options(self):
         options = self._data["optionInfo"]["optionList"]
         return Lu.map(
@@ -108,7 +117,7 @@ class OliveyoungParser:
             ),
         )
 
-    @property
+    @cached_property
     def inventory_status(self):
         sum_options = sum(
             [x["quantity"] for x in self._data["optionInfo"]["optionList"]]
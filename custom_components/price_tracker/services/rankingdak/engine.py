@@ -43,6 +43,7 @@ class RankingdakEngine(PriceEngine):
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
+            rate_limit_key=self.engine_code(),
         )
         request.accept_text_html()
         request.user_agent(mobile_random=True)
@@ -60,7 +61,7 @@ class RankingdakEngine(PriceEngine):
         logging_for_response(response, __name__, "rankingdak")
 
         try:
-            parser = RankingdakParser(html=response.data)
+            parser = RankingdakParser(html=response.data).extract()
 
             return ItemData(
                 id=self.id_str(),
@@ -1,13 +1,13 @@
 import logging
 import re
 from datetime import datetime
-
-from bs4 import BeautifulSoup
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import (
     DataParseError,
     NotFoundError,
 )
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.delivery import (
     DeliveryData,
     DeliveryPayType,
@@ -18,48 +18,71 @@ from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_float, parse_number
+from custom_components.price_tracker.utilities.parser import (
+    compile_selector,
+    html_strainer,
+    parse_float,
+    parse_html,
+    parse_number,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-
-class RankingdakParser:
+_KEEP = html_strainer(
+    names=("script",),
+    classes=(
+        "price-info",
+        "goods-price",
+        "table-item",
+        "goods-img-area",
+        "ingredient_wrap",
+        "selected-options-ul1",
+    ),
+    attrs={"name": "productCounselForm"},
+)
+_SCRIPTS = compile_selector("script")
+_PRODUCT_NAME = compile_selector(
+    'form[name="productCounselForm"] input[name="productnm"]'
+)
+_PRICE_INFO = compile_selector("div.price-info")
+_GOODS_PRICE = compile_selector("div.goods-price")
+_TABLE_ITEMS = compile_selector("div.table-item")
+_IMAGE = compile_selector("div.goods-img-area img")
+_INGREDIENT = compile_selector("div.ingredient_wrap")
+_OPTIONS = compile_selector("ul.selected-options-ul1")
+_LIST_ITEMS = compile_selector("li")
+_EM = compile_selector("em")
+_LINK = compile_selector("a")
+_BLIND = compile_selector("span.blind")
+_TITLE_LIST = compile_selector("span.title-list")
+_ORIGIN_PRICE = compile_selector("p.origin")
+_SALE_PRICE = compile_selector("p.price")
+_POINT = compile_selector("span.orderTotalPoint")
+_PRICE_DETAIL = compile_selector("p.price-detail")
+_OPTION = compile_selector("div.option")
+
+
+class RankingdakParser(ItemParser):
     def __init__(self, html: str):
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            self._html = soup
+            soup = parse_html(html, parse_only=_KEEP)
 
             if (
-                len(
-                    Lu.filter(
-                        soup.find_all(name="script"), lambda x: "품절" in x.get_text()
-                    )
-                )
+                len(Lu.filter(_SCRIPTS.select(soup), lambda x: "품절" in x.get_text()))
                 > 0
             ):
                 raise NotFoundError("Item is out of stock")
 
-            self._best_review = self._html.find(
-                "form", {"name": "searchBestReviewForm"}
-            )
-            self._prod_review = self._html.find(
-                "form", {"name": "searchProdReviewForm"}
-            )
-            self._best_review_detail = self._html.find(
-                "form", {"name": "bestReviewDetailForm"}
-            )
-            self._ice_box_review = self._html.find("form", {"name": "iceboxReviewForm"})
-            self._product_counsel = self._html.find(
-                "form", {"name": "productCounselForm"}
-            )
-            self._delivery_info = self._html.find(
-                "form", {"name": "productDeliveryInfoForm"}
-            )
-            self._price = self._html.find("div", class_="price-info")
-            self._goods_price = self._html.find("div", class_="goods-price")
-            self._table_items = self._html.find_all("div", class_="table-item")
-
-            if self._product_counsel is None or self._price is None:
+            # Every selector runs once here, properties only read the matched nodes
+            self._product_name = _PRODUCT_NAME.select_one(soup)
+            self._price = _PRICE_INFO.select_one(soup)
+            self._goods_price = _GOODS_PRICE.select_one(soup)
+            self._table_items = _TABLE_ITEMS.select(soup)
+            self._images = _IMAGE.select(soup)
+            self._ingredient = _INGREDIENT.select_one(soup)
+            self._options = _OPTIONS.select_one(soup)
+
+            if self._product_name is None or self._price is None:
                 raise DataParseError("Data not found")
         except DataParseError as e:
             raise e
@@ -68,29 +91,29 @@ class RankingdakParser:
         except Exception as e:
             raise DataParseError(str(e)) from e
 
-    @property
+    @cached_property
     def brand(self):
         for table in self._table_items:
-            if table.find("em").get_text() == "브랜드관":
-                return table.find("a").get_text()
+            if _EM.select_one(table).get_text() == "브랜드관":
+                return _LINK.select_one(table).get_text()
 
         return None
 
-    @property
+    @cached_property
     def name(self):
-        return self._product_counsel.find("input", {"name": "productnm"}).get("value")
+        return self._product_name.get("value")
 
-    @property
+    @cached_property
     def price(self):
-        origin = self._goods_price.find("p", class_="origin")
+        origin = _ORIGIN_PRICE.select_one(self._goods_price)
         origin_price = (
             parse_float(origin.get_text().strip()) if origin is not None else None
         )
 
         sale_price = parse_float(
-            self._goods_price.find("p", class_="price").get_text().strip()
+            _SALE_PRICE.select_one(self._goods_price).get_text().strip()
         )
-        point = self._price.find("span", class_="orderTotalPoint")
+        point = _POINT.select_one(self._price)
         if point is not None:
             point = parse_float(point.get_text())
         else:
@@ -100,32 +123,31 @@ class RankingdakParser:
             original_price=origin_price, price=sale_price, payback_price=point
         )
 
-    @property
+    @cached_property
     def image(self):
-        image_area = self._html.find("div", class_="goods-img-area")
-        images = image_area.find_all("img")
+        images = self._images
 
         if images is not None and len(images) > 0:
             return images[0].get("src")
 
         return None
 
-    @property
+    @cached_property
     def description(self):
-        if data := self._html.find("div", class_="ingredient_wrap"):
+        if data := self._ingredient:
             return data.get_text()
 
         return ""
 
-    @property
+    @cached_property
     def category(self):
         return None
 
-    @property
+    @cached_property
     def delivery(self):
         for table in self._table_items:
-            if table.find("em").get_text() == "배송방법":
-                empty_target = table.find("span", class_="blind")
+            if _EM.select_one(table).get_text() == "배송방법":
+                empty_target = _BLIND.select_one(table)
                 if (
                     empty_target is not None
                     and empty_target.get_text().strip() == "무료배송"
@@ -137,7 +159,7 @@ class RankingdakParser:
                         delivery_type=DeliveryType.STANDARD,
                     )
 
-                lists = table.find("span", class_="title-list")
+                lists = _TITLE_LIST.select_one(table)
                 methods = (
                     Lu.map(
                         lists.get_text().split(","),
@@ -164,11 +186,11 @@ class RankingdakParser:
             delivery_type=DeliveryType.STANDARD,
         )
 
-    @property
+    @cached_property
     def unit(self):
-        detail = self._goods_price.find("p", class_="price-detail")
+        detail = _PRICE_DETAIL.select_one(self._goods_price)
         if detail is None:
-            detail = self._goods_price.find("div", class_="option")
+            detail = _OPTION.select_one(self._goods_price)
             if detail is None:
                 return ItemUnitData(price=self.price.price)
 
@@ -190,12 +212,11 @@ class RankingdakParser:
             total_price=self.price.price,
         )
 
-    @property
+    @cached_property
     def options(self):
-        list = self._html.find("ul", class_="selected-options-ul1")
-        if list is None:
+        if self._options is None:
             return None
-        items = list.find_all("li")
+        items = _LIST_ITEMS.select(self._options)
         return Lu.map(
             items,
             lambda x: ItemOptionData(
@@ -205,6 +226,6 @@ class RankingdakParser:
             ),
         )
 
-    @property
+    @cached_property
     def inventory_status(self):
         return InventoryStatus.IN_STOCK
@@ -0,0 +1,261 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from custom_components.price_tracker.utilities.retry import (
+    CircuitState,
+    circuit_breakers,
+)
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequest,
+    SafeRequestMethod,
+    SafeRequestResponseData,
+)
+from custom_components.price_tracker.utilities.user_agent import user_agents
+from custom_components.price_tracker.utilities.utils import random_choice
+
+_MAX_AGE = 1800  # seconds a warmed-up context is reused
+_MAX_USES = 200  # product requests per context
+_MIN_WARM_UP_INTERVAL = 30  # seconds, doubled with every block in a row
+_MAX_WARM_UP_INTERVAL = 900  # seconds
+_BLOCKED_STATUS_CODES = (403, 429)
+
+
+def _nnb() -> str:
+    return (
+        "PPYXCWKWXC"
+        + random_choice(["A", "B", "C", "D", "X"])
+        + random_choice(["A", "B", "C", "D", "E"])
+        + random_choice(["A", "B", "C", "D", "E", "F"])
+    )
+
+
+def _pageview() -> dict:
+    return {
+        "corp": "naver",
+        "usr": {},
+        "location": "korea_real/korea",
+        "send_ts": datetime.now().timestamp(),
+        "svc": "shopping",
+        "svc_tags": {},
+        "evts": [
+            {
+                "page_url": "https://shopping.naver.com/ns/home",
+                "page_ref": "",
+                "page_id": "08827299cfd39834e5badb487db19f8b",
+                "timing": {
+                    "type": "navigate",
+                    "unloadEventStart": 0,
+                    "unloadEventEnd": 0,
+                    "redirectStart": 0,
+                    "redirectEnd": 0,
+                    "workerStart": 0,
+                    "fetchStart": 6.700000286102295,
+                    "domainLookupStart": 8.200000286102295,
+                    "domainLookupEnd": 9.400000095367432,
+                    "connectStart": 9.400000095367432,
+                    "secureConnectionStart": 23.90000009536743,
+                    "connectEnd": 35.59999990463257,
+                    "requestStart": 35.700000286102295,
+                    "responseStart": 77.5,
+                    "responseEnd": 87.59999990463257,
+                    "domInteractive": 319.59999990463257,
+                    "domContentLoadedEventStart": 634.2000002861023,
+                    "domContentLoadedEventEnd": 634.2000002861023,
+                    "domComplete": 0,
+                    "loadEventStart": 0,
+                    "loadEventEnd": 0,
+                    "first_paint": 278.59999990463257,
+                    "first_contentful_paint": 278.59999990463257,
+                },
+                "type": "pageview",
+                "page_sti": "shopping",
+                "shp_action_uid": "",
+                "env": {"device_type": "PC Web"},
+                "shp_pagekey": "100410625",
+                "shp": {"contents": {}},
+                "evt_ts": datetime.now().timestamp(),
+            }
+        ],
+        "env": {
+            "os": "MacIntel",
+            "br_ln": "en-US",
+            "br_sr": "1920x1080",
+            "device_sr": "1920x1080",
+            "platform_type": "web",
+            "ch_arch": "arm",
+            "ch_mdl": "",
+            "ch_mob": False,
+            "ch_pltf": "macOS",
+            "ch_ptlfv": "13.1.0",
+            "timezone": "Asia/Seoul",
+            "ch_fvls": [
+                {
+                    "brand": "Google Chrome",
+                    "version": "131.0.6778.267",
+                },
+                {"brand": "Chromium", "version": "131.0.6778.267"},
+                {"brand": "Not_A Brand", "version": "24.0.0.0"},
+            ],
+        },
+        "tool": {
+            "name": "ntm-web",
+            "ver": "nlogLibVersion=v0.1.40; verName=v2.0.7; ntmVersion=v1.4.1",
+        },
+    }
+
+
+class SmartstoreBrowsingContext:
+    """One warmed-up visit of Naver shopping, shared by every Smartstore product fetch.
+
+    The warm-up (shopping home, the search frame and its pageview log) runs once, and
+    its cookies, a stable NNB and the user agent it was made with are carried over to
+    every product request after it. The context is warmed up again once it is older than
+    ``max_age`` seconds, has served ``max_uses`` product requests, or the store answered
+    a product request with 403 or 429. Requests that got no answer at all (transport
+    errors, an open circuit) leave the context as it is.
+
+    Warm-ups are at least ``min_warm_up_interval`` seconds apart, doubled with every
+    block in a row, and are skipped while the circuit of the product host is not
+    closed. Until the next warm-up is due, product requests go on with the cookies
+    they have.
+    """
+
+    def __init__(
+        self,
+        max_age: float = _MAX_AGE,
+        max_uses: int = _MAX_USES,
+        min_warm_up_interval: float = _MIN_WARM_UP_INTERVAL,
+    ):
+        self._max_age = max_age
+        self._max_uses = max_uses
+        self._min_warm_up_interval = min_warm_up_interval
+        self._cookies: dict = {}
+        self._user_agent: Optional[str] = None
+        self._warmed_at: Optional[float] = None
+        self._warm_up_started_at: Optional[float] = None
+        self._uses = 0
+        self._blocks_in_row = 0
+        self._lock: asyncio.Lock | None = None
+
+        # Metrics
+        self._warm_ups = 0
+        self._blocks = 0
+
+    @property
+    def is_usable(self) -> bool:
+        return (
+            self._warmed_at is not None
+            and time.monotonic() - self._warmed_at < self._max_age
+            and self._uses < self._max_uses
+        )
+
+    def _may_warm_up(self, url: str) -> bool:
+        if circuit_breakers().get(url).state != CircuitState.CLOSED:
+            # Warm-up calls would only add to the blocks, the circuit probes first
+            return False
+
+        if self._warm_up_started_at is None:
+            return True
+
+        interval = min(
+            self._min_warm_up_interval * 2 ** max(self._blocks_in_row - 1, 0),
+            _MAX_WARM_UP_INTERVAL,
+        )
+
+        return time.monotonic() - self._warm_up_started_at >= interval
+
+    async def enter(
+        self, request_factory: Callable[[], SafeRequest], url: str
+    ) -> SafeRequest:
+        """A request from ``request_factory`` carrying the user agent and cookies.
+
+        ``url`` is the product about to be requested, its host's circuit decides whether
+        the context may be warmed up.
+        """
+        if not self.is_usable and self._may_warm_up(url):
+            if self._lock is None:
+                self._lock = asyncio.Lock()
+
+            async with self._lock:
+                if not self.is_usable and self._may_warm_up(url):
+                    await self._warm_up(request_factory())
+
+        self._uses += 1
+        request = request_factory()
+        request.user_agent(self._user_agent)
+        request.cookie(item=self._cookies)
+
+        return request
+
+    def leave(self, request: SafeRequest, response: SafeRequestResponseData):
+        """Keep the cookies of a product request, or drop a blocked context."""
+        status_code = request.last_status_code
+
+        if status_code in _BLOCKED_STATUS_CODES:
+            self.invalidate()
+            self._blocks += 1
+            self._blocks_in_row += 1
+            return
+
+        if status_code is None:
+            # No answer, nothing is known about the context
+            return
+
+        self._blocks_in_row = 0
+        self._cookies = {**self._cookies, **request.cookies}
+
+    def invalidate(self):
+        self._warmed_at = None
+
+    async def _warm_up(self, request: SafeRequest):
+        self._warm_up_started_at = time.monotonic()
+        self._user_agent = await user_agents().async_random(["pc", "mobile"])
+        request.user_agent(self._user_agent)
+
+        await request.request(
+            method=SafeRequestMethod.GET,
+            url="https://shopping.naver.com/ns/home",
+            max_tries=1,
+        )
+        await request.request(
+            method=SafeRequestMethod.GET,
+            url="https://msearch.shopping.naver.com/remote_frame.html",
+            max_tries=3,
+        )
+        await request.request(
+            method=SafeRequestMethod.POST,
+            url="https://nlog.naver.com/n",
+            max_tries=3,
+            data=_pageview(),
+        )
+
+        self._cookies = {"NNB": _nnb(), **request.cookies}
+        self._warmed_at = time.monotonic()
+        self._uses = 0
+        self._warm_ups += 1
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "warm_ups": self._warm_ups,
+            "blocks": self._blocks,
+            "uses": self._uses,
+            "age": time.monotonic() - self._warmed_at
+            if self._warmed_at is not None
+            else None,
+        }
+
+
+_CONTEXTS: dict[tuple, SmartstoreBrowsingContext] = {}
+
+
+def browsing_context(proxies: Optional[list] = None) -> SmartstoreBrowsingContext:
+    """The context of everything fetched through ``proxies``."""
+    key = tuple(proxies) if isinstance(proxies, list) else (proxies,)
+
+    if key not in _CONTEXTS:
+        _CONTEXTS[key] = SmartstoreBrowsingContext()
+
+    return _CONTEXTS[key]
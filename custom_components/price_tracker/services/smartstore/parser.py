@@ -1,13 +1,13 @@
 import datetime
 import json
 import re
-
-from bs4 import BeautifulSoup
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import (
     DataParseError,
     NotFoundError,
 )
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
     DeliveryType,
@@ -18,22 +18,42 @@ from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.parser import (
+    ScriptJsonExtractor,
+    compile_selector,
+    html_strainer,
+    parse_html,
+)
+
+PRELOADED_STATE_MARKER = "window.__PRELOADED_STATE__="
+
+_KEEP = html_strainer(names=("script",))
+_SCRIPTS = compile_selector("script")
+
+
+def preloaded_state_reader():
+    """Stream predicate for SafeRequest, stops the download after the state script."""
+    return ScriptJsonExtractor(PRELOADED_STATE_MARKER).feed
+
+
+def preloaded_state_prefix(text: str | None) -> str | None:
+    """The page through the state script, what a streamed read always gets the same."""
+    if not text:
+        return None
 
+    return ScriptJsonExtractor.prefix(text, PRELOADED_STATE_MARKER)
 
-class SmartstoreParser:
+
+class SmartstoreParser(ItemParser):
     def __init__(self, data: str):
         self._html = data
         self._data = None
         try:
-            soup = BeautifulSoup(self._html, "html.parser")
-            scripts = soup.find_all("script")
-            for script in scripts:
-                if "window.__PRELOADED_STATE__" in script.text:
-                    data = re.search(
-                        r"window.__PRELOADED_STATE__=(?P<json>.*)", script.text
-                    )
-                    self._data = json.loads(data["json"])
-                    break
+            self._data = ScriptJsonExtractor.extract(self._html, PRELOADED_STATE_MARKER)
+
+            if self._data is None:
+                # Markup variant the scanner does not know (e.g. spaces around "=")
+                self._data = self.parse_state_with_soup(self._html)
 
             if self._data is None:
                 raise DataParseError(
@@ -55,42 +75,55 @@ class SmartstoreParser:
         except Exception as e:
             raise DataParseError("NAVER Response Parse Error - Unknown") from e
 
-    @property
+    @staticmethod
+    def parse_state_with_soup(html: str) -> dict | None:
+        soup = parse_html(html, parse_only=_KEEP)
+        scripts = _SCRIPTS.select(soup)
+        for script in scripts:
+            if "window.__PRELOADED_STATE__" in script.text:
+                data = re.search(
+                    r"window.__PRELOADED_STATE__\s*=\s*(?P<json>.*)", script.text
+                )
+                return json.loads(data["json"])
+
+        return None
+
+    @cached_property
     def brand(self):
         return Lu.get(
             self._data["product"]["A"]["naverShoppingSearchInfo"], "brandName"
         )
 
-    @property
+    @cached_property
     def category(self):
         return ItemCategoryData(
             self._data["product"]["A"]["category"]["wholeCategoryName"]
         )
 
-    @property
+    @cached_property
     def description(self):
         return Lu.get(self._data, "product.A.description.detailContentText")
 
-    @property
+    @cached_property
     def image(self):
         return self._data["product"]["A"]["representImage"]["url"]
 
-    @property
+    @cached_property
     def url(self):
         return self._data["product"]["A"]["productUrl"]
 
-    @property
+    @cached_property
     def name(self):
         return self._data["product"]["A"]["name"]
 
-    @property
+    @cached_property
     def inventory_status(self):
         return InventoryStatus.of(
             True if Lu.get(self._data, "product.A.stockQuantity", 1) == 0 else False,
             stock=self._data["product"]["A"]["stockQuantity"],
         )
 
-    @property
+    @cached_property
     def options(self):
         options = []
         if "optionCombinations" in self._data["product"]["A"]:
@@ -106,7 +139,7 @@ class SmartstoreParser:
 
         return options
 
-    @property
+    @cached_property
     def price(self):
         sale_price = self._data["product"]["A"]["discountedSalePrice"]
         original_price = self._data["product"]["A"]["salePrice"]
@@ -138,7 +171,7 @@ class SmartstoreParser:
             currency="KRW",
         )
 
-    @property
+    @cached_property
     def delivery(self):
         delivery_info = self._data["product"]["A"]["productDeliveryInfo"]
         base_fee = Lu.get(delivery_info, "baseFee")
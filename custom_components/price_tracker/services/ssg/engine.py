@@ -42,6 +42,7 @@ class SsgEngine(PriceEngine):
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
             proxies=self._proxy,
+            rate_limit_key=self.engine_code(),
         )
 
         response = await request.request(
@@ -64,12 +65,16 @@ class SsgEngine(PriceEngine):
                 status=ItemStatus.DELETED,
             )
 
+        unchanged = self.unchanged_item(response)
+        if unchanged is not None:
+            return unchanged
+
         logging_for_response(text, __name__, "ssg")
 
         try:
-            ssg_parser = SsgParser(text)
+            ssg_parser = SsgParser(text).extract()
 
-            return ItemData(
+            item = ItemData(
                 id=self.product_id,
                 brand=ssg_parser.brand,
                 name=ssg_parser.name,
@@ -82,6 +87,8 @@ class SsgEngine(PriceEngine):
                 delivery=ssg_parser.delivery,
                 unit=ssg_parser.unit,
             )
+
+            return self.remember_item(response, item)
         except NotFoundError:
             return ItemData(
                 id=self.id_str(),
@@ -1,10 +1,12 @@
 import json
 import re
+from functools import cached_property
 
 from custom_components.price_tracker.components.error import (
     DataParseError,
     NotFoundError,
 )
+from custom_components.price_tracker.components.parser import ItemParser
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
     DeliveryData,
@@ -22,7 +24,7 @@ from custom_components.price_tracker.utilities.parser import (
 )
 
 
-class SsgParser:
+class SsgParser(ItemParser):
     _data: dict
     _item: dict
 
@@ -43,43 +45,43 @@ class SsgParser:
         except Exception as e:
             raise DataParseError("Failed to parse response") from e
 
-    @property
+    @cached_property
     def price(self):
         price = parse_float(Lu.get_or_default(self._item, "price.sellprc", 0))
         best_price = parse_float(Lu.get_or_default(self._item, "price.bestAmt", price))
         return ItemPriceData(original_price=price, price=best_price, currency="KRW")
 
-    @property
+    @cached_property
     def inventory_status(self):
         return InventoryStatus.of(
             parse_bool(self._item["itemBuyInfo"]["soldOut"]),
             parse_number(Lu.get(self._item, "usablInvQty")),
         )
 
-    @property
+    @cached_property
     def brand(self):
         return self._item["brand"]["brandNm"] if "brand" in self._item else None
 
-    @property
+    @cached_property
     def name(self):
         return self._item["itemNm"]
 
-    @property
+    @cached_property
     def description(self):
         return ""
 
-    @property
+    @cached_property
     def url(self):
         return f"https://emart.ssg.com/item/itemView.ssg?itemId={self._item['itemId']}&siteNo={self._item['siteNo']}"
 
-    @property
+    @cached_property
     def image(self):
         if len(self._item["uitemImgList"]) < 1:
             return None
 
         return self._item["uitemImgList"][0]["imgUrl"]
 
-    @property
+    @cached_property
     def category(self):
         if Lu.has(self._data, "itemDispCtgList") is False:
             return ItemCategoryData(self._item["ctgNm"])
@@ -88,7 +90,7 @@ class SsgParser:
             Lu.map(self._data["itemDispCtgList"], lambda x: x["dispCtgNm"])
         )
 
-    @property
+    @cached_property
     def unit(self):
         if "sellUnitPrc" in self._item["price"]:
             unit_data = re.search(
@@ -111,7 +113,7 @@ class SsgParser:
 
         return unit
 
-    @property
+    @cached_property
     def delivery(self):
         if Lu.has(self._item, "rightBadgeList") is True:
             if Lu.find(self._item["rightBadgeList"], "txt", "쓱-배송") is not None:
@@ -0,0 +1,294 @@
+import asyncio
+import hashlib
+import logging
+import time
+from http.cookiejar import http2time
+from typing import Optional
+from urllib.parse import urlparse
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.price_tracker.consts.defaults import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORAGE_VERSION = 1
+_STORAGE_KEY = DOMAIN + ".cookies.{}"
+_SAVE_DELAY = 30  # seconds changes are batched before a jar is written back
+_SESSION_COOKIE_MAX_AGE = 86400  # seconds a cookie without expiry is kept
+_MAX_COOKIES = 200  # per jar, the ones expiring first are dropped beyond it
+
+
+class _StoreCookie:
+    __slots__ = ("name", "value", "domain", "host_only", "path", "expires", "secure")
+
+    def __init__(
+        self,
+        name: str,
+        value: str,
+        domain: str,
+        host_only: bool,
+        path: str,
+        expires: float,
+        secure: bool,
+    ):
+        self.name = name
+        self.value = value
+        self.domain = domain
+        self.host_only = host_only
+        self.path = path
+        self.expires = expires  # epoch seconds
+        self.secure = secure
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return self.domain, self.path, self.name
+
+    def matches(self, scheme: str, host: str, path: str, now: float) -> bool:
+        if self.expires <= now or (self.secure and scheme != "https"):
+            return False
+
+        if self.host_only:
+            if host != self.domain:
+                return False
+        elif host != self.domain and not host.endswith("." + self.domain):
+            return False
+
+        return (
+            path == self.path
+            or path.startswith(self.path.rstrip("/") + "/")
+            or self.path == "/"
+        )
+
+    def dict(self) -> dict:
+        return {x: getattr(self, x) for x in self.__slots__}
+
+
+def _parse_set_cookie(header: str) -> Optional[tuple[str, str, dict]]:
+    """Name, value and lower-cased attributes of one Set-Cookie header."""
+    pair, *parts = header.split(";")
+    name, separator, value = pair.partition("=")
+
+    if separator == "" or name.strip() == "":
+        return None
+
+    attributes = {}
+    for part in parts:
+        key, _, attribute = part.partition("=")
+        attributes[key.strip().lower()] = attribute.strip()
+
+    return name.strip(), value.strip().strip('"'), attributes
+
+
+def _default_path(path: str) -> str:
+    if not path.startswith("/") or path.count("/") <= 1:
+        return "/"
+
+    return path[: path.rindex("/")]
+
+
+class StoreCookieJar:
+    """Cookies one store set, shared by every request of the store.
+
+    Cookies follow their Domain, Path, Secure, Expires and Max-Age attributes; cookies
+    without an expiry are kept for a day since they were last set.
+    """
+
+    def __init__(self, cookies: list[dict] = None):
+        self._cookies: dict[tuple[str, str, str], _StoreCookie] = {}
+
+        for data in cookies if cookies is not None else []:
+            try:
+                cookie = _StoreCookie(**data)
+                self._cookies[cookie.key] = cookie
+            except TypeError:
+                continue
+
+    @property
+    def size(self) -> int:
+        return len(self._cookies)
+
+    def cookies_for(self, url: str) -> dict:
+        """Name and value of every cookie the store would get with ``url``."""
+        if len(self._cookies) == 0:
+            return {}
+
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        path = parsed.path or "/"
+        now = time.time()
+        cookies = {}
+
+        # Longer paths first, like browsers send them
+        for cookie in sorted(
+            self._cookies.values(), key=lambda x: len(x.path), reverse=True
+        ):
+            if cookie.name not in cookies and cookie.matches(
+                parsed.scheme, host, path, now
+            ):
+                cookies[cookie.name] = cookie.value
+
+        return cookies
+
+    def update(self, url: str, set_cookies: list[str]) -> bool:
+        """Apply the Set-Cookie headers of a response to ``url``, True if anything changed."""
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        now = time.time()
+        changed = False
+
+        for header in set_cookies:
+            parsed_cookie = _parse_set_cookie(header)
+            if parsed_cookie is None:
+                continue
+
+            name, value, attributes = parsed_cookie
+            domain = attributes.get("domain", "").lstrip(".").lower()
+            # Cookies for another site than the one answering are ignored
+            if domain != "" and host != domain and not host.endswith("." + domain):
+                continue
+
+            expires = now + _SESSION_COOKIE_MAX_AGE
+            if "max-age" in attributes:
+                try:
+                    expires = now + int(attributes["max-age"])
+                except ValueError:
+                    pass
+            elif http2time(attributes.get("expires", "")) is not None:
+                expires = http2time(attributes["expires"])
+
+            cookie = _StoreCookie(
+                name=name,
+                value=value,
+                domain=domain if domain != "" else host,
+                host_only=domain == "",
+                path=attributes["path"]
+                if attributes.get("path", "").startswith("/")
+                else _default_path(parsed.path),
+                expires=expires,
+                secure="secure" in attributes,
+            )
+            current = self._cookies.get(cookie.key)
+
+            if cookie.expires <= now:
+                changed = self._cookies.pop(cookie.key, None) is not None or changed
+            elif (
+                current is None
+                or current.value != cookie.value
+                # A refreshed expiry alone is only written back once it moved enough
+                or abs(current.expires - cookie.expires) > _SESSION_COOKIE_MAX_AGE / 2
+            ):
+                self._cookies[cookie.key] = cookie
+                changed = True
+
+        if changed and len(self._cookies) > _MAX_COOKIES:
+            for cookie in sorted(self._cookies.values(), key=lambda x: x.expires)[
+                : len(self._cookies) - _MAX_COOKIES
+            ]:
+                self._cookies.pop(cookie.key)
+
+        return changed
+
+    def clear(self):
+        self._cookies = {}
+
+    def dict(self) -> dict:
+        now = time.time()
+
+        return {
+            "cookies": [x.dict() for x in self._cookies.values() if x.expires > now]
+        }
+
+
+def _storage_name(key: tuple) -> str:
+    store, proxy, scope = key
+
+    if proxy is None and scope is None:
+        return store
+
+    # Proxy URLs may carry credentials, they never end up in a file name
+    return "{}.{}".format(
+        store, hashlib.sha256(repr((proxy, scope)).encode()).hexdigest()[:16]
+    )
+
+
+class CookieJarRegistry:
+    """Cookie jars of every store, keyed by engine code, proxy and scope.
+
+    Like the sessions and the browsing contexts, a jar belongs to one store as seen
+    through one proxy, so cookies a store handed to one exit address are never replayed
+    through another. Stores that log in a device or an account pass it as ``scope`` and
+    get a jar of its own per device.
+
+    Without Home Assistant the jars only live in memory. Once set up with ``hass`` every
+    jar is loaded from its own storage file the first time the store is requested, and
+    written back ``_SAVE_DELAY`` seconds after it changed, batching the changes of every
+    request in between.
+    """
+
+    def __init__(self):
+        self._hass: Optional[HomeAssistant] = None
+        self._jars: dict[tuple, StoreCookieJar] = {}
+        self._stores: dict[tuple, Store] = {}
+        self._lock: asyncio.Lock | None = None
+
+    def setup(self, hass: HomeAssistant):
+        if self._hass is not hass:
+            self._hass = hass
+            self._jars = {}
+            self._stores = {}
+            self._lock = None
+
+    async def async_jar(
+        self, store: str, proxy: Optional[str] = None, scope: Optional[str] = None
+    ) -> StoreCookieJar:
+        key = (store, proxy, scope)
+        jar = self._jars.get(key)
+        if jar is not None:
+            return jar
+
+        if self._hass is None:
+            return self._jars.setdefault(key, StoreCookieJar())
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if key not in self._jars:
+                storage = Store(
+                    self._hass,
+                    _STORAGE_VERSION,
+                    _STORAGE_KEY.format(_storage_name(key)),
+                )
+
+                try:
+                    data = await storage.async_load()
+                except Exception as e:
+                    _LOGGER.warning("Cookies of %s could not be loaded: %s", store, e)
+                    data = None
+
+                self._stores[key] = storage
+                self._jars[key] = StoreCookieJar(
+                    data.get("cookies") if isinstance(data, dict) else None
+                )
+
+        return self._jars[key]
+
+    def changed(
+        self, store: str, proxy: Optional[str] = None, scope: Optional[str] = None
+    ):
+        """Schedule writing back the jar of ``store`` through ``proxy``."""
+        key = (store, proxy, scope)
+        storage = self._stores.get(key)
+        jar = self._jars.get(key)
+
+        if storage is not None and jar is not None:
+            storage.async_delay_save(jar.dict, _SAVE_DELAY)
+
+
+_COOKIE_JARS = CookieJarRegistry()
+
+
+def cookie_jars() -> CookieJarRegistry:
+    return _COOKIE_JARS
@@ -11,3 +11,10 @@ def md5(value: str):
     target = hashlib.md5()
     target.update(value.encode("utf-8"))
     return target.hexdigest()
+
+
+def fingerprint(value: str | bytes) -> str:
+    """Short non-cryptographic-purpose digest for change detection of large payloads."""
+    target = hashlib.blake2b(digest_size=16)
+    target.update(value.encode("utf-8") if isinstance(value, str) else value)
+    return target.hexdigest()
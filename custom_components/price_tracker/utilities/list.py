@@ -1,21 +1,70 @@
 from copy import deepcopy
 
 
+class JsonPath:
+    """Dotted key path (e.g. "entity.title.0.text") split once, reusable on any payload.
+
+    Follows the same rules as ``Lu.get``: numeric parts index lists, everything else is
+    a dict key, and a missing step yields the default.
+    """
+
+    __slots__ = ("path", "_steps")
+
+    def __init__(self, path: str):
+        self.path = path
+        self._steps = tuple(
+            (key, int(key) if key.isnumeric() else None) for key in path.split(".")
+        )
+
+    def get(self, target: any, default_value: any = None):
+        for key, index in self._steps:
+            if index is not None and isinstance(target, list):
+                if len(target) > index:
+                    target = target[index]
+                    continue
+                return default_value
+
+            if isinstance(target, dict) and key in target:
+                target = target[key]
+                continue
+
+            return default_value
+
+        return target
+
+    def __repr__(self):
+        return "JsonPath({})".format(self.path)
+
+
 class Lu:
     @staticmethod
     def first(target: [any], defValue: any = None):
         return target[0] if len(target) > 0 else defValue
 
     @staticmethod
-    def find(target: [any], key: str, value: any, defaultValue: any = None):
+    def find(target: [any], key: str | JsonPath, value: any, defaultValue: any = None):
         return next((x for x in target if Lu.get(x, key) == value), defaultValue)
 
+    @staticmethod
+    def index(target: [any], key: str | JsonPath) -> dict:
+        """Map the value at ``key`` to its first item in one pass, for repeated finds."""
+        path = key if isinstance(key, JsonPath) else JsonPath(key)
+        index = {}
+
+        for x in target if target is not None else []:
+            index.setdefault(path.get(x), x)
+
+        return index
+
     @staticmethod
     def find_by(target: [any], key: str, func):
         return next((x for x in target if func(x[key]) is True), None)
 
     @staticmethod
-    def get(target: [any], key: str | int, default_value: any = None):
+    def get(target: [any], key: str | int | JsonPath, default_value: any = None):
+        if isinstance(key, JsonPath):
+            return key.get(target, default_value)
+
         if isinstance(key, int):
             return target[key]
 
@@ -1,4 +1,12 @@
-from bs4 import BeautifulSoup
+import json
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+# Tree builders in order of preference; lxml is optional, html.parser always works
+_HTML_BACKENDS = ("lxml", "html.parser")
+_HTML_BACKEND: str | None = None
 
 
 def parse_bool(value: any) -> bool:
@@ -67,8 +75,70 @@ def parse_number(value: any) -> int:
         return 0
 
 
-def parse_html(text: str):
-    return BeautifulSoup(text, "html.parser")
+def html_backend() -> str:
+    """The fastest installed BeautifulSoup tree builder."""
+    global _HTML_BACKEND
+
+    if _HTML_BACKEND is None:
+        _HTML_BACKEND = next(
+            x for x in _HTML_BACKENDS if builder_registry.lookup(x) is not None
+        )
+
+    return _HTML_BACKEND
+
+
+def set_html_backend(backend: str | None):
+    """Force a tree builder (e.g. "html.parser"), None goes back to auto-detection."""
+    global _HTML_BACKEND
+
+    if backend is not None and builder_registry.lookup(backend) is None:
+        raise ValueError("HTML backend {} is not installed".format(backend))
+
+    _HTML_BACKEND = backend
+
+
+def parse_html(
+    text: str, backend: str | None = None, parse_only: SoupStrainer | None = None
+) -> BeautifulSoup:
+    return BeautifulSoup(
+        text,
+        backend if backend is not None else html_backend(),
+        parse_only=parse_only,
+    )
+
+
+def html_strainer(
+    names: tuple[str, ...] = (),
+    classes: tuple[str, ...] = (),
+    attrs: dict[str, str] | None = None,
+) -> SoupStrainer:
+    """Keep only the subtrees a parser reads, matched by tag name, class or attribute.
+
+    Building the tree is most of the cost of parsing a product page, so dropping the
+    rest of the markup while parsing beats any selector tuning afterwards.
+    """
+    names = frozenset(names)
+    classes = frozenset(classes)
+    attrs = attrs if attrs is not None else {}
+
+    def _keep(name: str, tag_attrs: dict) -> bool:
+        if name in names:
+            return True
+
+        value = tag_attrs.get("class")
+        if value and not classes.isdisjoint(
+            value.split() if isinstance(value, str) else value
+        ):
+            return True
+
+        return any(tag_attrs.get(key) == expected for key, expected in attrs.items())
+
+    return SoupStrainer(_keep)
+
+
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once, at import time of the parser using it."""
+    return soupsieve.compile(selector)
 
 
 def parse_engine_id(item: any) -> str:
@@ -76,3 +146,97 @@ def parse_engine_id(item: any) -> str:
         return "_".join(item.values())
 
     return str(item)
+
+
+class ScriptJsonExtractor:
+    """Pulls the JSON assigned after ``marker`` out of raw HTML without building a DOM.
+
+    Text can be fed in chunks while it is downloaded; ``feed`` returns True once the
+    script holding the marker has been closed, so the rest of the body can be skipped.
+    """
+
+    _END = "</script"
+
+    def __init__(self, marker: str):
+        self._marker = marker
+        self._parts: list[str] = []
+        self._size = 0
+        self._carry = ""
+        self._start: int | None = None
+        self._done = False
+
+    @property
+    def found(self) -> bool:
+        return self._start is not None
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    @property
+    def text(self) -> str:
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+
+        return self._parts[0] if len(self._parts) > 0 else ""
+
+    def feed(self, chunk: str) -> bool:
+        if self._done or chunk == "":
+            return self._done
+
+        self._parts.append(chunk)
+        self._size += len(chunk)
+        window = self._carry + chunk
+        offset = self._size - len(window)
+
+        if self._start is None:
+            index = window.find(self._marker)
+            if index < 0:
+                self._carry = window[-(len(self._marker) - 1) :]
+                return False
+
+            self._start = offset + index + len(self._marker)
+            window = window[index + len(self._marker) :]
+
+        if window.find(self._END) >= 0:
+            self._done = True
+        else:
+            self._carry = window[-(len(self._END) - 1) :]
+
+        return self._done
+
+    def value(self) -> any:
+        """The decoded JSON, None when the marker never showed up."""
+        if self._start is None:
+            return None
+
+        text = self.text
+        start = self._start
+        while start < len(text) and text[start].isspace():
+            start += 1
+
+        value, _ = json.JSONDecoder().raw_decode(text, start)
+
+        return value
+
+    @staticmethod
+    def prefix(text: str, marker: str) -> str | None:
+        """``text`` up to the end of the script holding ``marker``, None when unclosed.
+
+        A streamed body stops at whatever chunk closed the script; cut there, the same
+        page always gives the same prefix.
+        """
+        start = text.find(marker)
+        if start < 0:
+            return None
+
+        end = text.find(ScriptJsonExtractor._END, start + len(marker))
+
+        return text[:end] if end >= 0 else None
+
+    @staticmethod
+    def extract(text: str, marker: str) -> any:
+        extractor = ScriptJsonExtractor(marker)
+        extractor.feed(text)
+
+        return extractor.value()
@@ -0,0 +1,136 @@
+import asyncio
+import time
+
+# Requests per second and burst size per store (engine code); anything else falls back
+# to _DEFAULT_RATE_LIMIT and is keyed by host.
+_DEFAULT_RATE_LIMIT = (5.0, 10)
+_STORE_RATE_LIMITS = {
+    "smartstore": (1.0, 3),
+    "coupang": (2.0, 4),
+    "oliveyoung": (2.0, 4),
+}
+
+
+class TokenBucket:
+    """Async FIFO token bucket."""
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+
+        # Metrics
+        self._waiting = 0
+        self._acquired = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        return self._burst
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    def configure(self, rate: float, burst: int):
+        self._refill()
+        self._rate = rate
+        self._burst = burst
+        self._tokens = min(self._tokens, float(burst))
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            float(self._burst), self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """Wait for a token, returns the time spent waiting."""
+        if self._rate <= 0:
+            return 0.0
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        started_at = time.monotonic()
+        self._waiting += 1
+
+        try:
+            async with self._lock:
+                self._refill()
+
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+                    self._refill()
+
+                self._tokens -= 1
+        finally:
+            self._waiting -= 1
+
+        waited = time.monotonic() - started_at
+        self._acquired += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+
+        return waited
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "rate": self._rate,
+            "burst": self._burst,
+            "queue_depth": self._waiting,
+            "acquired": self._acquired,
+            "total_wait": self._total_wait,
+            "average_wait": self._total_wait / self._acquired
+            if self._acquired > 0
+            else 0.0,
+            "max_wait": self._max_wait,
+        }
+
+
+class RateLimiterRegistry:
+    """Token buckets shared by every engine, keyed by engine code or host."""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[float, int]] = None,
+        default: tuple[float, int] = _DEFAULT_RATE_LIMIT,
+    ):
+        self._limits = dict(limits if limits is not None else _STORE_RATE_LIMITS)
+        self._default = default
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def configure(self, key: str, rate: float, burst: int):
+        self._limits[key] = (rate, burst)
+
+        if key in self._buckets:
+            self._buckets[key].configure(rate, burst)
+
+    def get(self, key: str) -> TokenBucket:
+        if key not in self._buckets:
+            rate, burst = self._limits.get(key, self._default)
+            self._buckets[key] = TokenBucket(rate=rate, burst=burst)
+
+        return self._buckets[key]
+
+    async def acquire(self, key: str) -> float:
+        return await self.get(key).acquire()
+
+    def metrics(self) -> dict[str, dict]:
+        return {key: bucket.metrics for key, bucket in self._buckets.items()}
+
+
+_RATE_LIMITERS = RateLimiterRegistry()
+
+
+def rate_limiters() -> RateLimiterRegistry:
+    return _RATE_LIMITERS
@@ -0,0 +1,213 @@
+import json
+import os
+import re
+from typing import Callable, Optional
+
+from curl_cffi import requests
+
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequestEngine,
+    SafeRequestMethod,
+    SafeRequestResponseData,
+    SafeRequestStatusError,
+)
+
+MANIFEST = "manifest.json"
+_CHUNK_SIZE = 16384
+_NO_RECORDING_STATUS = 501
+
+
+class SafeRequestRecording:
+    """One recorded exchange; ``url`` is a regular expression matched in full."""
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status_code: int = 200,
+        body: str = "",
+        headers: Optional[dict] = None,
+    ):
+        self.method = method.upper()
+        self.url = url
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers if headers is not None else {}
+        self._pattern = re.compile(url)
+
+    def matches(self, method: SafeRequestMethod, url: str) -> bool:
+        return self.method == method.name and self._pattern.fullmatch(url) is not None
+
+
+def load_recordings(directory: str) -> tuple[dict, list[SafeRequestRecording]]:
+    """Read a recorded corpus directory, returns its manifest and its recordings.
+
+    ``manifest.json`` lists the exchanges under ``responses``; a ``body`` naming a file
+    of the directory is read from it, anything else is used as the body itself.
+    """
+    with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    recordings = []
+    for response in manifest.get("responses", []):
+        body = response.get("body", "")
+        path = os.path.join(directory, body)
+        if body != "" and os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                body = f.read()
+
+        recordings.append(
+            SafeRequestRecording(
+                method=response.get("method", "GET"),
+                url=response["url"],
+                status_code=response.get("status", 200),
+                body=body,
+                headers=response.get("headers"),
+            )
+        )
+
+    return manifest, recordings
+
+
+class SafeRequestEngineReplay(SafeRequestEngine):
+    """Answers requests from recordings instead of the network.
+
+    The first recording matching method and URL answers. Streamed reads get the body
+    in chunks like the curl-cffi engine would, so ``read_until`` stops them early too.
+    A request without recording fails with a non-retryable status error.
+    """
+
+    def __init__(
+        self, recordings: list[SafeRequestRecording], chunk_size: int = _CHUNK_SIZE
+    ):
+        self._recordings = recordings
+        self._chunk_size = chunk_size
+
+    async def request(
+        self,
+        method: SafeRequestMethod,
+        url: str,
+        data: dict,
+        proxy: str,
+        timeout: int,
+        session: requests.AsyncSession,
+        headers: Optional[dict] = None,
+        cookies: Optional[dict] = None,
+        read_until: Optional[Callable[[str], bool]] = None,
+    ) -> SafeRequestResponseData:
+        recording = next(
+            (x for x in self._recordings if x.matches(method, url)),
+            None,
+        )
+
+        if recording is None:
+            raise SafeRequestStatusError(
+                f"No recording for {method.name} {url}",
+                status_code=_NO_RECORDING_STATUS,
+            )
+
+        if recording.status_code > 399 and recording.status_code != 404:
+            raise SafeRequestStatusError(
+                f"Failed to request (replay) {url} with status code {recording.status_code}",
+                status_code=recording.status_code,
+            )
+
+        body = recording.body
+        if read_until is not None:
+            for end in range(
+                self._chunk_size, len(body) + self._chunk_size, self._chunk_size
+            ):
+                if read_until(body[end - self._chunk_size : end]):
+                    body = body[:end]
+                    break
+
+        return SafeRequestResponseData(
+            data=body,
+            status_code=recording.status_code,
+            access_token=recording.headers.get("Authorization", "").replace(
+                "Bearer ", ""
+            )
+            or None,
+            etag=recording.headers.get("ETag"),
+            last_modified=recording.headers.get("Last-Modified"),
+            size=len(body.encode()),
+        )
+
+
+class SafeRequestEngineRecorder(SafeRequestEngine):
+    """Sends requests through ``engine`` and records every answer into ``directory``.
+
+    The directory becomes a corpus ``load_recordings`` and the replay engine can read.
+    """
+
+    def __init__(self, engine: SafeRequestEngine, directory: str):
+        self._engine = engine
+        self._directory = directory
+        self._responses = []
+
+    async def request(
+        self,
+        method: SafeRequestMethod,
+        url: str,
+        data: dict,
+        proxy: str,
+        timeout: int,
+        session: requests.AsyncSession,
+        headers: Optional[dict] = None,
+        cookies: Optional[dict] = None,
+        read_until: Optional[Callable[[str], bool]] = None,
+    ) -> SafeRequestResponseData:
+        response = await self._engine.request(
+            method=method,
+            url=url,
+            data=data,
+            proxy=proxy,
+            timeout=timeout,
+            session=session,
+            headers=headers,
+            cookies=cookies,
+            read_until=read_until,
+        )
+        self.record(method, url, response)
+
+        return response
+
+    def record(
+        self, method: SafeRequestMethod, url: str, response: SafeRequestResponseData
+    ):
+        os.makedirs(self._directory, exist_ok=True)
+        body = "response_{}.txt".format(len(self._responses))
+        with open(os.path.join(self._directory, body), "w", encoding="utf-8") as f:
+            f.write(response.data or "")
+
+        headers = {
+            key: value
+            for key, value in (
+                ("ETag", response.etag),
+                ("Last-Modified", response.last_modified),
+            )
+            if value is not None
+        }
+        self._responses.append(
+            {
+                "method": method.name,
+                "url": re.escape(url),
+                "status": response.status_code,
+                "headers": headers,
+                "body": body,
+            }
+        )
+
+        path = os.path.join(self._directory, MANIFEST)
+        manifest = {}
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {**manifest, "responses": self._responses},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
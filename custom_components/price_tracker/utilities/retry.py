@@ -0,0 +1,195 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from enum import Enum
+from urllib.parse import urlparse
+
+_RETRYABLE_STATUS_CODES = (408, 425, 429, 500, 502, 503, 504)
+_HOST_FAILURE_STATUS_CODES = (403, 429)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if value is None or str(value).strip() == "":
+        return None
+
+    value = str(value).strip()
+    if value.isnumeric():
+        return float(value)
+
+    try:
+        date = parsedate_to_datetime(value)
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_host_failure(error: Exception) -> bool:
+    """Whether the error says something about the store itself (block, overload, network)."""
+    status_code = getattr(error, "status_code", None)
+
+    if status_code is None:
+        return True
+
+    return status_code >= 500 or status_code in _HOST_FAILURE_STATUS_CODES
+
+
+class SafeRequestRetryPolicy:
+    """Retry every failure immediately (legacy behaviour)."""
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        return True
+
+    def delay(self, error: Exception, attempt: int) -> float:
+        return 0
+
+
+class SafeRequestBackoffRetryPolicy(SafeRequestRetryPolicy):
+    """Exponential backoff with full jitter, retrying only retryable failures."""
+
+    def __init__(
+        self,
+        base: float = 0.5,
+        factor: float = 2,
+        max_delay: float = 8,
+        max_retry_after: float = 30,
+        jitter: bool = True,
+        retry_status_codes: tuple[int, ...] = _RETRYABLE_STATUS_CODES,
+    ):
+        self._base = base
+        self._factor = factor
+        self._max_delay = max_delay
+        self._max_retry_after = max_retry_after
+        self._jitter = jitter
+        self._retry_status_codes = retry_status_codes
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        status_code = getattr(error, "status_code", None)
+
+        # Transport errors (timeouts, resets, proxy failures) are always worth another go
+        if status_code is None:
+            return True
+
+        if status_code not in self._retry_status_codes:
+            return False
+
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None and retry_after > self._max_retry_after:
+            return False
+
+        return True
+
+    def delay(self, error: Exception, attempt: int) -> float:
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, self._max_retry_after)
+
+        delay = min(self._base * (self._factor**attempt), self._max_delay)
+
+        return random.uniform(0, delay) if self._jitter else delay
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60):
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at: float | None = None
+        self._open_for = recovery_timeout
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self._open_for
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probing = False
+
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def allow(self) -> bool:
+        state = self.state
+
+        if state == CircuitState.CLOSED:
+            return True
+
+        if state == CircuitState.HALF_OPEN and not self._probing:
+            # Let exactly one probe through
+            self._probing = True
+            return True
+
+        return False
+
+    def release(self):
+        """End a probe that got no answer, so the next request probes instead."""
+        self._probing = False
+
+    def record_success(self):
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self, retry_after: float | None = None):
+        self._failures += 1
+
+        if (
+            self._state == CircuitState.HALF_OPEN
+            or self._failures >= self._failure_threshold
+        ):
+            self._open(max(self._recovery_timeout, retry_after or 0))
+        elif retry_after is not None:
+            # The store told us exactly how long to back off
+            self._open(retry_after)
+
+    def _open(self, seconds: float):
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._open_for = seconds
+        self._probing = False
+
+
+class CircuitBreakerRegistry:
+    """Per-host circuit breakers shared by every engine."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60):
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        host = urlparse(url).hostname or url
+
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(
+                failure_threshold=self._failure_threshold,
+                recovery_timeout=self._recovery_timeout,
+            )
+
+        return self._breakers[host]
+
+    def states(self) -> dict[str, str]:
+        return {host: b.state.value for host, b in self._breakers.items()}
+
+
+_CIRCUIT_BREAKERS = CircuitBreakerRegistry()
+
+
+def circuit_breakers() -> CircuitBreakerRegistry:
+    return _CIRCUIT_BREAKERS
@@ -1,25 +1,60 @@
 import asyncio
+import codecs
 import dataclasses
 import json
 import logging
 import random
 from enum import Enum
+from functools import cached_property
 from typing import Optional, Callable, Self, Awaitable
+from urllib.parse import urlparse
 
-import fake_useragent
-from curl_cffi import requests, CurlHttpVersion, CurlSslVersion
+from curl_cffi import requests, CurlHttpVersion
 from curl_cffi.requests import Cookies
 from voluptuous import default_factory
 
+from custom_components.price_tracker.utilities.cookie_jar import cookie_jars
+from custom_components.price_tracker.utilities.hash import fingerprint
 from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.rate_limit import rate_limiters
+from custom_components.price_tracker.utilities.retry import (
+    CircuitState,
+    SafeRequestRetryPolicy,
+    SafeRequestBackoffRetryPolicy,
+    circuit_breakers,
+    is_host_failure,
+    parse_retry_after,
+)
+from custom_components.price_tracker.utilities.session_pool import (
+    CURL_TIMINGS,
+    session_pool,
+)
+from custom_components.price_tracker.utilities.telemetry import telemetry
+from custom_components.price_tracker.utilities.user_agent import user_agents
 
 _LOGGER = logging.getLogger(__name__)
 
+# Chains every SafeRequest built without explicit chains goes through; None is curl-cffi
+_DEFAULT_CHAINS: Optional[Callable[[], list["SafeRequestEngine"]]] = None
+
 
 class SafeRequestError(Exception):
     pass
 
 
+class SafeRequestStatusError(SafeRequestError):
+    def __init__(
+        self, message: str, status_code: int, retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class SafeRequestCircuitOpenError(SafeRequestError):
+    pass
+
+
 class CustomSessionCookie(Cookies):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -28,20 +63,17 @@ class CustomSessionCookie(Cookies):
         return self.jar.extract_cookies(response, request)
 
 
-class CustomAsyncSession(requests.AsyncSession):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.extra_fp = {
-            "tls_min_version": CurlSslVersion.TLSv1_2,
-        }
-
-
 @dataclasses.dataclass
 class SafeRequestResponseData:
     data: Optional[str] = default_factory("")
     status_code: int = default_factory(400)
     access_token: Optional[str] = default_factory(None)
     cookies: dict = default_factory({})
+    etag: Optional[str] = default_factory(None)
+    last_modified: Optional[str] = default_factory(None)
+    timings: Optional[dict] = default_factory(None)
+    size: Optional[int] = default_factory(None)
+    set_cookies: Optional[list[str]] = default_factory(None)
 
     def __init__(
         self,
@@ -49,6 +81,11 @@ class SafeRequestResponseData:
         status_code: int = None,
         cookies=None,
         access_token: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        timings: Optional[dict] = None,
+        size: Optional[int] = None,
+        set_cookies: Optional[list[str]] = None,
     ):
         if cookies is None:
             cookies = {}
@@ -56,6 +93,14 @@ class SafeRequestResponseData:
         self.status_code = status_code
         self.cookies = cookies
         self.access_token = access_token
+        self.etag = etag
+        self.last_modified = last_modified
+        # Seconds since the request started, as curl reports them (dns, connect, ...)
+        self.timings = timings
+        # Body bytes received
+        self.size = size
+        # Raw Set-Cookie headers, the parsed cookies lose their attributes
+        self.set_cookies = set_cookies
 
     @property
     def text(self):
@@ -65,6 +110,17 @@ class SafeRequestResponseData:
     def is_not_found(self):
         return self.status_code == 404
 
+    @property
+    def is_not_modified(self):
+        return self.status_code == 304
+
+    @cached_property
+    def content_hash(self) -> Optional[str]:
+        if self.data is None or self.data == "":
+            return None
+
+        return fingerprint(self.data)
+
     @property
     def has(self):
         return (
@@ -100,6 +156,7 @@ class SafeRequestEngine:
         session: requests.AsyncSession,
         headers: Optional[dict] = None,
         cookies: Optional[dict] = None,
+        read_until: Optional[Callable[[str], bool]] = None,
     ) -> SafeRequestResponseData:
         pass
 
@@ -123,6 +180,7 @@ class SafeRequestEngineCurlCffi(SafeRequestEngine):
         session: requests.AsyncSession,
         headers: Optional[dict] = None,
         cookies: Optional[dict] = None,
+        read_until: Optional[Callable[[str], bool]] = None,
     ) -> SafeRequestResponseData:
         response = await session.request(
             method=method.name.upper(),
@@ -131,6 +189,7 @@ class SafeRequestEngineCurlCffi(SafeRequestEngine):
             json=data,
             data=data,
             cookies=cookies,
+            discard_cookies=True,
             proxy=proxy,
             timeout=timeout,
             allow_redirects=True,
@@ -138,9 +197,23 @@ class SafeRequestEngineCurlCffi(SafeRequestEngine):
             verify=True,
             http_version=self._version,
             impersonate=self._impersonate,
+            stream=read_until is not None,
         )
 
-        data = response.text
+        if response.status_code > 399 and response.status_code != 404:
+            if read_until is not None:
+                await response.aclose()
+
+            raise SafeRequestStatusError(
+                f"Failed to request (curl-cffi) {url} with status code {response.status_code}",
+                status_code=response.status_code,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        if read_until is not None:
+            data, size = await self._read_until(response, read_until)
+        else:
+            data, size = response.text, response.download_size
         cookies = response.cookies
         access_token = (
             response.headers.get("Authorization").replace("Bearer ", "")
@@ -148,18 +221,65 @@ class SafeRequestEngineCurlCffi(SafeRequestEngine):
             else None
         )
 
-        if response.status_code > 399 and response.status_code != 404:
-            raise SafeRequestError(
-                f"Failed to request (curl-cffi) {url} with status code {response.status_code}"
-            )
-
         return SafeRequestResponseData(
             data=data,
             status_code=response.status_code,
             cookies=cookies,
             access_token=access_token,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            timings={
+                phase: response.infos[info]
+                for phase, info in CURL_TIMINGS.items()
+                if info in response.infos
+            },
+            size=size,
+            set_cookies=response.headers.get_list("set-cookie"),
         )
 
+    @staticmethod
+    async def _read_until(
+        response, read_until: Callable[[str], bool]
+    ) -> tuple[str, int]:
+        """Read a streamed body until ``read_until`` returns True for a decoded chunk.
+
+        Returns the text read and the number of bytes it took.
+        """
+        try:
+            decoder = codecs.getincrementaldecoder(
+                response.charset_encoding or "utf-8"
+            )(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        parts = []
+        size = 0
+
+        try:
+            async for chunk in response.aiter_content():
+                size += len(chunk)
+                text = decoder.decode(chunk)
+                parts.append(text)
+
+                if read_until(text):
+                    break
+            else:
+                parts.append(decoder.decode(b"", final=True))
+        finally:
+            await response.aclose()
+
+        return "".join(parts), size
+
+
+def set_default_chains(factory: Optional[Callable[[], list[SafeRequestEngine]]]):
+    """Build the chains of every SafeRequest without explicit ones with ``factory``.
+
+    Replaying recorded responses for every engine goes through here; None restores the
+    curl-cffi default.
+    """
+    global _DEFAULT_CHAINS
+    _DEFAULT_CHAINS = factory
+
 
 class SafeRequest:
     def __init__(
@@ -173,6 +293,9 @@ class SafeRequest:
         impersonate: str = "chrome124",
         version: Optional[CurlHttpVersion] = CurlHttpVersion.V2TLS,
         user_agents: list[str] = None,
+        retry_policy: Optional[SafeRequestRetryPolicy] = None,
+        rate_limit_key: Optional[str] = None,
+        cookie_scope: Optional[str] = None,
     ):
         if headers is not None:
             self._headers = headers
@@ -193,11 +316,25 @@ class SafeRequest:
         self._timeout = 25
         self._proxies: list[str] = proxies if proxies is not None else []
         self._cookies: dict = cookies if cookies is not None else {}
+        # Conditional request headers, only sent with GET
+        self._validators: dict = {}
         self._selenium = selenium
         self._selenium_proxy = selenium_proxy
         self._chains: list[SafeRequestEngine] = []
         self._impersonate = impersonate
         self._version = version
+        self._retry_policy = (
+            retry_policy
+            if retry_policy is not None
+            else SafeRequestBackoffRetryPolicy()
+        )
+        self._rate_limit_key = rate_limit_key
+        # Device or account the stored cookies belong to, kept in a jar of its own
+        self._cookie_scope = cookie_scope
+        self._last_status_code: Optional[int] = None
+
+        if chains is None and _DEFAULT_CHAINS is not None:
+            chains = _DEFAULT_CHAINS()
 
         self._chains = self._chains + (
             [
@@ -297,6 +434,23 @@ class SafeRequest:
 
         return self
 
+    def retry(self, policy: SafeRequestRetryPolicy):
+        """"""
+        self._retry_policy = policy
+
+        return self
+
+    def conditional(
+        self, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ):
+        """"""
+        if etag is not None:
+            self._validators["If-None-Match"] = etag
+        if last_modified is not None:
+            self._validators["If-Modified-Since"] = last_modified
+
+        return self
+
     def auth(self, token: Optional[str]):
         """"""
         if token is not None:
@@ -503,6 +657,30 @@ class SafeRequest:
 
         return self
 
+    def _request_headers(self, method: SafeRequestMethod) -> Optional[dict]:
+        # A 304 only means something for GET, other methods never get the validators
+        headers = (
+            {**self._headers, **self._validators}
+            if method == SafeRequestMethod.GET
+            else self._headers
+        )
+
+        return headers if bool(headers) else None
+
+    @property
+    def cookies(self) -> dict:
+        """Cookies sent with the next request, including those the store set."""
+        return dict(self._cookies)
+
+    @property
+    def last_status_code(self) -> Optional[int]:
+        """Status the store answered the last request with, None when it never answered.
+
+        Failed tries are not left in the response, so this tells a store refusing the
+        request apart from a transport error or an open circuit.
+        """
+        return self._last_status_code
+
     async def request(
         self,
         url: str,
@@ -513,69 +691,152 @@ class SafeRequest:
         max_tries: int = 8,
         post_try_callables: list[Callable[[Self], Awaitable[None]]] = None,
         retain_cookie=True,
+        read_until: Optional[Callable[[], Callable[[str], bool]]] = None,
     ) -> SafeRequestResponseData:
+        """Send the request through the chains, retrying as the retry policy allows.
+
+        ``read_until`` streams the body: it is called once per try and returns a
+        predicate that gets every decoded chunk, downloading stops once it returns True
+        and the response only holds the part read so far.
+        """
         errors = []
         return_data = SafeRequestResponseData()
+        self._last_status_code = None
+        breaker = circuit_breakers().get(url)
+        limiter = rate_limiters().get(
+            self._rate_limit_key
+            if self._rate_limit_key is not None
+            else urlparse(url).hostname or url
+        )
+        trace = telemetry().request(method.name, url, self._rate_limit_key)
 
-        async with CustomAsyncSession(
-            impersonate=self._impersonate, http_version=self._version
-        ) as session:
-            for tries in range(max_tries):
-                if tries >= max_tries:
-                    return return_data
-
-                for chain in self._chains:
-                    if tries >= max_tries:
-                        return return_data
-
-                    if tries > 0 and post_try_callables is not None:
-                        for callable_ in post_try_callables:
-                            await callable_(self)
+        probe = False
 
-                    proxy = (
-                        random.choice(self._proxies + [None])
-                        if len(self._proxies) > 0
-                        else None
+        try:
+            for tries in range(max_tries):
+                chain = self._chains[tries % len(self._chains)]
+
+                probe = breaker.state == CircuitState.HALF_OPEN
+                if not breaker.allow():
+                    probe = False
+                    errors.append(
+                        SafeRequestCircuitOpenError(
+                            f"Circuit open for {url}, skipping request"
+                        )
                     )
+                    break
+
+                if tries > 0 and post_try_callables is not None:
+                    for callable_ in post_try_callables:
+                        await callable_(self)
+
+                await limiter.acquire()
+
+                proxy = (
+                    random.choice(self._proxies + [None])
+                    if len(self._proxies) > 0
+                    else None
+                )
+                jar = (
+                    await cookie_jars().async_jar(
+                        self._rate_limit_key, proxy, self._cookie_scope
+                    )
+                    if self._rate_limit_key is not None
+                    else None
+                )
+
+                if bool(self._headers):
+                    if len(self._ua_platforms) > 0:
+                        self._headers["User-Agent"] = await user_agents().async_random(
+                            self._ua_platforms
+                        )
 
-                    if bool(self._headers):
-                        if len(self._ua_platforms) > 0:
-                            ua_engine = await asyncio.to_thread(
-                                fake_useragent.UserAgent, platforms=self._ua_platforms
-                            )
-
-                            self._headers["User-Agent"] = ua_engine.random
+                attempt = trace.attempt(tries + 1, proxy)
 
-                    try:
+                try:
+                    async with session_pool().session(
+                        impersonate=self._impersonate,
+                        version=self._version,
+                        proxy=proxy,
+                    ) as session:
                         return_data = await chain.request(
-                            headers=self._headers if bool(self._headers) else None,
+                            headers=self._request_headers(method),
                             method=method,
                             url=url,
                             data=data,
                             proxy=proxy,
                             timeout=timeout,
                             session=session,
-                            cookies=self._cookies,
+                            cookies={**jar.cookies_for(url), **self._cookies}
+                            if jar is not None
+                            else self._cookies,
+                            read_until=read_until() if read_until is not None else None,
                         )
 
-                        if return_data.status_code <= 399 or retain_cookie:
-                            self.cookie(item=return_data.cookies)
+                    breaker.record_success()
+                    probe = False
+                    attempt.end(response=return_data)
+                    self._last_status_code = return_data.status_code
+
+                    if return_data.status_code <= 399 or retain_cookie:
+                        self.cookie(item=return_data.cookies)
+
+                        if (
+                            jar is not None
+                            and return_data.set_cookies
+                            and jar.update(url, return_data.set_cookies)
+                        ):
+                            cookie_jars().changed(
+                                self._rate_limit_key, proxy, self._cookie_scope
+                            )
 
-                        _LOGGER.debug(
-                            "Safe request success with %s [%s] (%s) [Proxy: %s] <%s>",
-                            chain.__class__.__name__,
-                            method.name,
-                            url,
-                            proxy,
-                            self._cookies,
-                        )
+                    _LOGGER.debug(
+                        "Safe request success with %s [%s] (%s) [Proxy: %s] [Try: %s] "
+                        "[Status: %s] [Bytes: %s] [Timings: %s] <%s>",
+                        chain.__class__.__name__,
+                        method.name,
+                        url,
+                        proxy,
+                        tries + 1,
+                        return_data.status_code,
+                        return_data.size,
+                        return_data.timings,
+                        self._cookies,
+                    )
+                    trace.end(response=return_data, tries=tries + 1)
 
-                        return return_data
-                    except Exception as e:
-                        errors.append(e)
-                        pass
-                    finally:
-                        tries += 1
+                    return return_data
+                except Exception as e:
+                    errors.append(e)
+                    attempt.end(error=e)
+                    self._last_status_code = getattr(e, "status_code", None)
+
+                    if is_host_failure(e):
+                        breaker.record_failure(
+                            retry_after=getattr(e, "retry_after", None)
+                        )
+                    else:
+                        # The store answered, just not with what was asked for
+                        breaker.record_success()
+                    probe = False
+
+                    if tries + 1 >= max_tries or not self._retry_policy.should_retry(
+                        e, tries
+                    ):
+                        break
+
+                    await asyncio.sleep(self._retry_policy.delay(e, tries))
+        finally:
+            if probe:
+                # Cancelled or failed before the probe got an answer
+                breaker.release()
+
+        trace.end(
+            error=errors[-1] if len(errors) > 0 else None,
+            tries=sum(
+                1 for x in errors if not isinstance(x, SafeRequestCircuitOpenError)
+            ),
+        )
 
         if len(errors) > 0 and raise_errors:
             _LOGGER.error(f"Failed to request {url}, {set(Lu.map(errors, lambda x: repr(x)))}")
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from curl_cffi import requests, CurlHttpVersion, CurlInfo, CurlSslVersion, CurlMOpt
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_IDLE_TIMEOUT = 90  # seconds
+_DEFAULT_MAX_CLIENTS = 10
+_DEFAULT_MAX_HOST_CONNECTIONS = 6
+
+# Timings every pooled session collects per response, seconds since the request started
+CURL_TIMINGS = {
+    "dns": CurlInfo.NAMELOOKUP_TIME,
+    "connect": CurlInfo.CONNECT_TIME,
+    "tls": CurlInfo.APPCONNECT_TIME,
+    "ttfb": CurlInfo.STARTTRANSFER_TIME,
+    "total": CurlInfo.TOTAL_TIME,
+}
+
+
+class CustomAsyncSession(requests.AsyncSession):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.extra_fp = {
+            "tls_min_version": CurlSslVersion.TLSv1_2,
+        }
+
+
+class _PooledSession:
+    def __init__(self, session: CustomAsyncSession, loop: asyncio.AbstractEventLoop):
+        self.session = session
+        self.loop = loop
+        self.in_use = 0
+        self.last_used = time.monotonic()
+
+
+class SafeRequestSessionPool:
+    """Process-wide pool of keep-alive curl sessions.
+
+    Sessions are keyed by (impersonate, http version, proxy) so every engine that
+    talks through the same fingerprint and route reuses the same warm connections.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: int = _DEFAULT_IDLE_TIMEOUT,
+        max_clients: int = _DEFAULT_MAX_CLIENTS,
+        max_host_connections: int = _DEFAULT_MAX_HOST_CONNECTIONS,
+    ):
+        self._idle_timeout = idle_timeout
+        self._max_clients = max_clients
+        self._max_host_connections = max_host_connections
+        self._sessions: dict[tuple, _PooledSession] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._sessions)
+
+    @asynccontextmanager
+    async def session(
+        self,
+        impersonate: str,
+        version: Optional[CurlHttpVersion] = None,
+        proxy: Optional[str] = None,
+    ):
+        """Borrow a pooled session, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        await self._evict_idle(loop)
+
+        key = (impersonate, version, proxy)
+        pooled = self._sessions.get(key)
+
+        if pooled is None or pooled.loop is not loop:
+            if pooled is not None:
+                self._discard(pooled)
+
+            pooled = _PooledSession(
+                session=self._create_session(impersonate, version), loop=loop
+            )
+            self._sessions[key] = pooled
+
+        pooled.in_use += 1
+        try:
+            yield pooled.session
+        finally:
+            pooled.in_use -= 1
+            pooled.last_used = time.monotonic()
+
+    def _create_session(
+        self, impersonate: str, version: Optional[CurlHttpVersion]
+    ) -> CustomAsyncSession:
+        session = CustomAsyncSession(
+            impersonate=impersonate,
+            http_version=version,
+            max_clients=self._max_clients,
+            curl_infos=list(CURL_TIMINGS.values()),
+        )
+
+        try:
+            session.acurl.setopt(
+                CurlMOpt.MAX_HOST_CONNECTIONS, self._max_host_connections
+            )
+        except Exception as e:
+            _LOGGER.debug("Session pool could not cap host connections: %s", e)
+
+        return session
+
+    async def _evict_idle(self, loop: asyncio.AbstractEventLoop):
+        now = time.monotonic()
+
+        for key, pooled in list(self._sessions.items()):
+            if pooled.loop is not loop:
+                # Bound to a loop that is gone (reload / test loop); drop it.
+                if pooled.loop.is_closed():
+                    self._sessions.pop(key, None)
+                    self._discard(pooled)
+                continue
+
+            if pooled.in_use == 0 and now - pooled.last_used > self._idle_timeout:
+                self._sessions.pop(key, None)
+                await self._close_session(pooled)
+
+    async def close(self):
+        """Close every idle and active session owned by the running loop."""
+        sessions = list(self._sessions.values())
+        self._sessions = {}
+        loop = asyncio.get_running_loop()
+
+        for pooled in sessions:
+            if pooled.loop is loop:
+                await self._close_session(pooled)
+            else:
+                self._discard(pooled)
+
+    def _discard(self, pooled: _PooledSession):
+        """Close a session of another loop on that loop, while it still runs."""
+        if pooled.loop.is_closed():
+            # Its handles went with the loop, nothing can await the close anymore
+            _LOGGER.debug("Dropping pooled session of a closed event loop")
+            return
+
+        asyncio.run_coroutine_threadsafe(self._close_session(pooled), pooled.loop)
+
+    @staticmethod
+    async def _close_session(pooled: _PooledSession):
+        try:
+            await pooled.session.close()
+        except Exception as e:
+            _LOGGER.debug("Failed to close pooled session: %s", e)
+
+
+_SESSION_POOL = SafeRequestSessionPool()
+
+
+def session_pool() -> SafeRequestSessionPool:
+    return _SESSION_POOL
+
+
+async def async_close_session_pool():
+    await _SESSION_POOL.close()
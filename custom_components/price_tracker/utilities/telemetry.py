@@ -0,0 +1,236 @@
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+from urllib.parse import urlparse
+
+from opentelemetry import metrics, trace
+from opentelemetry.trace import StatusCode
+
+_NAME = "custom_components.price_tracker"
+
+T = TypeVar("T")
+
+
+def proxy_label(proxy: Optional[str]) -> str:
+    """Proxy as scheme://host:port without credentials, "direct" without a proxy."""
+    if proxy is None:
+        return "direct"
+
+    parsed = urlparse(proxy if "://" in proxy else "http://" + proxy)
+
+    return "{}://{}{}".format(
+        parsed.scheme,
+        parsed.hostname,
+        ":{}".format(parsed.port) if parsed.port is not None else "",
+    )
+
+
+class RequestAttemptTrace:
+    """One try of a SafeRequest; the base class records nothing."""
+
+    def end(self, response=None, error: Optional[Exception] = None):
+        pass
+
+
+class RequestTrace:
+    """Every try of one SafeRequest.request call; the base class records nothing."""
+
+    def attempt(self, attempt: int, proxy: Optional[str]) -> RequestAttemptTrace:
+        return _NOOP_ATTEMPT
+
+    def end(self, response=None, error: Optional[Exception] = None, tries: int = 0):
+        pass
+
+
+_NOOP_ATTEMPT = RequestAttemptTrace()
+_NOOP_REQUEST = RequestTrace()
+
+
+class _RecordedRequestAttemptTrace(RequestAttemptTrace):
+    def __init__(self, telemetry: "Telemetry", context, attributes: dict):
+        self._telemetry = telemetry
+        self._attributes = attributes
+        self._span = telemetry.tracer.start_span(
+            "price_tracker.request.attempt", context=context, attributes=attributes
+        )
+        self._started_at = time.perf_counter()
+
+    def end(self, response=None, error: Optional[Exception] = None):
+        duration = time.perf_counter() - self._started_at
+        attributes = dict(self._attributes)
+        status_code = (
+            response.status_code
+            if response is not None
+            else getattr(error, "status_code", None)
+        )
+
+        if status_code is not None:
+            attributes["http.response.status_code"] = status_code
+        if error is not None:
+            attributes["error.type"] = type(error).__name__
+            self._span.record_exception(error)
+            self._span.set_status(StatusCode.ERROR, str(error))
+
+        self._span.set_attributes(attributes)
+
+        if response is not None:
+            for phase, value in (response.timings or {}).items():
+                self._span.set_attribute("price_tracker.timing." + phase, value)
+            if response.size is not None:
+                self._span.set_attribute("http.response.body.size", response.size)
+                self._telemetry.request_size.record(response.size, attributes)
+            if "ttfb" in (response.timings or {}):
+                self._telemetry.request_ttfb.record(
+                    response.timings["ttfb"], attributes
+                )
+
+        self._span.end()
+        self._telemetry.request_duration.record(duration, attributes)
+
+
+class _RecordedRequestTrace(RequestTrace):
+    def __init__(self, telemetry: "Telemetry", method: str, url: str, key: str):
+        parsed = urlparse(url)
+        self._telemetry = telemetry
+        self._attributes = {
+            "price_tracker.engine": key
+            if key is not None
+            else parsed.hostname or "unknown",
+            "http.request.method": method,
+            "server.address": parsed.hostname or "unknown",
+        }
+        self._span = telemetry.tracer.start_span(
+            "price_tracker.request",
+            attributes={**self._attributes, "url.path": parsed.path},
+        )
+        self._context = trace.set_span_in_context(self._span)
+
+    def attempt(self, attempt: int, proxy: Optional[str]) -> RequestAttemptTrace:
+        return _RecordedRequestAttemptTrace(
+            self._telemetry,
+            self._context,
+            {
+                **self._attributes,
+                "price_tracker.attempt": attempt,
+                "price_tracker.proxy": proxy_label(proxy),
+            },
+        )
+
+    def end(self, response=None, error: Optional[Exception] = None, tries: int = 0):
+        attributes = {
+            **self._attributes,
+            "price_tracker.outcome": "success" if error is None else "failure",
+        }
+
+        if response is not None and response.status_code is not None:
+            self._span.set_attribute("http.response.status_code", response.status_code)
+        if error is not None:
+            attributes["error.type"] = type(error).__name__
+            self._span.set_status(StatusCode.ERROR, str(error))
+
+        self._span.set_attributes({**attributes, "price_tracker.tries": tries})
+        self._span.end()
+        self._telemetry.request_tries.record(tries, attributes)
+
+
+class Telemetry:
+    """OpenTelemetry spans and histograms of every SafeRequest and engine load.
+
+    Disabled by default, and then every hook returns before any attribute, span or
+    clock read is made. Once enabled, spans and metrics go to the process-wide tracer
+    and meter providers (no-op until the host installs an SDK with exporters) unless
+    providers are given explicitly.
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self.tracer: Optional[trace.Tracer] = None
+        self.request_duration: Optional[metrics.Histogram] = None
+        self.request_ttfb: Optional[metrics.Histogram] = None
+        self.request_size: Optional[metrics.Histogram] = None
+        self.request_tries: Optional[metrics.Histogram] = None
+        self.load_duration: Optional[metrics.Histogram] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def configure(
+        self,
+        enabled: bool,
+        tracer_provider: Optional[trace.TracerProvider] = None,
+        meter_provider: Optional[metrics.MeterProvider] = None,
+    ):
+        if enabled and (
+            self.tracer is None
+            or tracer_provider is not None
+            or meter_provider is not None
+        ):
+            self.tracer = trace.get_tracer(_NAME, tracer_provider=tracer_provider)
+            meter = metrics.get_meter(_NAME, meter_provider=meter_provider)
+            self.request_duration = meter.create_histogram(
+                "price_tracker.request.duration",
+                unit="s",
+                description="Duration of one try of a store request",
+            )
+            self.request_ttfb = meter.create_histogram(
+                "price_tracker.request.time_to_first_byte",
+                unit="s",
+                description="Time until the first byte of a store response",
+            )
+            self.request_size = meter.create_histogram(
+                "price_tracker.request.size",
+                unit="By",
+                description="Body bytes received from a store",
+            )
+            self.request_tries = meter.create_histogram(
+                "price_tracker.request.tries",
+                unit="{try}",
+                description="Tries used by one store request, retries included",
+            )
+            self.load_duration = meter.create_histogram(
+                "price_tracker.load.duration",
+                unit="s",
+                description="Duration of one engine load",
+            )
+
+        self._enabled = enabled
+
+    def request(self, method: str, url: str, key: Optional[str]) -> RequestTrace:
+        if not self._enabled:
+            return _NOOP_REQUEST
+
+        return _RecordedRequestTrace(self, method, url, key)
+
+    async def load(self, key: str, job: Callable[[], Awaitable[T]]) -> T:
+        """Run an engine load, as the parent span of every request it makes."""
+        if not self._enabled:
+            return await job()
+
+        attributes = {"price_tracker.engine": key}
+        outcome = "cancelled"
+        started_at = time.perf_counter()
+
+        with self.tracer.start_as_current_span(
+            "price_tracker.load", attributes=attributes
+        ) as span:
+            try:
+                result = await job()
+                outcome = "fetched" if result is not None else "empty"
+
+                return result
+            except Exception:
+                outcome = "error"
+                raise
+            finally:
+                span.set_attribute("price_tracker.outcome", outcome)
+                self.load_duration.record(
+                    time.perf_counter() - started_at,
+                    {**attributes, "price_tracker.outcome": outcome},
+                )
+
+
+_TELEMETRY = Telemetry()
+
+
+def telemetry() -> Telemetry:
+    return _TELEMETRY
@@ -0,0 +1,105 @@
+import asyncio
+import base64
+import json
+import time
+from typing import Awaitable, Callable, Optional
+
+_DEFAULT_TTL = 1800  # seconds a token without a known expiry is trusted
+_DEFAULT_REFRESH_MARGIN = 60  # seconds before expiry a token is refreshed
+_MAX_REFRESH_SHARE = 0.25  # of the token lifetime, caps the margin of short-lived ones
+
+
+def jwt_expires_in(token: str) -> Optional[float]:
+    """Seconds until the ``exp`` claim of a JWT, None if it is not a JWT with one."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+
+        return float(claims["exp"]) - time.time()
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class AccessTokenCache:
+    """Access token shared by every engine of a store, refreshed before it expires.
+
+    ``fetch`` returns the token and its lifetime in seconds (None when unknown). Callers
+    arriving while a refresh is in flight wait for that one instead of starting their
+    own, and ``invalidate`` drops a token the store rejected. A token is refreshed
+    ``refresh_margin`` seconds before it expires, or after three quarters of its
+    lifetime when it lives shorter than four margins.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = _DEFAULT_TTL,
+        refresh_margin: float = _DEFAULT_REFRESH_MARGIN,
+    ):
+        self._default_ttl = default_ttl
+        self._refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._lock: asyncio.Lock | None = None
+
+        # Metrics
+        self._hits = 0
+        self._refreshes = 0
+        self._invalidations = 0
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token if self._is_fresh() else None
+
+    def _is_fresh(self) -> bool:
+        return self._token is not None and time.monotonic() < self._refresh_at
+
+    async def get(
+        self, fetch: Callable[[], Awaitable[tuple[str, Optional[float]]]]
+    ) -> str:
+        if self._is_fresh():
+            self._hits += 1
+            return self._token
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            # Refreshed by whoever held the lock before us
+            if self._is_fresh():
+                self._hits += 1
+                return self._token
+
+            token, expires_in = await fetch()
+            lifetime = expires_in if expires_in is not None else self._default_ttl
+            self._token = token
+            self._expires_at = time.monotonic() + lifetime
+            self._refresh_at = self._expires_at - min(
+                self._refresh_margin, max(lifetime, 0) * _MAX_REFRESH_SHARE
+            )
+            self._refreshes += 1
+
+            return token
+
+    def invalidate(self, token: Optional[str] = None):
+        """Drop the cached token, only if it still is ``token`` when one is given."""
+        if token is not None and token != self._token:
+            return
+
+        self._token = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._invalidations += 1
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "hits": self._hits,
+            "refreshes": self._refreshes,
+            "invalidations": self._invalidations,
+            "expires_in": max(self._expires_at - time.monotonic(), 0.0)
+            if self._token is not None
+            else 0.0,
+        }
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import random
+import sys
+
+from fake_useragent import settings
+from fake_useragent.utils import load
+
+_LOGGER = logging.getLogger(__name__)
+
+_BROWSERS = ("chrome", "edge", "firefox", "safari")
+_OS = ("windows", "macos", "linux", "android", "ios")
+_FALLBACK = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+
+
+class UserAgentProvider:
+    """Loads the fake_useragent dataset once and serves random picks from it.
+
+    Pools are precomputed per platform set as tuples of interned strings, so a pick
+    is a single ``random.choice`` and never touches the executor after warm-up.
+    """
+
+    def __init__(self):
+        self._data: list[dict] | None = None
+        self._pools: dict[frozenset, tuple[str, ...]] = {}
+        self._lock: asyncio.Lock | None = None
+        self._served = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    @property
+    def served(self) -> int:
+        """Number of user agents handed out since start."""
+        return self._served
+
+    def load(self):
+        """Blocking load of the dataset (runs once)."""
+        if self._data is not None:
+            return
+
+        try:
+            data = load() or []
+        except Exception as e:
+            _LOGGER.warning("Failed to load user agent dataset: %s", e)
+            data = []
+
+        os_names = set()
+        for os_name in _OS:
+            os_names.update(settings.OS_REPLACEMENTS.get(os_name, [os_name]))
+
+        self._data = [
+            {"useragent": sys.intern(x["useragent"]), "type": x["type"]}
+            for x in data
+            if x.get("browser") in _BROWSERS and x.get("os") in os_names
+        ]
+
+    async def async_load(self):
+        if self._data is not None:
+            return
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._data is None:
+                await asyncio.to_thread(self.load)
+
+    def pool(self, platforms: list[str] | tuple[str, ...]) -> tuple[str, ...]:
+        key = frozenset(platforms)
+
+        if key not in self._pools:
+            self.load()
+            self._pools[key] = tuple(
+                x["useragent"] for x in self._data if x["type"] in key
+            )
+
+        return self._pools[key]
+
+    def random(self, platforms: list[str] | tuple[str, ...]) -> str:
+        pool = self.pool(platforms)
+        self._served += 1
+
+        return random.choice(pool) if len(pool) > 0 else _FALLBACK
+
+    async def async_random(self, platforms: list[str] | tuple[str, ...]) -> str:
+        if self._data is None:
+            await self.async_load()
+
+        return self.random(platforms)
+
+
+_USER_AGENT_PROVIDER = UserAgentProvider()
+
+
+def user_agents() -> UserAgentProvider:
+    return _USER_AGENT_PROVIDER
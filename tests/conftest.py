@@ -0,0 +1,12 @@
+import pytest_asyncio
+
+from custom_components.price_tracker.utilities.session_pool import (
+    async_close_session_pool,
+)
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="function")
+async def close_session_pool():
+    """Close the pooled curl sessions before the test's event loop goes away."""
+    yield
+    await async_close_session_pool()
@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from custom_components.price_tracker.components import analytics
+from custom_components.price_tracker.components.analytics import (
+    ANALYTICS_ATTRIBUTES,
+    SUMMARY_ATTRIBUTES,
+    price_analytics,
+    price_summaries,
+)
+from custom_components.price_tracker.components.history import PriceHistory
+
+_DAY = 86400
+_NOW = 1_700_006_400 + 12 * 3600
+
+
+@pytest.fixture
+def history(tmp_path):
+    random.seed(7)
+    history = PriceHistory(str(tmp_path / "history.db"))
+    rows = []
+    for key, days in [("steady", 100), ("new", 3), ("dropped", 40)]:
+        for ts in range(_NOW - days * _DAY, _NOW, 6 * 3600):
+            rows.append((key, ts, float(random.randint(990, 1010)), None, 10))
+    history.append(rows)
+
+    yield history
+
+    history.close()
+
+
+def test_analytics_flags(history):
+    result = price_analytics(
+        history,
+        {"steady": 1000.0, "new": 1020.0, "dropped": 500.0, "empty": 10.0},
+        _NOW,
+    )
+
+    assert set(result["steady"].keys()) == set(ANALYTICS_ATTRIBUTES)
+    assert result["dropped"]["lowest_30d"] is True
+    assert result["dropped"]["lowest_90d"] is True
+    assert result["dropped"]["price_drop"] is True
+    assert result["new"]["lowest_30d"] is False
+    assert result["new"]["price_drop"] is False
+    assert result["steady"]["price_min_90d"] >= 990
+    assert result["steady"]["price_max_7d"] <= 1010
+    assert result["empty"]["price_min_30d"] is None
+    assert result["empty"]["lowest_30d"] is False
+
+
+def test_analytics_without_numpy_matches(history, monkeypatch):
+    prices = {"steady": 1000.0, "new": 1020.0, "dropped": 500.0, "empty": 10.0}
+    expected = price_analytics(history, prices, _NOW)
+
+    monkeypatch.setattr(analytics, "numpy", None)
+    result = price_analytics(history, prices, _NOW)
+
+    assert result.keys() == expected.keys()
+    for key in prices:
+        for name in ANALYTICS_ATTRIBUTES:
+            assert result[key][name] == pytest.approx(expected[key][name]), (key, name)
+
+
+def test_summaries_cover_the_whole_history(history):
+    result = price_summaries(history, ["steady", "empty"])
+
+    assert set(result["steady"].keys()) == set(SUMMARY_ATTRIBUTES)
+    assert 990 <= result["steady"]["min_price"] <= result["steady"]["avg_price"]
+    assert result["steady"]["avg_price"] <= result["steady"]["max_price"] <= 1010
+    assert result["steady"] == history.summary("steady").dict
+    assert result["empty"] == {name: None for name in SUMMARY_ATTRIBUTES}
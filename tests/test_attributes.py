@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+
+from homeassistant.core import State
+from homeassistant.helpers.restore_state import RestoredExtraData
+
+from custom_components.price_tracker.components.attributes import AttributeStore
+from custom_components.price_tracker.components.engine import PriceEngine
+from custom_components.price_tracker.components.sensor import PriceTrackerSensor
+from custom_components.price_tracker.datas.item import ItemData
+from custom_components.price_tracker.datas.price import ItemPriceData
+
+
+class _FakeEngine(PriceEngine):
+    def __init__(self, id: str):
+        self.id = id
+
+    async def load(self) -> ItemData | None:
+        return ItemData(id=self.id)
+
+    def id_str(self) -> str:
+        return self.id
+
+
+def test_store_tracks_changed_keys():
+    store = AttributeStore({"a": 1, "b": 2}, volatile=("updated_at",))
+    snapshot = store.snapshot()
+
+    assert store.update({"a": 1, "b": 2}) is False
+    assert store.dirty == frozenset()
+    assert store.snapshot() is snapshot
+
+    store.set("updated_at", 1)
+    assert store.dirty == {"updated_at"}
+    assert store.changed is False
+
+    store.clean()
+    assert store.replace({"a": 3}, keep=("updated_at",)) is True
+    assert store.dirty == {"a", "b"}
+    assert store.changed is True
+    assert store.snapshot() == {"a": 3, "updated_at": 1}
+
+
+def test_sensor_without_heartbeat_keeps_unchanged_item_clean():
+    sensor = PriceTrackerSensor(engine=_FakeEngine("1"), updated_at_heartbeat=False)
+    item = ItemData(id="1", name="item", price=ItemPriceData(price=100))
+
+    # The second update is the first one with a price to compare against
+    sensor.update_from_result(item)
+    sensor.update_from_result(item)
+    attributes = sensor.extra_state_attributes
+    assert attributes["price"] == 100
+    assert attributes["price_change_before_price"] == 100
+
+    sensor.update_from_result(item)
+    assert sensor._attributes.dirty == frozenset()
+    assert sensor.extra_state_attributes is attributes
+
+    sensor.update_from_result(ItemData(id="1", name="item", price=ItemPriceData(90)))
+    assert sensor.extra_state_attributes["price"] == 90
+    assert sensor.extra_state_attributes["updated_at"] > attributes["updated_at"]
+
+
+def test_sensor_heartbeat_refreshes_updated_at():
+    sensor = PriceTrackerSensor(engine=_FakeEngine("1"))
+    item = ItemData(id="1", name="item", price=ItemPriceData(price=100))
+
+    for _ in range(3):
+        sensor.update_from_result(item)
+
+    assert sensor._attributes.dirty == {"updated_at"}
+
+
+def _restored_sensor(monkeypatch, fetched_at: datetime | None) -> PriceTrackerSensor:
+    # Standing in for the coordinator, the sensor only schedules itself on it
+    sensor = PriceTrackerSensor(
+        engine=_FakeEngine("1"), coordinator=object(), updated_at_heartbeat=False
+    )
+    changed_at = datetime.now() - timedelta(days=2)
+    state = State(
+        "sensor.item",
+        "100",
+        {
+            "product_id": "1",
+            "name": "item",
+            "price": 100,
+            "original_price": 100,
+            "payback_price": None,
+            "unit_of_measurement": "KRW",
+            "entity_picture": None,
+            "updated_at": changed_at.isoformat(),
+        },
+    )
+    extra = (
+        RestoredExtraData({"fetched_at": fetched_at.isoformat()})
+        if fetched_at is not None
+        else None
+    )
+
+    async def _last_state():
+        return state
+
+    async def _last_extra_data():
+        return extra
+
+    monkeypatch.setattr(sensor, "async_get_last_state", _last_state)
+    monkeypatch.setattr(sensor, "async_get_last_extra_data", _last_extra_data)
+
+    return sensor
+
+
+async def test_sensor_without_heartbeat_restores_the_fetch_time(monkeypatch):
+    fetched_at = datetime.now() - timedelta(minutes=5)
+    sensor = _restored_sensor(monkeypatch, fetched_at)
+
+    await sensor._async_restore()
+
+    # The price last changed two days ago, but it was fetched five minutes ago
+    assert sensor._updated_at == fetched_at
+    assert sensor._restored_due_at() == fetched_at + timedelta(minutes=30)
+    assert sensor.extra_restore_state_data.as_dict() == {
+        "fetched_at": fetched_at.isoformat()
+    }
+
+    sensor.update_from_result(None)
+    assert sensor.available
+
+
+async def test_sensor_restored_without_fetch_time_uses_updated_at(monkeypatch):
+    sensor = _restored_sensor(monkeypatch, None)
+
+    await sensor._async_restore()
+
+    assert sensor._updated_at < datetime.now() - timedelta(days=1)
+    assert sensor._restored_due_at() is None
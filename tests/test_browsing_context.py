@@ -0,0 +1,149 @@
+import os
+
+import pytest
+
+from custom_components.price_tracker.components.error import DataParseError
+from custom_components.price_tracker.services.smartstore import context
+from custom_components.price_tracker.services.smartstore.engine import (
+    SmartstoreEngine,
+)
+from custom_components.price_tracker.utilities import safe_request
+from custom_components.price_tracker.utilities.rate_limit import RateLimiterRegistry
+from custom_components.price_tracker.utilities.retry import CircuitBreakerRegistry
+from custom_components.price_tracker.utilities.replay import (
+    SafeRequestEngineReplay,
+    SafeRequestRecording,
+    load_recordings,
+)
+from custom_components.price_tracker.utilities.safe_request import set_default_chains
+
+_SMARTSTORE = os.path.join(
+    os.path.dirname(__file__), "fixtures", "engines", "smartstore"
+)
+
+
+class _CountingReplay(SafeRequestEngineReplay):
+    def __init__(self, recordings):
+        super().__init__(recordings)
+        self.calls: list[tuple[str, dict]] = []
+
+    async def request(self, method, url, *args, **kwargs):
+        self.calls.append((url, dict(kwargs.get("cookies") or {})))
+        return await super().request(method, url, *args, **kwargs)
+
+
+class _UnreachableReplay(_CountingReplay):
+    async def request(self, method, url, *args, **kwargs):
+        if "/products/" in url:
+            self.calls.append((url, dict(kwargs.get("cookies") or {})))
+            raise ConnectionError("Connection reset by peer")
+
+        return await super().request(method, url, *args, **kwargs)
+
+
+def _breakers(monkeypatch, failure_threshold: int = 5):
+    registry = CircuitBreakerRegistry(failure_threshold=failure_threshold)
+    monkeypatch.setattr(safe_request, "circuit_breakers", lambda: registry)
+    monkeypatch.setattr(context, "circuit_breakers", lambda: registry)
+
+
+@pytest.fixture
+def replay(monkeypatch):
+    monkeypatch.setattr(context, "_CONTEXTS", {})
+    _breakers(monkeypatch)
+    # Without the Smartstore rate limit of one request per second
+    unlimited = RateLimiterRegistry(limits={}, default=(0.0, 1))
+    monkeypatch.setattr(safe_request, "rate_limiters", lambda: unlimited)
+
+    def _replay(recordings, engine_type=_CountingReplay) -> _CountingReplay:
+        engine = engine_type(recordings)
+        set_default_chains(lambda: [engine])
+        return engine
+
+    yield _replay
+    set_default_chains(None)
+
+
+def _smartstore(product_id: int, store_type: str = "smartstore") -> SmartstoreEngine:
+    return SmartstoreEngine(
+        item_url="https://{}.naver.com/jejufarm/products/{}".format(
+            store_type, product_id
+        )
+    )
+
+
+async def test_product_requests_reuse_one_warm_up(replay):
+    _, recordings = load_recordings(_SMARTSTORE)
+    engine = replay(
+        recordings
+        + [
+            SafeRequestRecording(
+                "GET",
+                r"https://smartstore\.naver\.com/jejufarm/products/\d+",
+                body=recordings[-1].body,
+            )
+        ]
+    )
+
+    for i in range(5):
+        assert await _smartstore(i).load() is not None
+
+    products = [x for x in engine.calls if "/products/" in x[0]]
+    assert len(engine.calls) == 3 + 5
+    assert len(products) == 5
+    assert len({x[1]["NNB"] for x in products}) == 1
+
+
+async def test_blocked_context_is_warmed_up_again(replay, monkeypatch):
+    monkeypatch.setattr(
+        context,
+        "_CONTEXTS",
+        {(None,): context.SmartstoreBrowsingContext(min_warm_up_interval=0)},
+    )
+    _, recordings = load_recordings(_SMARTSTORE)
+    engine = replay(
+        recordings[:-1]
+        + [SafeRequestRecording("GET", r".*/products/.*", status_code=403)]
+    )
+
+    for i in range(2):
+        with pytest.raises(DataParseError):
+            await _smartstore(i, store_type="brand").load()
+
+    assert len(engine.calls) == 2 * (3 + 1)
+    assert context.browsing_context().metrics["blocks"] == 2
+
+
+async def test_warm_ups_back_off_after_a_block(replay):
+    _, recordings = load_recordings(_SMARTSTORE)
+    engine = replay(
+        recordings[:-1]
+        + [SafeRequestRecording("GET", r".*/products/.*", status_code=403)]
+    )
+
+    for i in range(2):
+        with pytest.raises(DataParseError):
+            await _smartstore(i).load()
+
+    # The second product goes out with the old cookies instead of a new warm-up
+    assert len(engine.calls) == 3 + 2
+    assert context.browsing_context().metrics["warm_ups"] == 1
+    assert context.browsing_context().metrics["blocks"] == 2
+
+
+async def test_unanswered_product_request_keeps_the_context(replay, monkeypatch):
+    _breakers(monkeypatch, failure_threshold=1)
+    _, recordings = load_recordings(_SMARTSTORE)
+    engine = replay(recordings[:-1], engine_type=_UnreachableReplay)
+
+    for i in range(2):
+        with pytest.raises(DataParseError):
+            await _smartstore(i).load()
+
+    # The first product opened the circuit, the second neither warms up nor goes out
+    products = [x for x in engine.calls if "/products/" in x[0]]
+    assert len(engine.calls) == 3 + 1
+    assert len(products) == 1
+    assert context.browsing_context().metrics["warm_ups"] == 1
+    assert context.browsing_context().metrics["blocks"] == 0
+    assert context.browsing_context().is_usable
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from custom_components.price_tracker.components.coalescer import ItemLoadCoalescer
+from custom_components.price_tracker.components.engine import PriceEngine
+from custom_components.price_tracker.datas.item import ItemData
+
+
+class _FakeEngine(PriceEngine):
+    def __init__(self, id: str, device: str | None = None):
+        self.id = id
+        self._device = device
+
+    async def load(self) -> ItemData | None:
+        return ItemData(id=self.id)
+
+    def id_str(self) -> str:
+        return self.id
+
+    @property
+    def device_id(self) -> str | None:
+        return self._device
+
+    @staticmethod
+    def engine_code() -> str:
+        return "fake"
+
+
+def _job(loads: list, result=None, error: Exception = None):
+    async def _load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        if error is not None:
+            raise error
+        return result
+
+    return _load
+
+
+async def test_identical_loads_share_one_job():
+    coalescer = ItemLoadCoalescer()
+    loads = []
+    item = ItemData(id="1")
+
+    results = await asyncio.gather(
+        *[coalescer.load(_FakeEngine("1"), _job(loads, result=item)) for _ in range(5)],
+        coalescer.load(_FakeEngine("1", device="a"), _job(loads, result=item)),
+        coalescer.load(_FakeEngine("2"), _job(loads, result=item)),
+    )
+
+    assert all(x is item for x in results)
+    assert len(loads) == 3
+    assert coalescer.metrics["coalesced"] == 4
+
+    # Handed out again within the ttl
+    assert await coalescer.load(_FakeEngine("1"), _job(loads)) is item
+    assert len(loads) == 3
+
+
+async def test_errors_and_empty_results_are_not_cached():
+    coalescer = ItemLoadCoalescer()
+    loads = []
+
+    with pytest.raises(ValueError):
+        await asyncio.gather(
+            coalescer.load(_FakeEngine("1"), _job(loads, error=ValueError())),
+            coalescer.load(_FakeEngine("1"), _job(loads, error=ValueError())),
+        )
+    assert await coalescer.load(_FakeEngine("1"), _job(loads)) is None
+    assert await coalescer.load(_FakeEngine("1"), _job(loads)) is None
+
+    assert len(loads) == 3
+
+
+async def test_cancelled_caller_does_not_cancel_the_load():
+    coalescer = ItemLoadCoalescer(ttl=0)
+    loads = []
+    item = ItemData(id="1")
+
+    first = asyncio.ensure_future(
+        coalescer.load(_FakeEngine("1"), _job(loads, result=item))
+    )
+    second = asyncio.ensure_future(
+        coalescer.load(_FakeEngine("1"), _job(loads, result=item))
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second is item
+    assert len(loads) == 1
@@ -0,0 +1,154 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.price_tracker.components.coordinator import (
+    PriceTrackerCoordinator,
+)
+from custom_components.price_tracker.components.engine import PriceEngine
+from custom_components.price_tracker.components.history import PriceHistory
+from custom_components.price_tracker.datas.item import ItemData
+from custom_components.price_tracker.datas.price import ItemPriceData
+
+
+class _FakeEngine(PriceEngine):
+    def __init__(self, id: str):
+        self.id = id
+
+    async def load(self) -> ItemData | None:
+        return ItemData(id=self.id)
+
+    def id_str(self) -> str:
+        return self.id
+
+
+@pytest.mark.asyncio
+async def test_coordinator_dispatches_only_due_items(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    coordinator = PriceTrackerCoordinator(hass, "entry", concurrency=2, warmup_spread=0)
+    results = []
+
+    for i in range(3):
+        coordinator.async_subscribe(
+            key=str(i),
+            engine=_FakeEngine(str(i)),
+            refresh_period=30,
+            listener=results.append,
+        )
+    unsubscribe = coordinator.async_subscribe(
+        key="fresh",
+        engine=_FakeEngine("fresh"),
+        refresh_period=30,
+        listener=results.append,
+        due_at=datetime.now() + timedelta(minutes=30),
+    )
+
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    assert sorted(result.id for result in results) == ["0", "1", "2"]
+
+    unsubscribe()
+    assert coordinator.size == 3
+
+    await coordinator.async_shutdown()
+    await hass.async_stop(force=True)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_spreads_warmup(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    coordinator = PriceTrackerCoordinator(hass, "entry", warmup_spread=10)
+    started_at = time.time()
+
+    for i in range(3):
+        coordinator.async_subscribe(
+            key=str(i),
+            engine=_FakeEngine(str(i)),
+            refresh_period=30,
+            listener=lambda _: None,
+            # Restored long ago, so it has to go through warm-up as well
+            due_at=datetime.now() - timedelta(hours=1),
+        )
+
+    due = [coordinator._subscriptions[str(i)].due_at for i in range(3)]
+
+    assert due == sorted(due)
+    assert all(b - a >= 5 for a, b in zip([started_at] + due, due))
+    assert due[-1] <= time.time() + 3 * 15
+
+    await coordinator.async_shutdown()
+    await hass.async_stop(force=True)
+
+
+class _SlowEngine(_FakeEngine):
+    async def load(self) -> ItemData | None:
+        await asyncio.sleep(10)
+        return await super().load()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_slow_item_holds_only_its_own_slot(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    coordinator = PriceTrackerCoordinator(hass, "entry", concurrency=2, warmup_spread=0)
+    results = []
+
+    coordinator.async_subscribe(
+        key="slow",
+        engine=_SlowEngine("slow"),
+        refresh_period=30,
+        listener=results.append,
+    )
+    for i in range(4):
+        coordinator.async_subscribe(
+            key=str(i),
+            engine=_FakeEngine(str(i)),
+            refresh_period=30,
+            listener=results.append,
+        )
+
+    await asyncio.sleep(0.2)
+
+    assert sorted(result.id for result in results) == ["0", "1", "2", "3"]
+
+    await coordinator.async_shutdown()
+    await hass.async_stop(force=True)
+
+
+class _PricedEngine(_FakeEngine):
+    async def load(self) -> ItemData | None:
+        return ItemData(id=self.id, price=ItemPriceData(price=1000.0))
+
+
+@pytest.mark.asyncio
+async def test_coordinator_hands_the_history_summary_to_analytics(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    history = PriceHistory(str(tmp_path / "history.db"))
+    history.append([("item", int(time.time()) - 3600, 800.0, None, None)])
+    coordinator = PriceTrackerCoordinator(
+        hass, "entry", warmup_spread=0, history=history
+    )
+    analytics = []
+
+    coordinator.async_subscribe(
+        key="item",
+        engine=_PricedEngine("item"),
+        refresh_period=30,
+        listener=lambda _: None,
+        analytics_listener=analytics.append,
+    )
+
+    await asyncio.sleep(0.2)
+    await hass.async_block_till_done()
+
+    assert len(analytics) == 1
+    assert analytics[0]["min_price"] == 800.0
+    assert analytics[0]["max_price"] == 1000.0
+    assert analytics[0]["avg_price"] == 900.0
+    assert analytics[0]["lowest_30d"] is False
+
+    await coordinator.async_shutdown()
+    await hass.async_stop(force=True)
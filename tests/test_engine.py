@@ -0,0 +1,80 @@
+import pytest
+
+from custom_components.price_tracker.components.engine import PriceEngine
+from custom_components.price_tracker.datas.item import ItemData
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequest,
+    SafeRequestMethod,
+    SafeRequestResponseData,
+)
+
+
+class _FakeEngine(PriceEngine):
+    def __init__(self, id: str):
+        self.id = id
+
+    async def load(self) -> ItemData | None:
+        if self.id == "broken":
+            raise ValueError(self.id)
+
+        return ItemData(id=self.id)
+
+    def id_str(self) -> str:
+        return self.id
+
+
+@pytest.mark.asyncio
+async def test_load_many_keeps_order_and_errors():
+    results = await _FakeEngine.load_many(
+        [_FakeEngine("a"), _FakeEngine("broken"), _FakeEngine("b")]
+    )
+
+    assert results[0].id == "a"
+    assert isinstance(results[1], ValueError)
+    assert results[2].id == "b"
+
+
+def test_unchanged_item_reuses_previous_item():
+    engine = _FakeEngine("a")
+    response = SafeRequestResponseData(data="{}", status_code=200, etag='"v1"')
+
+    assert engine.unchanged_item(response) is None
+
+    item = engine.remember_item(response, ItemData(id="a"))
+    request = engine.conditional(SafeRequest())
+
+    assert request._request_headers(SafeRequestMethod.GET)["If-None-Match"] == '"v1"'
+    assert "If-None-Match" not in request._request_headers(SafeRequestMethod.POST)
+    assert (
+        engine.unchanged_item(SafeRequestResponseData(data="{}", status_code=200))
+        is item
+    )
+    assert engine.unchanged_item(SafeRequestResponseData(status_code=304)) is item
+    assert (
+        engine.unchanged_item(SafeRequestResponseData(data="{ }", status_code=200))
+        is None
+    )
+
+
+def test_unchanged_item_compares_the_given_content():
+    engine = _FakeEngine("a")
+    item = engine.remember_item(
+        SafeRequestResponseData(data="state;tail", status_code=200),
+        ItemData(id="a"),
+        content="state",
+    )
+
+    assert (
+        engine.unchanged_item(
+            SafeRequestResponseData(data="state;other tail", status_code=200),
+            content="state",
+        )
+        is item
+    )
+    assert (
+        engine.unchanged_item(
+            SafeRequestResponseData(data="state;tail", status_code=200),
+            content="changed",
+        )
+        is None
+    )
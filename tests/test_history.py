@@ -0,0 +1,92 @@
+import random
+
+from custom_components.price_tracker.components.history import PriceHistory
+from custom_components.price_tracker.datas.item import ItemData, ItemStatus
+from custom_components.price_tracker.datas.price import ItemPriceData
+
+_DAY = 86400
+_NOW = 1_700_006_400  # day aligned
+
+
+def _samples(days: int, step: int = 1800) -> list[tuple]:
+    random.seed(1)
+    return [
+        ("item", ts, float(random.randint(900, 1100)), 1200.0, 10)
+        for ts in range(_NOW - days * _DAY, _NOW, step)
+    ]
+
+
+def test_history_summary_matches_samples(tmp_path):
+    history = PriceHistory(str(tmp_path / "history.db"))
+    samples = _samples(days=5)
+    history.append(samples)
+    history.append(samples[:10])  # duplicates are ignored
+
+    summary = history.summary("item", now=_NOW)
+    prices = [x[2] for x in samples]
+
+    assert summary.min_price == min(prices)
+    assert summary.max_price == max(prices)
+    assert abs(summary.avg_price - sum(prices) / len(prices)) < 1e-9
+    assert history.summary("unknown", now=_NOW) is None
+
+    history.close()
+
+
+def test_history_keeps_summary_after_downsampling(tmp_path):
+    history = PriceHistory(
+        str(tmp_path / "history.db"),
+        raw_retention=1,
+        hourly_retention=3,
+        daily_retention=10,
+    )
+    samples = _samples(days=20)
+    history.append(samples)
+    history.prune(now=_NOW)
+
+    # Samples past the daily retention are gone, everything else is rolled up
+    kept = [x[2] for x in samples if x[1] >= _NOW - 10 * _DAY]
+    summary = history.summary("item", now=_NOW)
+
+    assert summary.min_price == min(kept)
+    assert summary.max_price == max(kept)
+    assert abs(summary.avg_price - sum(kept) / len(kept)) < 1e-9
+
+    recent = [x[2] for x in samples if x[1] >= _NOW - 2 * _DAY]
+    summary = history.summary("item", since=_NOW - 2 * _DAY, now=_NOW)
+
+    assert summary.min_price == min(recent)
+    assert summary.max_price == max(recent)
+
+    history.close()
+
+
+def test_history_row():
+    item = ItemData(id="1", price=ItemPriceData(price=100, original_price=120))
+
+    assert PriceHistory.row("key", item, 10.5) == ("key", 10, 100.0, 120.0, 0)
+
+
+def test_history_skips_items_without_a_real_price(tmp_path):
+    history = PriceHistory(str(tmp_path / "history.db"))
+    items = [
+        ItemData(id="1", price=ItemPriceData(price=5000)),
+        ItemData(id="1", name="Deleted 1", status=ItemStatus.DELETED),
+        ItemData(id="1", price=ItemPriceData(price=0)),
+    ]
+    rows = [
+        PriceHistory.row("item", item, _NOW - 60 + i) for i, item in enumerate(items)
+    ]
+
+    assert rows[1:] == [None, None]
+
+    history.append([row for row in rows if row is not None])
+    summary = history.summary("item", now=_NOW)
+
+    assert (summary.min_price, summary.max_price, summary.avg_price) == (
+        5000,
+        5000,
+        5000,
+    )
+
+    history.close()
@@ -0,0 +1,67 @@
+import dataclasses
+
+import pytest
+
+from custom_components.price_tracker.datas.item import ItemData, ItemOptionData
+from custom_components.price_tracker.datas.price import ItemPriceData
+
+
+def test_item_has_no_instance_dict():
+    item = ItemData(id="1", price=ItemPriceData(price=100))
+
+    assert not hasattr(item, "__dict__")
+    assert not hasattr(item.price, "__dict__")
+    assert not hasattr(item.unit, "__dict__")
+
+
+def test_item_dict_is_cached_until_a_field_changes():
+    item = ItemData(
+        id="1",
+        price=ItemPriceData(price=100, original_price=120),
+        options=[ItemOptionData(id="a", name="A", price=100)],
+    )
+
+    data = item.dict
+    assert item.dict is data
+
+    item.name = "renamed"
+    assert item.dict is not data
+    assert item.dict["name"] == "renamed"
+
+    data = item.dict
+    item.price.price = 90
+    assert item.dict is not data
+    assert item.dict["price"] == 90
+
+    item.options[0].name = "B"
+    assert item.dict["product_options"][0]["name"] == "B"
+    assert item.dict["product_option_0_name"] == "B"
+
+
+def test_frozen_item_rejects_changes():
+    item = ItemData(
+        id="1",
+        price=ItemPriceData(price=100),
+        options=[ItemOptionData(id="a", name="A", price=100)],
+    ).freeze()
+
+    for target, field in [
+        (item, "name"),
+        (item.price, "price"),
+        (item.unit, "price"),
+        (item.options[0], "name"),
+    ]:
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(target, field, 1)
+
+    assert item.dict is item.dict
+
+
+def test_frozen_item_leaves_the_defaults_of_later_items_alone():
+    ItemData(id="1", name="Deleted 1").freeze()
+    item = ItemData(id="2")
+
+    item.price.price = 100
+    item.delivery.price = 3000
+
+    assert ItemData(id="3").price.price == 0.0
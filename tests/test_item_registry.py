@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.price_tracker.components.coordinator import (
+    PriceTrackerCoordinator,
+)
+from custom_components.price_tracker.components.engine import PriceEngine
+from custom_components.price_tracker.components.item_registry import (
+    PriceItemRegistry,
+    item_registry,
+)
+from custom_components.price_tracker.datas.item import ItemData
+
+
+class _CountingEngine(PriceEngine):
+    def __init__(self, id: str):
+        self.id = id
+        self.loads = 0
+
+    async def load(self) -> ItemData | None:
+        self.loads += 1
+        return ItemData(id=self.id)
+
+    @classmethod
+    async def load_many(cls, engines):
+        return [await engine.load() for engine in engines]
+
+    def id_str(self) -> str:
+        return self.id
+
+
+def test_registry_shares_engines_until_released():
+    registry = PriceItemRegistry()
+
+    first = registry.acquire(("fake", "1", None), lambda: _CountingEngine("1"))
+    second = registry.acquire(("fake", "1", None), lambda: _CountingEngine("1"))
+    other = registry.acquire(("fake", "1", "device"), lambda: _CountingEngine("1"))
+
+    assert first is second
+    assert first is not other
+    assert registry.size == 2
+
+    registry.release(first)
+    assert registry.size == 2
+    registry.release(second)
+    registry.release(other)
+    assert registry.size == 0
+
+
+async def test_published_items_fan_out_and_are_reused(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    registry = item_registry(hass)
+    engine = registry.acquire(("fake", "shared", None), lambda: _CountingEngine("x"))
+    results = {"a": [], "b": []}
+
+    coordinators = {
+        name: PriceTrackerCoordinator(hass, name, warmup_spread=0, registry=registry)
+        for name in results
+    }
+    coordinators["a"].async_subscribe(
+        key="item", engine=engine, refresh_period=30, listener=results["a"].append
+    )
+    coordinators["b"].async_subscribe(
+        key="item",
+        engine=engine,
+        refresh_period=30,
+        listener=results["b"].append,
+        due_at=datetime.now() + timedelta(minutes=30),
+    )
+
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    # Loaded by a, handed to b as well
+    assert engine.loads == 1
+    assert len(results["a"]) == 1
+    assert results["b"] == results["a"]
+
+    # b is due now, but a loaded the item moments ago
+    coordinators["b"].async_subscribe(
+        key="item", engine=engine, refresh_period=30, listener=results["b"].append
+    )
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    assert engine.loads == 1
+    assert len(results["b"]) == 2
+
+    for coordinator in coordinators.values():
+        await coordinator.async_shutdown()
+    await hass.async_stop(force=True)
@@ -1,4 +1,4 @@
-from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.list import JsonPath, Lu
 
 
 def test_array_access():
@@ -10,3 +10,26 @@ def test_array_access():
     result = Lu.find(test, "entity.viewType", "ACCESS_TARGET")
 
     assert result == test[1]
+
+
+def test_json_path_matches_get():
+    data = {"entity": {"title": [{"text": "a"}], "empty": None}, "1": "one"}
+
+    for path in ["entity.title.0.text", "entity.title.1.text", "entity.empty", "x.y"]:
+        assert JsonPath(path).get(data, "default") == Lu.get(data, path, "default")
+
+    assert JsonPath("entity.title.0.text").get(None, "default") == "default"
+    assert Lu.get(data, JsonPath("entity.title.0.text")) == "a"
+
+
+def test_index_keeps_first_item():
+    test = [
+        {"entity": {"viewType": "ACCESS"}, "n": 1},
+        {"entity": {"viewType": "ACCESS_TARGET"}, "n": 2},
+        {"entity": {"viewType": "ACCESS_TARGET"}, "n": 3},
+    ]
+
+    index = Lu.index(test, "entity.viewType")
+
+    assert index["ACCESS_TARGET"] == Lu.find(test, "entity.viewType", "ACCESS_TARGET")
+    assert index["ACCESS"]["n"] == 1
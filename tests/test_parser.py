@@ -0,0 +1,124 @@
+import json
+from functools import cached_property
+
+import pytest
+from bs4.builder import builder_registry
+
+from custom_components.price_tracker.components.parser import ItemParser
+from custom_components.price_tracker.services.oasis.parser import OasisParser
+from custom_components.price_tracker.utilities.parser import (
+    ScriptJsonExtractor,
+    html_strainer,
+    parse_html,
+    set_html_backend,
+)
+
+_MARKER = "window.__PRELOADED_STATE__="
+_STATE = {"product": {"A": {"id": "1", "name": "</scrip", "price": 1000}}}
+_HTML = (
+    "<html><head><script>var a = 1;</script></head><body>"
+    "<script>{}{};</script>"
+    "<div>{}</div></body></html>".format(_MARKER, json.dumps(_STATE), "x" * 1000)
+)
+
+
+def test_extract_from_text():
+    assert ScriptJsonExtractor.extract(_HTML, _MARKER) == _STATE
+    assert ScriptJsonExtractor.extract("<html></html>", _MARKER) is None
+
+
+def test_prefix_ends_with_the_state_script():
+    prefix = ScriptJsonExtractor.prefix(_HTML, _MARKER)
+
+    assert prefix.endswith(json.dumps(_STATE) + ";")
+    # Whatever was streamed after the script does not change it
+    assert ScriptJsonExtractor.prefix(_HTML[: len(prefix) + 12], _MARKER) == prefix
+    assert ScriptJsonExtractor.prefix(_HTML[: len(prefix) - 1], _MARKER) is None
+
+
+def test_feed_stops_after_closing_script():
+    extractor = ScriptJsonExtractor(_MARKER)
+    read = 0
+
+    # Tiny chunks so the marker and the closing tag are split across feeds
+    for i in range(0, len(_HTML), 7):
+        read = i + 7
+        if extractor.feed(_HTML[i : i + 7]):
+            break
+
+    assert extractor.done
+    assert read < len(_HTML)
+    assert extractor.value() == _STATE
+
+
+_OASIS_HTML = """<html><body><div class="row"><h1>Noise</h1></div>
+<div class="oDetail_info_group_title"><h1> Apple </h1></div>
+<div class="oDetail_info_group_price extra"><div class="discountPrice">9,900원</div>
+<div class="cost">12,000원</div></div>
+<ul><li class="swiper-slide"><img src="https://example.com/a.jpg"/></li></ul>
+</body></html>"""
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+def test_parsers_match_on_every_backend(backend):
+    if builder_registry.lookup(backend) is None:
+        pytest.skip("{} is not installed".format(backend))
+
+    set_html_backend(backend)
+    try:
+        parser = OasisParser(_OASIS_HTML)
+
+        assert parser.name == "Apple"
+        assert parser.price.price == 9900
+        assert parser.price.original_price == 12000
+        assert parser.image == "https://example.com/a.jpg"
+        assert parser.brand is None
+    finally:
+        set_html_backend(None)
+
+
+def test_strainer_keeps_only_requested_subtrees():
+    soup = parse_html(
+        _OASIS_HTML,
+        backend="html.parser",
+        parse_only=html_strainer(classes=("oDetail_info_group_price",)),
+    )
+
+    assert soup.find("h1") is None
+    assert soup.find("div", class_="cost").get_text() == "12,000원"
+
+
+class _CountingParser(ItemParser):
+    def __init__(self, text: str, calls: list):
+        self._data = json.loads(text)
+        self._calls = calls
+
+    @cached_property
+    def price(self):
+        self._calls.append("price")
+        return sum(self._data["benefits"])
+
+    @cached_property
+    def unit(self):
+        return self.price / 2
+
+    @cached_property
+    def brand(self):
+        return self._data["brand"]
+
+
+def test_extract_runs_each_field_once_and_drops_raw_data():
+    calls = []
+    parser = _CountingParser('{"benefits": [100, 200]}', calls)
+    result = parser.extract()
+
+    assert result.price == 300
+    assert result.unit == 150
+    assert calls == ["price"]
+    assert not hasattr(parser, "_data")
+
+    # Failures surface when the field is read, like they did on the parser
+    with pytest.raises(KeyError):
+        _ = result.brand
+    with pytest.raises(AttributeError):
+        result.price = 0
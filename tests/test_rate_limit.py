@@ -0,0 +1,32 @@
+import pytest
+
+from custom_components.price_tracker.utilities.rate_limit import (
+    RateLimiterRegistry,
+    TokenBucket,
+)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst_then_wait():
+    bucket = TokenBucket(rate=20, burst=2)
+
+    assert await bucket.acquire() == pytest.approx(0, abs=0.01)
+    assert await bucket.acquire() == pytest.approx(0, abs=0.01)
+    assert await bucket.acquire() >= 0.04
+
+    assert bucket.metrics["acquired"] == 3
+    assert bucket.metrics["queue_depth"] == 0
+    assert bucket.metrics["max_wait"] >= 0.04
+
+
+def test_rate_limiter_registry():
+    registry = RateLimiterRegistry(limits={"store": (1, 2)}, default=(5, 10))
+
+    assert registry.get("store").rate == 1
+    assert registry.get("example.com").burst == 10
+    assert registry.get("store") is registry.get("store")
+
+    registry.configure("store", 3, 6)
+
+    assert registry.get("store").rate == 3
+    assert set(registry.metrics().keys()) == {"store", "example.com"}
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from custom_components.price_tracker.services.factory import create_service_engine
+from custom_components.price_tracker.utilities.replay import (
+    SafeRequestEngineRecorder,
+    SafeRequestEngineReplay,
+    SafeRequestRecording,
+    load_recordings,
+)
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequest,
+    SafeRequestMethod,
+    SafeRequestStatusError,
+    set_default_chains,
+)
+
+_CORPUS = os.path.join(os.path.dirname(__file__), "fixtures", "engines")
+
+
+@pytest.fixture
+def replay():
+    def _replay(recordings):
+        set_default_chains(lambda: [SafeRequestEngineReplay(recordings)])
+
+    yield _replay
+    set_default_chains(None)
+
+
+@pytest.mark.parametrize("code", sorted(os.listdir(_CORPUS)))
+async def test_engine_loads_recorded_item(replay, code):
+    manifest, recordings = load_recordings(os.path.join(_CORPUS, code))
+    replay(recordings)
+
+    engine = create_service_engine(code)(
+        item_url=manifest["item_url"],
+        proxies=None,
+        device=None,
+        selenium=None,
+        selenium_proxy=None,
+    )
+    item = await engine.load()
+
+    assert item is not None
+    assert item.name == manifest["expect"]["name"]
+    assert item.price.price == manifest["expect"]["price"]
+
+
+async def test_missing_recording_is_not_retried(replay):
+    replay([SafeRequestRecording("GET", r"https://example\.com/a", body="a")])
+    request = SafeRequest()
+
+    assert (await request.request(url="https://example.com/a")).data == "a"
+    with pytest.raises(SafeRequestStatusError) as e:
+        await request.request(url="https://example.com/b", raise_errors=True)
+    assert e.value.status_code == 501
+
+
+async def test_recorder_writes_replayable_corpus(replay, tmp_path):
+    engine = SafeRequestEngineReplay(
+        [SafeRequestRecording("POST", r".*", body='{"a": 1}', headers={"ETag": "1"})]
+    )
+    set_default_chains(
+        lambda: [SafeRequestEngineRecorder(engine, str(tmp_path / "corpus"))]
+    )
+    await SafeRequest().request(
+        method=SafeRequestMethod.POST, url="https://example.org/?q=1"
+    )
+
+    _, recordings = load_recordings(str(tmp_path / "corpus"))
+    replay(recordings)
+    response = await SafeRequest().request(
+        method=SafeRequestMethod.POST, url="https://example.org/?q=1"
+    )
+
+    assert response.data == '{"a": 1}'
+    assert response.etag == "1"
@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+from custom_components.price_tracker.utilities import safe_request
+from custom_components.price_tracker.utilities.rate_limit import RateLimiterRegistry
+from custom_components.price_tracker.utilities.retry import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    SafeRequestBackoffRetryPolicy,
+    parse_retry_after,
+)
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequest,
+    SafeRequestEngine,
+    SafeRequestStatusError,
+)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int, retry_after: float = None):
+        super().__init__(status_code)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def test_backoff_retry_policy():
+    policy = SafeRequestBackoffRetryPolicy(base=1, factor=2, max_delay=4, jitter=False)
+
+    assert policy.should_retry(TimeoutError(), 0)
+    assert policy.should_retry(_StatusError(503), 0)
+    assert not policy.should_retry(_StatusError(403), 0)
+    assert not policy.should_retry(_StatusError(429, retry_after=3600), 0)
+    assert policy.delay(_StatusError(503), 0) == 1
+    assert policy.delay(_StatusError(503), 5) == 4
+    assert policy.delay(_StatusError(429, retry_after=2), 0) == 2
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_circuit_breaker():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+
+class _AnswerEngine(SafeRequestEngine):
+    def __init__(self, status_code: int = None, delay: float = 0):
+        self._status_code = status_code
+        self._delay = delay
+
+    async def request(self, *args, **kwargs):
+        await asyncio.sleep(self._delay)
+        raise SafeRequestStatusError("failed", status_code=self._status_code)
+
+
+def _half_open(monkeypatch) -> CircuitBreaker:
+    breakers = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=0)
+    monkeypatch.setattr(safe_request, "circuit_breakers", lambda: breakers)
+    unlimited = RateLimiterRegistry(limits={}, default=(0.0, 1))
+    monkeypatch.setattr(safe_request, "rate_limiters", lambda: unlimited)
+
+    breaker = breakers.get("https://probe.example.com/")
+    breaker.record_failure()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    return breaker
+
+
+async def test_probe_answered_by_the_store_closes_the_circuit(monkeypatch):
+    breaker = _half_open(monkeypatch)
+
+    await SafeRequest(chains=[_AnswerEngine(401)]).request(
+        url="https://probe.example.com/", max_tries=1
+    )
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+
+async def test_cancelled_probe_lets_the_next_request_probe(monkeypatch):
+    breaker = _half_open(monkeypatch)
+
+    task = asyncio.ensure_future(
+        SafeRequest(chains=[_AnswerEngine(delay=10)]).request(
+            url="https://probe.example.com/", max_tries=1
+        )
+    )
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow()
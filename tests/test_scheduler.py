@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from custom_components.price_tracker.components.scheduler import (
+    FetchScheduler,
+    FetchSchedulerOrdering,
+)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_caps_in_flight():
+    scheduler = FetchScheduler(max_in_flight=3, max_per_store=2, store_limits={})
+    peak = {"all": 0, "a": 0}
+    running = {"all": 0, "a": 0}
+
+    async def job(store: str):
+        running["all"] += 1
+        running[store] = running.get(store, 0) + 1
+        peak["all"] = max(peak["all"], running["all"])
+        peak[store] = max(peak.get(store, 0), running[store])
+        await asyncio.sleep(0.01)
+        running["all"] -= 1
+        running[store] -= 1
+
+    await asyncio.gather(
+        *[scheduler.run("a", lambda: job("a")) for _ in range(5)],
+        *[scheduler.run("b", lambda: job("b")) for _ in range(5)],
+    )
+
+    assert peak["all"] == 3
+    assert peak["a"] == 2
+    assert scheduler.metrics["completed"] == 10
+    assert scheduler.metrics["in_flight"] == 0
+    assert scheduler.metrics["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_priority_ordering():
+    scheduler = FetchScheduler(
+        max_in_flight=1, ordering=FetchSchedulerOrdering.PRIORITY, store_limits={}
+    )
+    order = []
+
+    async def job(name: str):
+        order.append(name)
+        await asyncio.sleep(0)
+
+    await asyncio.gather(
+        scheduler.run("a", lambda: job("first")),
+        scheduler.run("a", lambda: job("low"), priority=5),
+        scheduler.run("a", lambda: job("high"), priority=1),
+    )
+
+    assert order == ["first", "high", "low"]
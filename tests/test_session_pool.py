@@ -0,0 +1,71 @@
+import asyncio
+import threading
+
+import pytest
+
+from custom_components.price_tracker.utilities.session_pool import (
+    SafeRequestSessionPool,
+)
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reuse():
+    pool = SafeRequestSessionPool()
+
+    async with pool.session(impersonate="chrome124") as first:
+        pass
+    async with pool.session(impersonate="chrome124") as second:
+        pass
+    async with pool.session(impersonate="chrome124", proxy="http://proxy:1") as third:
+        pass
+
+    assert first is second
+    assert first is not third
+    assert pool.size == 2
+
+    await pool.close()
+
+    assert pool.size == 0
+
+
+@pytest.mark.asyncio
+async def test_session_pool_idle_eviction():
+    pool = SafeRequestSessionPool(idle_timeout=-1)
+
+    async with pool.session(impersonate="chrome124") as first:
+        pass
+    async with pool.session(impersonate="chrome124") as second:
+        pass
+
+    assert first is not second
+    assert pool.size == 1
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_session_of_another_loop_is_closed_on_its_loop():
+    pool = SafeRequestSessionPool()
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+
+    async def _borrow():
+        async with pool.session(impersonate="chrome124") as session:
+            return session
+
+    stale = asyncio.run_coroutine_threadsafe(_borrow(), other).result(5)
+
+    async with pool.session(impersonate="chrome124") as fresh:
+        pass
+
+    await asyncio.sleep(0.3)
+    other.call_soon_threadsafe(other.stop)
+    thread.join(5)
+    other.close()
+
+    assert fresh is not stale
+    assert stale._closed
+    assert pool.size == 1
+
+    await pool.close()
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+from custom_components.price_tracker.components.setup import PriceTrackerSetup
+from custom_components.price_tracker.consts.confs import (
+    CONF_RESTORE_MAX_AGE,
+    CONF_TELEMETRY,
+    CONF_UPDATED_AT_HEARTBEAT,
+    CONF_WARMUP_SPREAD,
+)
+
+
+class _OptionFlow:
+    def __init__(self, entry):
+        self.updates = []
+        self.hass = SimpleNamespace(
+            config_entries=SimpleNamespace(async_update_entry=self._update)
+        )
+        self._entry = entry
+
+    def _update(self, entry, data, options):
+        self.updates.append((data, options))
+        return True
+
+    def async_abort(self, reason):
+        return {"type": "abort", "reason": reason}
+
+
+async def test_advanced_options_are_kept_in_the_entry_data():
+    entry = SimpleNamespace(
+        data={"type": "kurly", "proxy": ["http://proxy:1"]}, options={"target": []}
+    )
+    flow = _OptionFlow(entry)
+    setup = PriceTrackerSetup(option_flow=flow, config_entry=entry)
+
+    result = await setup.option_advanced(
+        {
+            setup.const_option_setup_select: setup.const_option_advanced_select,
+            CONF_RESTORE_MAX_AGE: 60,
+            CONF_WARMUP_SPREAD: 2.5,
+            CONF_UPDATED_AT_HEARTBEAT: False,
+            CONF_TELEMETRY: True,
+        }
+    )
+
+    assert result["reason"] == "advanced_updated"
+    assert flow.updates == [
+        (
+            {
+                "type": "kurly",
+                "proxy": ["http://proxy:1"],
+                CONF_RESTORE_MAX_AGE: 60,
+                CONF_WARMUP_SPREAD: 2.5,
+                CONF_UPDATED_AT_HEARTBEAT: False,
+                CONF_TELEMETRY: True,
+            },
+            {"target": []},
+        )
+    ]
@@ -0,0 +1,169 @@
+import asyncio
+import base64
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.price_tracker.services.kurly import engine as kurly
+from custom_components.price_tracker.services.kurly.engine import KurlyEngine
+from custom_components.price_tracker.utilities.replay import (
+    SafeRequestEngineReplay,
+    SafeRequestRecording,
+    load_recordings,
+)
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequestMethod,
+    SafeRequestStatusError,
+    set_default_chains,
+)
+from custom_components.price_tracker.utilities import token_cache
+from custom_components.price_tracker.utilities.token_cache import (
+    AccessTokenCache,
+    jwt_expires_in,
+)
+
+_KURLY = os.path.join(os.path.dirname(__file__), "fixtures", "engines", "kurly")
+
+
+class _CountingReplay(SafeRequestEngineReplay):
+    def __init__(self, recordings):
+        super().__init__(recordings)
+        self.calls: list[tuple[SafeRequestMethod, str]] = []
+
+    async def request(self, method, url, *args, **kwargs):
+        self.calls.append((method, url))
+        return await super().request(method, url, *args, **kwargs)
+
+
+@pytest.fixture
+def kurly_tokens(monkeypatch):
+    tokens = AccessTokenCache()
+    monkeypatch.setattr(kurly, "_GUEST_TOKENS", tokens)
+    yield tokens
+    set_default_chains(None)
+
+
+def _replay(recordings) -> _CountingReplay:
+    engine = _CountingReplay(recordings)
+    set_default_chains(lambda: [engine])
+    return engine
+
+
+def _kurly(item_id: str) -> KurlyEngine:
+    return KurlyEngine(item_url="https://www.kurly.com/goods/{}".format(item_id))
+
+
+async def test_concurrent_callers_share_one_refresh():
+    cache = AccessTokenCache()
+    fetches = []
+
+    async def _fetch():
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        return "token-{}".format(len(fetches)), 3600
+
+    tokens = await asyncio.gather(*[cache.get(_fetch) for _ in range(10)])
+
+    assert tokens == ["token-1"] * 10
+    assert len(fetches) == 1
+
+
+async def test_token_is_refreshed_before_expiry_and_after_invalidation(monkeypatch):
+    cache = AccessTokenCache(refresh_margin=60)
+    fetches = []
+    now = time.monotonic()
+    monkeypatch.setattr(token_cache, "time", SimpleNamespace(monotonic=lambda: now))
+
+    async def _fetch():
+        fetches.append(1)
+        return "token-{}".format(len(fetches)), 3600
+
+    assert await cache.get(_fetch) == "token-1"
+    now += 3600 - 61
+    assert await cache.get(_fetch) == "token-1"
+    now += 2
+    assert await cache.get(_fetch) == "token-2"
+
+    cache = AccessTokenCache(default_ttl=3600)
+
+    async def _fetch_without_expiry():
+        fetches.append(1)
+        return "token-{}".format(len(fetches)), None
+
+    token = await cache.get(_fetch_without_expiry)
+    assert await cache.get(_fetch_without_expiry) == token
+
+    cache.invalidate("another-token")
+    assert cache.token == token
+    cache.invalidate(token)
+    assert cache.token is None
+    assert await cache.get(_fetch_without_expiry) != token
+
+
+async def test_short_lived_token_is_reused_for_most_of_its_lifetime(monkeypatch):
+    cache = AccessTokenCache(refresh_margin=60)
+    fetches = []
+    now = time.monotonic()
+    monkeypatch.setattr(token_cache, "time", SimpleNamespace(monotonic=lambda: now))
+
+    async def _fetch():
+        fetches.append(1)
+        return "token-{}".format(len(fetches)), 30
+
+    # Shorter than the margin, refreshed after three quarters of it instead
+    assert await cache.get(_fetch) == "token-1"
+    now += 20
+    assert await cache.get(_fetch) == "token-1"
+    now += 3
+    assert await cache.get(_fetch) == "token-2"
+    assert len(fetches) == 2
+
+
+def test_jwt_expires_in():
+    claims = base64.urlsafe_b64encode(
+        json.dumps({"exp": int(time.time()) + 600}).encode()
+    ).rstrip(b"=")
+
+    assert 590 < jwt_expires_in("e30." + claims.decode() + ".sig") <= 600
+    assert jwt_expires_in("guest-token") is None
+
+
+async def test_kurly_items_share_the_guest_token(kurly_tokens):
+    manifest, recordings = load_recordings(_KURLY)
+    engine = _replay(
+        recordings
+        + [
+            SafeRequestRecording(
+                "GET",
+                r"https://api\.kurly\.com/showroom/v2/products/\d+",
+                body=recordings[1].body,
+            )
+        ]
+    )
+
+    await _kurly(manifest["id"]).load()
+    await KurlyEngine.load_many([_kurly(str(x)) for x in range(5)])
+
+    assert [x[1] for x in engine.calls].count(kurly._AUTH_URL) == 1
+    assert len(engine.calls) == 7
+
+
+async def test_kurly_reauthorizes_once_on_401(kurly_tokens):
+    manifest, recordings = load_recordings(_KURLY)
+    engine = _replay(
+        [
+            recordings[0],
+            SafeRequestRecording(
+                "GET", r"https://api\.kurly\.com/showroom/.*", status_code=401
+            ),
+        ]
+    )
+
+    with pytest.raises(SafeRequestStatusError):
+        await _kurly(manifest["id"]).load()
+
+    assert [x[1] for x in engine.calls].count(kurly._AUTH_URL) == 2
+    assert kurly_tokens.metrics["invalidations"] == 1
@@ -0,0 +1,15 @@
+import pytest
+
+from custom_components.price_tracker.utilities.user_agent import UserAgentProvider
+
+
+@pytest.mark.asyncio
+async def test_user_agent_pool():
+    provider = UserAgentProvider()
+
+    ua = await provider.async_random(["pc", "mobile"])
+
+    assert provider.loaded
+    assert ua in provider.pool(["mobile", "pc"])
+    assert provider.pool(["pc", "mobile"]) is provider.pool(["mobile", "pc"])
+    assert provider.served == 1